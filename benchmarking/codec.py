@@ -0,0 +1,70 @@
+"""`pickle` against `encode_response` and `decode_response`, for size and
+latency.
+
+Run from the repository root with `python -m benchmarking.codec`.
+"""
+import pickle
+from typing import List
+
+import numpy as np
+
+from benchmarking.timing import best_time, format_time
+from paitypes.estimation.DetectedObject import DetectedObject, Label
+from paitypes.estimation.InferenceResponse import InferenceResponse
+from paitypes.estimation.codec import (DecodedResponse, decode_response,
+                                       encode_response)
+from paitypes.estimation.pose import BodyPart, Human
+from paitypes.geometry.bounding_box import BoundingBox
+
+# Images per response, and humans and detections per image
+SIZES = ((1, 1), (8, 10), (32, 20))
+
+
+def synthetic_humans(n: int, rng: np.random.RandomState) -> List[Human]:
+    humans = []
+    for _ in range(n):
+        human = Human([])
+        for part_idx in np.flatnonzero(rng.uniform(size=18) < 0.8).tolist():
+            uidx = '%d-%d' % (part_idx, rng.randint(20))
+            x, y, score = rng.uniform(size=3).tolist()
+            human.body_parts[part_idx] = BodyPart(uidx, part_idx, x, y,
+                                                  score)
+            human.uidx_list.add(uidx)
+        humans.append(human)
+    return humans
+
+
+def synthetic_detections(n: int, rng: np.random.RandomState
+                         ) -> List[DetectedObject]:
+    return [DetectedObject(ID=i,
+                           bounding_box=BoundingBox(x, x + 50, y, y + 100),
+                           label=Label.HUMAN,
+                           confidence=confidence)
+            for i, (x, y, confidence)
+            in enumerate(rng.uniform(size=(n, 3)).tolist())]
+
+
+def main() -> None:
+    rng = np.random.RandomState(0)
+    print('{:>9} | {:>9} {:>9} | {:>11} {:>11} | {:>11} {:>11} {:>11}'
+          .format('B x N', 'pickle', 'codec', 'dumps', 'encode', 'loads',
+                  'decode', 'views'))
+    for n_images, n in SIZES:
+        response = InferenceResponse(
+            pose_estimation_results=[synthetic_humans(n, rng)
+                                     for _ in range(n_images)],
+            object_detections_results=[synthetic_detections(n, rng)
+                                       for _ in range(n_images)])
+        pickled = pickle.dumps(response)
+        encoded = encode_response(response)
+        print('{:>9} | {:>9} {:>9} | {} {} | {} {} {}'.format(
+            f'{n_images} x {n}', len(pickled), len(encoded),
+            format_time(best_time(lambda: pickle.dumps(response))),
+            format_time(best_time(lambda: encode_response(response))),
+            format_time(best_time(lambda: pickle.loads(pickled))),
+            format_time(best_time(lambda: decode_response(encoded))),
+            format_time(best_time(lambda: DecodedResponse(encoded)))))
+
+
+if __name__ == '__main__':
+    main()
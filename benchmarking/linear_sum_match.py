@@ -0,0 +1,90 @@
+"""Per-pair against vectorized cost matrices in `linear_sum_match`.
+
+Run from the repository root with `python -m benchmarking.linear_sum_match`.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+from benchmarking.timing import best_time, format_time
+from paitypes.common.optimization import (linear_sum_match,
+                                          center_distance_cost, iou_cost,
+                                          sparse_iou_cost)
+from paitypes.geometry.bounding_box import BoundingBox, BoundingBoxArray
+from paitypes.geometry.bounding_box.BoundingBox import get_iou
+
+SIZES = (1, 2, 3, 5, 10, 20, 50, 100, 200)
+SCENE_SIZES = (100, 300, 1000, 2000, 5000)
+
+
+def random_bboxes(n: int, rng: np.random.RandomState) -> List[BoundingBox]:
+    x = rng.uniform(0.0, 1920.0, n)
+    y = rng.uniform(0.0, 1080.0, n)
+    w = rng.uniform(20.0, 300.0, n)
+    h = rng.uniform(20.0, 300.0, n)
+    return [BoundingBox(*row) for row in
+            np.stack([x, x + w, y, y + h], axis=1).tolist()]
+
+
+def main() -> None:
+    rng = np.random.RandomState(0)
+
+    def one_minus_iou(a: BoundingBox, b: BoundingBox) -> float:
+        return 1.0 - get_iou(a, b)
+
+    metrics = [('center distance', BoundingBox.distance, center_distance_cost),
+               ('1 - IoU', one_minus_iou, iou_cost)]
+    for name, scalar_metric, vectorized_metric in metrics:
+        print('{:>16} | {:>4} | {:>11} {:>11} {:>11} {:>11}'.format(
+            name, 'N', 'per pair', 'vectorized', 'from array', 'speedup'))
+        for n in SIZES:
+            bboxes1, bboxes2 = random_bboxes(n, rng), random_bboxes(n, rng)
+            array1 = BoundingBoxArray.from_bboxes(bboxes1)
+            array2 = BoundingBoxArray.from_bboxes(bboxes2)
+
+            t_scalar = best_time(lambda: linear_sum_match(
+                bboxes1, bboxes2, scalar_metric))
+            t_vectorized = best_time(lambda: linear_sum_match(
+                bboxes1, bboxes2, vectorized_metric, vectorized=True))
+            t_array = best_time(lambda: linear_sum_match(
+                array1, array2, vectorized_metric, vectorized=True))
+            print('{:>16} | {:>4} | {} {} {} {:>10.1f}x'.format(
+                '', n, format_time(t_scalar), format_time(t_vectorized),
+                format_time(t_array), t_scalar / t_vectorized))
+
+
+def busy_scene(n: int, rng: np.random.RandomState
+               ) -> Tuple[BoundingBoxArray, BoundingBoxArray]:
+    """`n` boxes on a canvas growing with `n`, and the same boxes moved a
+    little, as in two consecutive frames of a crowded scene.
+    """
+    side = 200.0 * np.sqrt(n)
+    x, y = rng.uniform(0.0, side, n), rng.uniform(0.0, side, n)
+    w, h = rng.uniform(40.0, 80.0, n), rng.uniform(80.0, 160.0, n)
+    before = np.stack([x, x + w, y, y + h], axis=1)
+    after = before + rng.normal(0.0, 5.0, (n, 1))
+    return BoundingBoxArray(before), BoundingBoxArray(after)
+
+
+def main_gated() -> None:
+    rng = np.random.RandomState(0)
+    print('{:>16} | {:>4} | {:>11} {:>11} {:>11} {:>11}'.format(
+        'IoU >= 0.1', 'N', 'dense', 'gated', 'sparse', 'speedup'))
+    for n in SCENE_SIZES:
+        before, after = busy_scene(n, rng)
+        t_dense = best_time(lambda: linear_sum_match(
+            before, after, iou_cost, vectorized=True), repeat=3)
+        t_gated = best_time(lambda: linear_sum_match(
+            before, after, iou_cost, vectorized=True, max_cost=0.9),
+            repeat=3)
+        t_sparse = best_time(lambda: linear_sum_match(
+            before, after, sparse_iou_cost, vectorized=True, max_cost=0.9),
+            repeat=3)
+        print('{:>16} | {:>4} | {} {} {} {:>10.1f}x'.format(
+            '', n, format_time(t_dense), format_time(t_gated),
+            format_time(t_sparse), t_dense / t_sparse))
+
+
+if __name__ == '__main__':
+    main()
+    main_gated()
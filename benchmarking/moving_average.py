@@ -0,0 +1,38 @@
+"""List against NumPy array `moving_average` and `moving_window`.
+
+Run from the repository root with `python -m benchmarking.moving_average`.
+"""
+import numpy as np
+
+from benchmarking.timing import best_time, format_time
+from paitypes.common.sequence import moving_average, moving_window
+
+SIZES = (100, 1000, 10000)
+WINDOW_SIZE = 30
+
+
+def main() -> None:
+    rng = np.random.RandomState(0)
+    print('{:>14} | {:>6} | {:>11} {:>11} {:>11}'.format(
+        '', 'N', 'list', 'array', 'speedup'))
+    for n in SIZES:
+        signal = rng.normal(0.0, 1.0, n)
+        values = signal.tolist()
+        cases = [
+            ('moving_average',
+             lambda: moving_average(values, WINDOW_SIZE),
+             lambda: moving_average(signal, WINDOW_SIZE)),
+            ('np.median',
+             lambda: moving_window(np.median, values, WINDOW_SIZE),
+             lambda: moving_window(np.median, signal, WINDOW_SIZE)),
+        ]
+        for name, list_f, array_f in cases:
+            t_list = best_time(list_f, repeat=3)
+            t_array = best_time(array_f, repeat=3)
+            print('{:>14} | {:>6} | {} {} {:>10.1f}x'.format(
+                name, n, format_time(t_list), format_time(t_array),
+                t_list / t_array))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""The tf-pose merge loop against `assemble_humans`.
+
+Run from the repository root with `python -m benchmarking.pose_assembly`.
+"""
+import itertools
+from typing import List
+
+import numpy as np
+
+from benchmarking.timing import best_time, format_time
+from paitypes.estimation.pose import Human, Pair
+from paitypes.estimation.pose_assembly import (assemble_humans,
+                                               pairs_to_arrays)
+
+SIZES = (1, 5, 10, 100, 1000)
+# Only time the O(E³) merge loop up to this many humans
+MAX_MERGE_SIZE = 10
+# The limbs of the COCO skeleton, as `CocoPart` values
+LIMBS = [(17, 6), (17, 5), (6, 8), (8, 10), (5, 7), (7, 9), (17, 12),
+         (12, 14), (14, 16), (17, 11), (11, 13), (13, 15), (17, 0), (0, 2),
+         (2, 4), (0, 1), (1, 3)]
+
+
+def synthetic_pairs(n: int, rng: np.random.RandomState) -> List[Pair]:
+    """The limbs of `n` complete skeletons, in random order."""
+    pairs = [Pair(human, human, part_idx1, part_idx2,
+                  tuple(rng.uniform(size=2).tolist()),
+                  tuple(rng.uniform(size=2).tolist()),
+                  float(rng.uniform()))
+             for human in range(n) for part_idx1, part_idx2 in LIMBS]
+    return [pairs[i] for i in rng.permutation(len(pairs)).tolist()]
+
+
+def merge_humans(pairs: List[Pair]) -> List[Human]:
+    humans = [Human([pair]) for pair in pairs]
+    while True:
+        merge_items = None
+        for k1, k2 in itertools.combinations(humans, 2):
+            if k1.is_connected(k2):
+                merge_items = (k1, k2)
+                break
+        if merge_items is None:
+            return humans
+        merge_items[0].merge(merge_items[1])
+        humans.remove(merge_items[1])
+
+
+def main() -> None:
+    rng = np.random.RandomState(0)
+    print('{:>5} | {:>11} {:>11}'.format('N', 'merge', 'arrays'))
+    for n in SIZES:
+        pairs = synthetic_pairs(n, rng)
+        arrays = pairs_to_arrays(pairs)
+        t_merge = ('{:>11}'.format('-') if n > MAX_MERGE_SIZE else
+                   format_time(best_time(lambda: merge_humans(pairs),
+                                         repeat=1)))
+        t_arrays = best_time(lambda: assemble_humans(*arrays), repeat=3)
+        print('{:>5} | {} {}'.format(n, t_merge, format_time(t_arrays)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Spatial index queries against brute-force `BoundingBox` loops.
+
+Run from the repository root with `python -m benchmarking.spatial_index`.
+"""
+from typing import List
+
+import numpy as np
+
+from benchmarking.timing import best_time, format_time
+from paitypes.geometry.Point import Point
+from paitypes.geometry.bounding_box import BoundingBox, BoundingBoxIndex
+
+N_POINTS = 100
+IMAGE_SIZE = 1920.0
+
+
+def random_bboxes(n: int, rng: np.random.RandomState) -> List[BoundingBox]:
+    x = rng.uniform(0.0, IMAGE_SIZE, n)
+    y = rng.uniform(0.0, IMAGE_SIZE, n)
+    w = rng.uniform(5.0, 200.0, n)
+    h = rng.uniform(5.0, 200.0, n)
+    return [BoundingBox(*row) for row in
+            np.stack([x, x + w, y, y + h], axis=1).tolist()]
+
+
+def main() -> None:
+    rng = np.random.RandomState(0)
+    points_array = rng.uniform(0.0, IMAGE_SIZE, (N_POINTS, 2))
+    points = [Point(x, y) for x, y in points_array.tolist()]
+    container = BoundingBox(400.0, 800.0, 400.0, 800.0)
+
+    print('{:>6} | {:>24} | {:>11} {:>11} {:>11}'.format(
+        'boxes', 'query', 'brute force', 'index', 'speedup'))
+    for n in (10, 100, 10000):
+        bboxes = random_bboxes(n, rng)
+        index = BoundingBoxIndex(bboxes)
+
+        cases = [
+            ('{} points enclosed'.format(N_POINTS),
+             lambda: [[b for b in bboxes if b.encloses(p)] for p in points],
+             lambda: [index.enclosing(p) for p in points]),
+            ('{} points, bulk'.format(N_POINTS),
+             lambda: [[b for b in bboxes if b.encloses(p)] for p in points],
+             lambda: index.enclosing_many(points_array)),
+            ('boxes inside container',
+             lambda: [b for b in bboxes if b.is_inside(container)],
+             lambda: index.inside(container)),
+        ]
+        for name, brute_force, indexed in cases:
+            t_brute_force = best_time(brute_force, repeat=3)
+            t_indexed = best_time(indexed, repeat=3)
+            print('{:>6} | {:>24} | {} {} {:>10.1f}x'.format(
+                n, name, format_time(t_brute_force), format_time(t_indexed),
+                t_brute_force / t_indexed))
+        print('{:>6} | {:>24} | {:>11} {}'.format(
+            n, 'build index', '',
+            format_time(best_time(lambda: BoundingBoxIndex(bboxes),
+                                  repeat=3))))
+
+
+if __name__ == '__main__':
+    main()
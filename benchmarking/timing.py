@@ -0,0 +1,22 @@
+import timeit
+from typing import Callable
+
+
+def best_time(f: Callable[[], object], repeat: int = 5) -> float:
+    """Best wall time of a single `f()` call, in seconds.
+
+    Runs enough calls per repetition for the measurement to take at least
+    0.05s, then takes the fastest of `repeat` repetitions.
+    """
+    timer = timeit.Timer(f)
+    number = 1
+    while timer.timeit(number) < 0.05 and number < 10 ** 6:
+        number *= 10
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return '{:8.2f} {}'.format(seconds / scale, unit)
+    return '{:8.2f} ns'.format(seconds / 1e-9)
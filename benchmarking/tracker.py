@@ -0,0 +1,85 @@
+"""Replay synthetic trajectories through `Tracker`.
+
+Run from the repository root with `python -m benchmarking.tracker`.
+"""
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from benchmarking.timing import format_time
+from paitypes.estimation.DetectedObject import DetectedObject, Label
+from paitypes.estimation.tracking import Tracker
+from paitypes.geometry.bounding_box import BoundingBox
+
+SIZES = (10, 100, 1000, 3000)
+FRAMES = 100
+
+
+def synthetic_frames(n: int, rng: np.random.RandomState
+                     ) -> List[Tuple[List[int], List[DetectedObject]]]:
+    """`FRAMES` frames of about `n` objects moving with constant velocity.
+
+    Objects are missed by the detector 5% of the time, and are replaced by a
+    new object 1% of the time. Returns the object of every detection as well.
+    """
+    side = 200.0 * np.sqrt(n)
+    position = rng.uniform(0.0, side, (n, 2))
+    velocity = rng.normal(0.0, 3.0, (n, 2))
+    size = np.stack([rng.uniform(30.0, 50.0, n),
+                     rng.uniform(60.0, 100.0, n)], axis=1)
+    objects = np.arange(n)
+    next_object = n
+
+    frames = []
+    for _ in range(FRAMES):
+        reborn = rng.uniform(size=n) < 0.01
+        position[reborn] = rng.uniform(0.0, side, (reborn.sum(), 2))
+        objects[reborn] = np.arange(next_object, next_object + reborn.sum())
+        next_object += reborn.sum()
+        position += velocity
+
+        seen = np.flatnonzero(rng.uniform(size=n) >= 0.05)
+        corner = position[seen] + rng.normal(0.0, 1.0, (len(seen), 2))
+        boxes = np.concatenate([corner, corner + size[seen]], axis=1)
+        frames.append(
+            (objects[seen].tolist(),
+             [DetectedObject(ID=-1,
+                             bounding_box=BoundingBox(x0, x1, y0, y1),
+                             label=Label.HUMAN,
+                             confidence=1.0)
+              for x0, y0, x1, y1 in boxes.tolist()]))
+    return frames
+
+
+def main() -> None:
+    rng = np.random.RandomState(0)
+    print('{:>5} | {:>11} {:>12}'.format('N', 'per frame', 'ID kept'))
+    for n in SIZES:
+        frames = synthetic_frames(n, rng)
+        tracker = Tracker(max_tracks=2 * n)
+        last_track: Dict[int, int] = {}
+        kept = total = 0
+
+        start = time.perf_counter()
+        results = [tracker.update(detections) for _, detections in frames]
+        elapsed = time.perf_counter() - start
+
+        # Fraction of detections keeping the track ID of the previous
+        # detection of the same object. `update` may leave detections out,
+        # and keeps the `bounding_box` of those it returns.
+        for (objects, detections), tracked in zip(frames, results):
+            object_of_box = {id(detection.bounding_box): obj
+                             for obj, detection in zip(objects, detections)}
+            for detection in tracked:
+                obj = object_of_box[id(detection.bounding_box)]
+                if obj in last_track:
+                    total += 1
+                    kept += last_track[obj] == detection.ID
+                last_track[obj] = detection.ID
+        print('{:>5} | {} {:>11.2%}'.format(
+            n, format_time(elapsed / FRAMES), kept / max(total, 1)))
+
+
+if __name__ == '__main__':
+    main()
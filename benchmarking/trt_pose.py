@@ -0,0 +1,61 @@
+"""Parse trt_pose outputs one object at a time, and with `parse_trt_pose`.
+
+Run from the repository root with `python -m benchmarking.trt_pose`.
+"""
+from typing import List
+
+import numpy as np
+
+from benchmarking.timing import best_time, format_time
+from paitypes.estimation.pose import BodyPart, Human
+from paitypes.estimation.trt_pose import parse_trt_pose, parse_trt_pose_humans
+
+BATCH_SIZES = (1, 8, 32)
+MAX_OBJECTS = 100
+MAX_PEAKS = 100
+HUMANS_PER_IMAGE = 10
+
+
+def object_humans(counts: np.ndarray, objects: np.ndarray,
+                  peaks: np.ndarray) -> List[List[Human]]:
+    results = []
+    for image, count in enumerate(counts):
+        humans = []
+        for obj in objects[image, :count]:
+            human = Human([])
+            for part_idx, peak in enumerate(obj):
+                if peak < 0:
+                    continue
+                y, x = peaks[image, part_idx, peak]
+                uidx = '%d-%d' % (part_idx, peak)
+                human.body_parts[part_idx] = BodyPart(
+                    uidx, part_idx, float(x), float(y), 1.0)
+                human.uidx_list.add(uidx)
+            humans.append(human)
+        results.append(humans)
+    return results
+
+
+def main() -> None:
+    rng = np.random.RandomState(0)
+    print('{:>5} | {:>11} {:>11} {:>11}'.format(
+        'B', 'objects', 'Humans', 'arrays'))
+    for n_images in BATCH_SIZES:
+        counts = np.full(n_images, HUMANS_PER_IMAGE, dtype=np.int32)
+        objects = rng.randint(-1, HUMANS_PER_IMAGE,
+                              (n_images, MAX_OBJECTS, 18)).astype(np.int32)
+        peaks = rng.uniform(
+            size=(n_images, 18, MAX_PEAKS, 2)).astype(np.float32)
+        t_objects = best_time(lambda: object_humans(counts, objects, peaks),
+                              repeat=3)
+        t_humans = best_time(
+            lambda: parse_trt_pose_humans(counts, objects, peaks), repeat=3)
+        t_arrays = best_time(lambda: parse_trt_pose(counts, objects, peaks),
+                             repeat=3)
+        print('{:>5} | {} {} {}'.format(n_images, format_time(t_objects),
+                                        format_time(t_humans),
+                                        format_time(t_arrays)))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,19 @@
+import sys
+import threading
+import time
 from collections import OrderedDict
-from typing import Any, Optional, Callable
+from concurrent.futures import Future
+from typing import Any, Optional, Callable, Dict, List, Tuple
+
+from dataclasses import dataclass, replace
+
+
+def _size_of(value: Any) -> int:
+    """NumPy arrays count by their `nbytes`, anything else by `getsizeof`."""
+    n_bytes = getattr(value, 'nbytes', None)
+    if isinstance(n_bytes, int):
+        return n_bytes
+    return sys.getsizeof(value)
 
 
 class SizeLimitedDictionary(OrderedDict):
@@ -9,22 +23,112 @@ class SizeLimitedDictionary(OrderedDict):
     but additionally has a `max_size` attribute which limits the size of the
     dictionary, to avoid memory leaks. Adding more items than `max_size` will
     remove previous items, starting from the oldest one.
+
+    * With `lru`, reading or replacing an item makes it the newest one.
+
+    * With `ttl`, items expire `ttl` seconds after they were last written,
+    as measured by `timer`. Expired items are removed when the dictionary is
+    next read or written.
+
+    * With `max_bytes`, the oldest items are also removed while the values
+    take more than `max_bytes` in total. Writing a value that takes more
+    than `max_bytes` on its own leaves the dictionary unchanged. NumPy
+    arrays count by their `nbytes`, other values by `sys.getsizeof`.
+
+    All evictions take O(1) time per removed item.
     """
 
     def __init__(self,
                  max_size: int = 10,
                  default_factory: Optional[Callable[[], Any]] = None,
                  *args: Any,
+                 lru: bool = False,
+                 ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None,
+                 timer: Callable[[], float] = time.monotonic,
                  **kwargs: Any) -> None:
+        if max_size < 1:
+            raise ValueError('`max_size` must be positive')
         self._default_factory = default_factory
         self._max_size = max_size
+        self._lru = lru
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._timer = timer
+        # Keys in the order they were written, with their expiry time
+        self._deadlines: Dict[Any, float] = OrderedDict()
+        self._sizes: Dict[Any, int] = {}
+        self._n_bytes = 0
         super().__init__(*args, **kwargs)
 
+    @property
+    def n_bytes(self) -> int:
+        """Total size of the values, only counted if `max_bytes` is set."""
+        return self._n_bytes
+
     def __setitem__(self, key: Any, value: Any) -> None:
-        if len(self.items()) == self._max_size:
-            self.popitem(last=False)
+        self._expire()
+        size = 0
+        if self._max_bytes is not None:
+            size = _size_of(value)
+            if size > self._max_bytes:
+                # Evicting the other items would not make it fit
+                return
+        if OrderedDict.__contains__(self, key):
+            # Replacing a value never evicts another key to stay within
+            # `max_size`
+            self._forget(key)
+            if self._lru:
+                self.move_to_end(key)
+        elif len(self) >= self._max_size:
+            self._evict_oldest()
         super().__setitem__(key, value)
 
+        if self._ttl is not None:
+            self._deadlines[key] = self._timer() + self._ttl
+        if self._max_bytes is not None:
+            self._sizes[key] = size
+            self._n_bytes += size
+            self._evict_to_budget(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._expire()
+        value = super().__getitem__(key)
+        # A `default_factory` value over `max_bytes` is not stored
+        if self._lru and OrderedDict.__contains__(self, key):
+            self.move_to_end(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._expire()
+        if OrderedDict.__contains__(self, key):
+            return self[key]
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        self._expire()
+        return super().__contains__(key)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._forget(key)
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        if OrderedDict.__contains__(self, key):
+            self._forget(key)
+        return super().pop(key, *args)
+
+    def popitem(self, last: bool = True) -> Any:
+        key, value = super().popitem(last)
+        self._forget(key)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self._deadlines.clear()
+        self._sizes.clear()
+        self._n_bytes = 0
+
     def __missing__(self, key: Any) -> Any:
         if not self._default_factory:
             raise KeyError(key)
@@ -32,3 +136,219 @@ class SizeLimitedDictionary(OrderedDict):
             value = self._default_factory()
             self.__setitem__(key, value)
             return value
+
+    def _forget(self, key: Any) -> None:
+        self._deadlines.pop(key, None)
+        self._n_bytes -= self._sizes.pop(key, 0)
+
+    def _expire(self) -> None:
+        if self._ttl is None or not self._deadlines:
+            return
+        now = self._timer()
+        while self._deadlines:
+            key, deadline = next(iter(self._deadlines.items()))
+            if deadline > now:
+                break
+            self._discard(key)
+
+    def _evict_oldest(self) -> None:
+        self._discard(next(iter(self)))
+
+    def _evict_to_budget(self, key: Any) -> None:
+        """Evict the oldest items other than `key` until the values fit into
+        `max_bytes`, which the value of `key` does on its own.
+        """
+        while self._n_bytes > self._max_bytes:
+            keys = iter(self)
+            oldest = next(keys)
+            self._discard(next(keys) if oldest == key else oldest)
+
+    def _discard(self, key: Any) -> None:
+        value = OrderedDict.pop(self, key)
+        self._forget(key)
+        self._evict(key, value)
+
+    def _evict(self, key: Any, value: Any) -> None:
+        """Called with every item removed to make room, or as it expired."""
+
+
+@dataclass
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    factory_calls: int = 0
+    factory_time: float = 0.0
+    evictions: int = 0
+    peak_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class InstrumentedSizeLimitedDictionary(SizeLimitedDictionary):
+    """A `SizeLimitedDictionary` counting its cache hits and misses.
+
+    Reads with `[]` and `get` count as a hit or a miss, and `in` does not
+    count. `factory_time` sums the seconds spent in `default_factory`, and
+    `evictions` counts the items removed to make room or as they expired.
+    Use the plain `SizeLimitedDictionary` where the counters are not needed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._statistics = CacheStatistics()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """A snapshot of the counters."""
+        return replace(self._statistics)
+
+    def reset_statistics(self) -> CacheStatistics:
+        """Reset the counters, and return their values before the reset."""
+        statistics = self._statistics
+        self._statistics = CacheStatistics(peak_size=len(self))
+        return statistics
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        if len(self) > self._statistics.peak_size:
+            self._statistics.peak_size = len(self)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._expire()
+        if OrderedDict.__contains__(self, key):
+            self._statistics.hits += 1
+        else:
+            self._statistics.misses += 1
+        return super().__getitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._expire()
+        if not OrderedDict.__contains__(self, key):
+            self._statistics.misses += 1
+        return super().get(key, default)
+
+    def __missing__(self, key: Any) -> Any:
+        if not self._default_factory:
+            raise KeyError(key)
+        start = time.perf_counter()
+        value = self._default_factory()
+        self._statistics.factory_time += time.perf_counter() - start
+        self._statistics.factory_calls += 1
+        self.__setitem__(key, value)
+        return value
+
+    def _evict(self, key: Any, value: Any) -> None:
+        self._statistics.evictions += 1
+
+
+_NOT_FOUND = object()
+
+
+class ConcurrentSizeLimitedDictionary:
+    """A thread-safe `SizeLimitedDictionary` with the same eviction rules.
+
+    All writes go through one lock, which is only held for the O(1)
+    dictionary update, and reads do not take it unless they reorder or
+    expire items (with `lru` or `ttl`). A missing key calls
+    `default_factory` outside the lock, and at most once per key at a time:
+    other threads asking for the same key wait for that call, and receive
+    its value or its exception.
+    """
+
+    def __init__(self,
+                 max_size: int = 10,
+                 default_factory: Optional[Callable[[], Any]] = None,
+                 **kwargs: Any) -> None:
+        self._data = SizeLimitedDictionary(max_size, None, **kwargs)
+        self._default_factory = default_factory
+        self._lock = threading.Lock()
+        self._pending: Dict[Any, Future] = {}
+        self._locked_reads = (kwargs.get('lru', False) or
+                              kwargs.get('ttl') is not None)
+
+    def _lookup(self, key: Any) -> Any:
+        if not self._locked_reads:
+            # A single dict lookup, atomic under the GIL
+            return dict.get(self._data, key, _NOT_FOUND)
+        with self._lock:
+            self._data._expire()
+            if not OrderedDict.__contains__(self._data, key):
+                return _NOT_FOUND
+            return self._data[key]
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._lookup(key)
+        if value is not _NOT_FOUND:
+            return value
+        if self._default_factory is None:
+            raise KeyError(key)
+
+        with self._lock:
+            self._data._expire()
+            if OrderedDict.__contains__(self._data, key):
+                return self._data[key]
+            future = self._pending.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._pending[key] = Future()
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = self._default_factory()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            # Keep a value written while the factory was running
+            self._data._expire()
+            if OrderedDict.__contains__(self._data, key):
+                value = self._data[key]
+            else:
+                self._data[key] = value
+            del self._pending[key]
+        future.set_result(value)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _NOT_FOUND else value
+
+    def __contains__(self, key: Any) -> bool:
+        return self._lookup(key) is not _NOT_FOUND
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        with self._lock:
+            return self._data.pop(key, *args)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        """A snapshot of the items, from the oldest to the newest."""
+        with self._lock:
+            self._data._expire()
+            return list(self._data.items())
+
+    def keys(self) -> List[Any]:
+        """A snapshot of the keys, from the oldest to the newest."""
+        with self._lock:
+            self._data._expire()
+            return list(self._data.keys())
@@ -1,28 +1,150 @@
-from typing import List, Any, Callable, Tuple
+import math
+from typing import List, Any, Callable, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from scipy import sparse
 from scipy.optimize import linear_sum_assignment
+from scipy.sparse.csgraph import connected_components
 
+from paitypes.geometry.Point import Point
+from paitypes.geometry.PointArray import PointArray
+from paitypes.geometry.bounding_box import (BoundingBoxes,
+                                            BoundingBoxIndex,
+                                            as_bbox_array,
+                                            center_distance_matrix,
+                                            check_not_inverted,
+                                            iou_matrix)
 
-def linear_sum_match(list1: List[Any],
-                     list2: List[Any],
-                     distance_function: Callable[[Any, Any], float]
+
+def gated_linear_sum_assignment(cost_matrix: Any,
+                                max_cost: float = math.inf
+                                ) -> Tuple[np.ndarray, np.ndarray]:
+    """`linear_sum_assignment` that never assigns a pair costing more than
+    `max_cost`.
+
+    `cost_matrix` is a dense array or a `scipy.sparse` matrix, in which case
+    the entries that are not stored are infeasible as well. Among the
+    feasible pairs, as many as possible are assigned, at minimal total cost.
+
+    The feasible pairs split the rows and columns into independent connected
+    components. Each is solved on its own, and components with a single row
+    or column do not need the solver at all, so a gated problem is solved in
+    roughly linear time if its components stay small.
+    """
+    if sparse.issparse(cost_matrix):
+        # tocsr() sums duplicate entries but keeps explicit zeros
+        entries = cost_matrix.tocsr().tocoo()
+        rows, cols, costs = entries.row, entries.col, entries.data
+        feasible = costs <= max_cost
+        rows, cols = rows[feasible], cols[feasible]
+        costs = costs[feasible].astype(np.float64)
+    else:
+        cost_matrix = np.asarray(cost_matrix, dtype=np.float64)
+        rows, cols = np.nonzero(cost_matrix <= max_cost)
+        costs = cost_matrix[rows, cols]
+    n_rows, n_cols = cost_matrix.shape
+
+    graph = sparse.coo_matrix(
+        (np.ones(len(rows)), (rows, cols + n_rows)),
+        shape=(n_rows + n_cols, n_rows + n_cols))
+    _, labels = connected_components(graph, directed=False)
+
+    # Components with a single row or column, which includes all 1×1 ones,
+    # take their cheapest pair; ties go to the first pair in row-major order
+    edge_labels = labels[rows]
+    n_component_rows = np.bincount(labels[:n_rows], minlength=len(labels))
+    n_component_cols = np.bincount(labels[n_rows:], minlength=len(labels))
+    is_trivial = ((n_component_rows[edge_labels] == 1) |
+                  (n_component_cols[edge_labels] == 1))
+    trivial = np.flatnonzero(is_trivial)
+    trivial = trivial[np.lexsort((costs[trivial], edge_labels[trivial]))]
+    trivial_labels = edge_labels[trivial]
+    cheapest = trivial[np.r_[True, trivial_labels[1:] != trivial_labels[:-1]]
+                       if len(trivial) else np.zeros(0, dtype=bool)]
+    matched_rows: List[np.ndarray] = [rows[cheapest]]
+    matched_cols: List[np.ndarray] = [cols[cheapest]]
+
+    others = np.flatnonzero(~is_trivial)
+    others = others[np.argsort(edge_labels[others], kind='stable')]
+    bounds = np.flatnonzero(np.diff(edge_labels[others])) + 1
+    for edges in np.split(others, bounds) if len(others) else []:
+        component_rows, row_idxs = np.unique(rows[edges],
+                                             return_inverse=True)
+        component_cols, col_idxs = np.unique(cols[edges],
+                                             return_inverse=True)
+
+        # Infeasible pairs cost more than any set of feasible ones, such that
+        # the solver only uses them if nothing else is left
+        shifted = costs[edges] - costs[edges].min()
+        infeasible_cost = (shifted.max() + 1.0) * (
+            min(len(component_rows), len(component_cols)) + 1)
+        block = np.full((len(component_rows), len(component_cols)),
+                        infeasible_cost)
+        block[row_idxs, col_idxs] = shifted
+        is_feasible = np.zeros(block.shape, dtype=bool)
+        is_feasible[row_idxs, col_idxs] = True
+
+        block_rows, block_cols = linear_sum_assignment(block)
+        keep = is_feasible[block_rows, block_cols]
+        matched_rows.append(component_rows[block_rows[keep]])
+        matched_cols.append(component_cols[block_cols[keep]])
+
+    all_rows = np.concatenate(matched_rows)
+    all_cols = np.concatenate(matched_cols)
+    by_row = np.argsort(all_rows)
+    return all_rows[by_row], all_cols[by_row]
+
+
+def linear_sum_match(list1: Sequence[Any],
+                     list2: Sequence[Any],
+                     distance_function: Callable[[Any, Any], Any],
+                     vectorized: bool = False,
+                     max_cost: Optional[float] = None
                      ) -> Tuple[List[Tuple[int, int]],
                                 List[int],
                                 List[int],
                                 Any]:
+    """Match the items of `list1` and `list2` with minimal total distance.
+
+    By default `distance_function(item1, item2)` is called once per pair. If
+    `vectorized` is set, it is called once as
+    `distance_function(list1, list2)` and must return the whole
+    `len(list1)`×`len(list2)` distance matrix, see `center_distance_cost`,
+    `iou_cost` and `keypoint_distance_cost`. Both modes return the same
+    results, including the cost matrix, which has one row per item of
+    `list2`.
+
+    If `max_cost` is given, pairs further apart than it are never matched,
+    see `gated_linear_sum_assignment`. A vectorized `distance_function` may
+    then also return a `scipy.sparse` matrix holding only the feasible pairs.
+    """
     matched_idxs: List[Tuple[int, int]] = []
     unmatched_list1_idxs = set(range(len(list1)))
     unmatched_list2_idxs = set(range(len(list2)))
-    cost_matrix = np.array([
-        [distance_function(item1, item2)
-         for item1 in list1]
-        for item2 in list2]
-    )
+    if not vectorized:
+        cost_matrix = np.array([
+            [distance_function(item1, item2)
+             for item1 in list1]
+            for item2 in list2]
+        )
+    elif len(list2) == 0:
+        cost_matrix = np.array([])
+    else:
+        cost_matrix = distance_function(list1, list2)
+        if sparse.issparse(cost_matrix):
+            cost_matrix = cost_matrix.T
+        else:
+            cost_matrix = np.asarray(cost_matrix).T
 
     if cost_matrix.ndim == 2:
-        matched_list2_idxs, matched_list1_idxs = linear_sum_assignment(
-            cost_matrix)
+        if max_cost is not None or sparse.issparse(cost_matrix):
+            matched_list2_idxs, matched_list1_idxs = (
+                gated_linear_sum_assignment(
+                    cost_matrix,
+                    math.inf if max_cost is None else max_cost))
+        else:
+            matched_list2_idxs, matched_list1_idxs = linear_sum_assignment(
+                cost_matrix)
 
         unmatched_list1_idxs -= set(matched_list1_idxs)
         unmatched_list2_idxs -= set(matched_list2_idxs)
@@ -32,3 +154,78 @@ def linear_sum_match(list1: List[Any],
             list(unmatched_list1_idxs),
             list(unmatched_list2_idxs),
             cost_matrix)
+
+
+Points = Union[PointArray, Sequence[Point]]
+
+
+def _as_point_array(points: Points) -> PointArray:
+    if isinstance(points, PointArray):
+        return points
+    return PointArray.from_points(points)
+
+
+# `math.pow` as a ufunc, returning an object array
+_pow = np.frompyfunc(math.pow, 2, 1)
+
+
+def center_distance_cost(list1: BoundingBoxes,
+                         list2: BoundingBoxes) -> np.ndarray:
+    """`BoundingBox.distance` of all box pairs, for `vectorized` matching.
+
+    The squares are taken with `math.pow` like in `BoundingBox.distance`,
+    whose results differ from those of NumPy in the last bit for some
+    inputs on some platforms, so that both give the same matches on near
+    ties. That costs two Python calls per pair; `center_distance_matrix`
+    is faster where matching the scalar results bit for bit is not needed.
+    """
+    bboxes1, bboxes2 = as_bbox_array(list1), as_bbox_array(list2)
+    c1_x = bboxes1.x_min * 0.5 + bboxes1.x_max * 0.5
+    c1_y = bboxes1.y_min * 0.5 + bboxes1.y_max * 0.5
+    c2_x = bboxes2.x_min * 0.5 + bboxes2.x_max * 0.5
+    c2_y = bboxes2.y_min * 0.5 + bboxes2.y_max * 0.5
+    squares = (_pow(c1_x[:, None] - c2_x[None, :], 2) +
+               _pow(c1_y[:, None] - c2_y[None, :], 2))
+    return np.sqrt(squares.astype(np.float64))
+
+
+def iou_cost(list1: BoundingBoxes, list2: BoundingBoxes) -> np.ndarray:
+    """`1 - get_iou` of all box pairs, for `vectorized` matching."""
+    return 1.0 - iou_matrix(list1, list2)
+
+
+def sparse_iou_cost(list1: BoundingBoxes,
+                    list2: BoundingBoxes) -> sparse.csr_matrix:
+    """`iou_cost` of the overlapping box pairs only, as a sparse matrix.
+
+    Pairs that do not overlap are left out, so `linear_sum_match` never
+    matches them. The candidates are found with a `BoundingBoxIndex`, which
+    avoids the quadratic `iou_cost` matrix for large, spread out scenes.
+    """
+    bboxes1, bboxes2 = as_bbox_array(list1), as_bbox_array(list2)
+    check_not_inverted(bboxes1)
+    check_not_inverted(bboxes2)
+    index = BoundingBoxIndex(bboxes2)
+    candidates = [index.overlapping(bbox) for bbox in bboxes1]
+    cols = (np.concatenate(candidates) if candidates
+            else np.zeros(0, dtype=np.intp))
+    rows = np.repeat(np.arange(len(bboxes1)), [len(c) for c in candidates])
+
+    data1, data2 = bboxes1.data[rows], bboxes2.data[cols]
+    width = (np.minimum(data1[:, 1], data2[:, 1]) -
+             np.maximum(data1[:, 0], data2[:, 0]))
+    height = (np.minimum(data1[:, 3], data2[:, 3]) -
+              np.maximum(data1[:, 2], data2[:, 2]))
+    intersection_area = width * height
+    union_area = (bboxes1.area[rows] + bboxes2.area[cols] -
+                  intersection_area)
+    overlaps = intersection_area > 0.0
+    iou = intersection_area[overlaps] / union_area[overlaps]
+    return sparse.csr_matrix(
+        (1.0 - iou, (rows[overlaps], cols[overlaps])),
+        shape=(len(bboxes1), len(bboxes2)))
+
+
+def keypoint_distance_cost(list1: Points, list2: Points) -> np.ndarray:
+    """`Point.distance_to_point` of all pairs, for `vectorized` matching."""
+    return _as_point_array(list1).distance_matrix(_as_point_array(list2))
@@ -1,7 +1,11 @@
+import abc
+import heapq
+import math
+from collections import deque
 from logging import getLogger
 from statistics import mean
-from typing import Callable, Iterable, TypeVar, Tuple, Dict, List, Set, \
-    Optional
+from typing import Callable, Iterable, TypeVar, Dict, List, Set, \
+    Optional, Deque, Iterator, Union, overload
 
 import numpy as np
 
@@ -10,10 +14,36 @@ T_a = TypeVar('T_a')
 T_b = TypeVar('T_b')
 
 
-def cluster(distance_function: Callable[[T_b, T_a], float],
+def cluster_indices(distance_matrix: np.ndarray,
+                    max_distance: float = 1.0) -> np.ndarray:
+    """The cluster of every value, given the distances of all values to all
+    clusters.
+
+    `distance_matrix` has one row per value and one column per cluster. Each
+    value is assigned the index of its closest cluster, the earliest one on
+    ties, or -1 if no cluster has a distance less than `max_distance`. NaN
+    distances never match, like in `cluster`.
+    """
+    distance_matrix = np.asarray(distance_matrix, dtype=np.float64)
+    if distance_matrix.ndim != 2:
+        raise ValueError("`distance_matrix` must be two-dimensional")
+    n_values, n_clusters = distance_matrix.shape
+    if n_clusters == 0:
+        return np.full(n_values, -1, dtype=np.intp)
+
+    distances = np.where(np.isnan(distance_matrix), np.inf, distance_matrix)
+    nearest = np.argmin(distances, axis=1)
+    nearest_distance = distances[np.arange(n_values), nearest]
+    return np.where(nearest_distance < max_distance, nearest, -1)
+
+
+def cluster(distance_function: Optional[Callable[[T_b, T_a], float]],
             clusters: Set[T_a],
             values: List[T_b],
-            max_distance: float = 1.0
+            max_distance: float = 1.0,
+            *,
+            distance_matrix_function: Optional[
+                Callable[[List[T_b], List[T_a]], np.ndarray]] = None
             ) -> Dict[T_a, List[T_b]]:
     """Put `values` into clusters defined by `clusters`.
 
@@ -28,7 +58,35 @@ def cluster(distance_function: Callable[[T_b, T_a], float],
     * If there no cluster with distance less than `max_distance` to a value,
     that value would not be clustered.
 
+    * Instead of `distance_function`, a `distance_matrix_function` can be
+    given, which is called once as
+    `distance_matrix_function(values, list(clusters))` and must return the
+    matrix of all distances, with one row per value. The values then do not
+    need to be hashable. See `cluster_indices` for the assignment on its
+    own.
+
     """
+    if distance_matrix_function is not None:
+        if distance_function is not None:
+            raise ValueError("pass either `distance_function` or "
+                             "`distance_matrix_function`, not both")
+        cluster_list = list(clusters)
+        if len(values) > 0 and cluster_list:
+            distance_matrix = distance_matrix_function(values, cluster_list)
+        else:
+            distance_matrix = np.zeros((len(values), len(cluster_list)))
+
+        mappings: Dict[T_a, List[T_b]] = {a: [] for a in cluster_list}
+        for b, i in zip(values,
+                        cluster_indices(distance_matrix,
+                                        max_distance).tolist()):
+            if i >= 0:
+                mappings[cluster_list[i]].append(b)
+        return mappings
+    if distance_function is None:
+        raise ValueError(
+            "`distance_function` or `distance_matrix_function` is required")
+
     min_distance = {b: max_distance for b in values}
     centers: Dict[T_b, Optional[T_a]] = {b: None for b in values}
 
@@ -48,10 +106,55 @@ def cluster(distance_function: Callable[[T_b, T_a], float],
     return cluster_mappings
 
 
+# NumPy reductions that `moving_window` applies to all windows at once
+_WINDOW_REDUCERS = (np.mean, np.sum, np.prod, np.min, np.max, np.amin,
+                    np.amax, np.ptp, np.median, np.std, np.var, np.nanmean,
+                    np.nansum, np.nanmin, np.nanmax, np.nanmedian, np.nanstd,
+                    np.nanvar)
+
+
+def sliding_windows(a: np.ndarray, window_size: int) -> np.ndarray:
+    """Read-only view of all `window_size` long windows along the first axis
+    of `a`, with shape `(len(a) - window_size + 1, window_size, ...)`.
+    """
+    a = np.asarray(a)
+    if not 0 < window_size <= len(a):
+        raise ValueError("`window_size` must be in [1, len(a)]")
+    return np.lib.stride_tricks.as_strided(
+        a,
+        shape=(len(a) - window_size + 1, window_size) + a.shape[1:],
+        strides=(a.strides[0],) + a.strides,
+        writeable=False)
+
+
+@overload
+def moving_window(f: Callable, l: np.ndarray,
+                  window_size: int) -> Union[List, np.ndarray]:
+    ...
+
+
+@overload
 def moving_window(f: Callable, l: List, window_size: int) -> List:
+    ...
+
+
+def moving_window(f: Callable, l: Union[List, np.ndarray],
+                  window_size: int) -> Union[List, np.ndarray]:
+    """`f` of every `window_size` long window of `l`.
+
+    If `l` is a NumPy array and `f` a NumPy reduction such as `np.mean` or
+    `np.max`, all windows are reduced in one call on a strided view, and the
+    result is an array.
+    """
     if window_size <= 0:
         raise ValueError("`window_size` must be a positive non-zero integer")
-    if not l:
+    if isinstance(l, np.ndarray) and l.ndim > 0 and \
+            any(f is reducer for reducer in _WINDOW_REDUCERS):
+        if len(l) == 0:
+            return np.zeros(0, dtype=np.float64)
+        windows = sliding_windows(l, min(window_size, len(l)))
+        return f(windows, axis=tuple(range(1, windows.ndim)))
+    if not len(l):
         return []
     window_size = min(window_size, len(l))
     result = []
@@ -60,5 +163,283 @@ def moving_window(f: Callable, l: List, window_size: int) -> List:
     return result
 
 
+@overload
+def moving_average(l: np.ndarray, window_size: int) -> np.ndarray:
+    ...
+
+
+@overload
 def moving_average(l: List[float], window_size: int) -> List[float]:
+    ...
+
+
+def moving_average(l: Union[List[float], np.ndarray],
+                   window_size: int) -> Union[List[float], np.ndarray]:
+    """The mean of every `window_size` long window of `l`.
+
+    A NumPy array `l` is averaged in O(N) from its cumulative sum, which
+    matches the exact means of `statistics.mean` up to rounding, and the
+    result is an array. Arrays holding NaN or infinite values are averaged
+    window by window instead, so that these only affect their own windows.
+    Lists are averaged exactly.
+    """
+    if isinstance(l, np.ndarray):
+        if window_size <= 0:
+            raise ValueError(
+                "`window_size` must be a positive non-zero integer")
+        values = np.asarray(l, dtype=np.float64)
+        if len(values) == 0:
+            return np.zeros(0, dtype=np.float64)
+        window_size = min(window_size, len(values))
+        if window_size == 1:
+            return values.copy()
+        if not np.isfinite(values).all():
+            return sliding_windows(values, window_size).mean(axis=1)
+
+        # Center the values first, such that the cumulative sum stays small
+        # and subtracting its entries loses less precision
+        offset = values.mean(axis=0)
+        sums = np.cumsum(values - offset, axis=0)
+        window_sums = sums[window_size - 1:].copy()
+        window_sums[1:] -= sums[:-window_size]
+        return window_sums / window_size + offset
     return moving_window(mean, l, window_size)
+
+
+class RollingWindow(abc.ABC):
+    """Streaming statistic over the last `window_size` values pushed.
+
+    `push` adds a value and returns the statistic of the window, which holds
+    fewer values until `window_size` values were pushed. Called with an
+    iterable, the operator yields the statistic after every value, so
+    `list(RollingMean(w)(l))[w - 1:]` equals `moving_average(l, w)` up to
+    rounding. Memory is bounded by the window size. The values must not be
+    NaN.
+
+    Subclasses update the statistic in `_remove`, called with the value
+    leaving the window after it was removed from `_window`, and in `_add`,
+    called with the new value after it was appended to `_window`.
+    """
+
+    def __init__(self, window_size: int) -> None:
+        if window_size <= 0:
+            raise ValueError(
+                "`window_size` must be a positive non-zero integer")
+        self.window_size = window_size
+        self._window: Deque[float] = deque()
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def __call__(self, values: Iterable[float]) -> Iterator[float]:
+        for value in values:
+            yield self.push(value)
+
+    def push(self, value: float) -> float:
+        if len(self._window) == self.window_size:
+            self._remove(self._window.popleft())
+        self._window.append(value)
+        self._add(value)
+        return self.value
+
+    @property
+    @abc.abstractmethod
+    def value(self) -> float:
+        """The statistic of the current window."""
+
+    @abc.abstractmethod
+    def _add(self, value: float) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _remove(self, value: float) -> None:
+        pass
+
+
+class RollingSum(RollingWindow):
+    """Sum of the window in O(1) per value.
+
+    The running sum is recomputed exactly every `window_size` values, such
+    that rounding errors do not accumulate over long streams.
+    """
+
+    def __init__(self, window_size: int) -> None:
+        super().__init__(window_size)
+        self._sum = 0.0
+        self._updates = 0
+
+    @property
+    def value(self) -> float:
+        return self._sum
+
+    def _add(self, value: float) -> None:
+        self._sum += value
+        self._updates += 1
+        if self._updates >= self.window_size:
+            self._sum = math.fsum(self._window)
+            self._updates = 0
+
+    def _remove(self, value: float) -> None:
+        self._sum -= value
+
+
+class RollingMean(RollingSum):
+    """Mean of the window in O(1) per value."""
+
+    @property
+    def value(self) -> float:
+        if not self._window:
+            return math.nan
+        return self._sum / len(self._window)
+
+
+class RollingVariance(RollingWindow):
+    """Variance of the window in O(1) per value, with Welford's update.
+
+    `ddof` is the delta degrees of freedom, as in `np.var`. The mean and the
+    sum of squared deviations are recomputed every `window_size` values.
+    """
+
+    def __init__(self, window_size: int, ddof: int = 0) -> None:
+        super().__init__(window_size)
+        self.ddof = ddof
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+
+    @property
+    def value(self) -> float:
+        if len(self._window) <= self.ddof:
+            return math.nan
+        return max(self._m2, 0.0) / (len(self._window) - self.ddof)
+
+    def _add(self, value: float) -> None:
+        delta = value - self._mean
+        self._mean += delta / len(self._window)
+        self._m2 += delta * (value - self._mean)
+
+        self._updates += 1
+        if self._updates >= self.window_size:
+            self._mean = math.fsum(self._window) / len(self._window)
+            self._m2 = math.fsum((v - self._mean) ** 2 for v in self._window)
+            self._updates = 0
+
+    def _remove(self, value: float) -> None:
+        # Welford's update in reverse
+        if not self._window:
+            self._mean = self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / len(self._window)
+        self._m2 -= delta * (value - self._mean)
+
+
+class RollingMin(RollingWindow):
+    """Minimum of the window in amortized O(1) per value.
+
+    Keeps a deque of the values that can still become the minimum, in
+    increasing order. Equal values are all kept, such that the oldest one
+    can leave the window without the others.
+    """
+
+    def __init__(self, window_size: int) -> None:
+        super().__init__(window_size)
+        self._candidates: Deque[float] = deque()
+
+    def _precedes(self, a: float, b: float) -> bool:
+        return a < b
+
+    @property
+    def value(self) -> float:
+        if not self._candidates:
+            return math.nan
+        return self._candidates[0]
+
+    def _add(self, value: float) -> None:
+        candidates = self._candidates
+        while candidates and self._precedes(value, candidates[-1]):
+            candidates.pop()
+        candidates.append(value)
+
+    def _remove(self, value: float) -> None:
+        if self._candidates[0] == value:
+            self._candidates.popleft()
+
+
+class RollingMax(RollingMin):
+    """Maximum of the window in amortized O(1) per value."""
+
+    def _precedes(self, a: float, b: float) -> bool:
+        return a > b
+
+
+class RollingMedian(RollingWindow):
+    """Median of the window in O(log W) per value.
+
+    The lower half of the window is kept in a max-heap and the upper half in
+    a min-heap. Values leaving the window are only marked, and removed once
+    they reach the top of their heap, and the heaps are rebuilt once marked
+    values make up more than half of them.
+    """
+
+    def __init__(self, window_size: int) -> None:
+        super().__init__(window_size)
+        self._low: List[float] = []  # negated, max-heap
+        self._high: List[float] = []
+        self._low_size = 0
+        self._high_size = 0
+        self._removed: Dict[float, int] = {}
+
+    @property
+    def value(self) -> float:
+        if not self._window:
+            return math.nan
+        if len(self._window) % 2:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2.0
+
+    def _prune(self, heap: List[float], sign: float) -> None:
+        while heap and self._removed.get(sign * heap[0], 0):
+            self._removed[sign * heap[0]] -= 1
+            heapq.heappop(heap)
+
+    def _rebalance(self) -> None:
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1.0)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._low_size += 1
+            self._high_size -= 1
+            self._prune(self._high, 1.0)
+
+    def _add(self, value: float) -> None:
+        if not self._low or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._rebalance()
+        if len(self._low) + len(self._high) > 2 * self.window_size:
+            self._rebuild()
+
+    def _remove(self, value: float) -> None:
+        self._removed[value] = self._removed.get(value, 0) + 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            self._prune(self._low, -1.0)
+        else:
+            self._high_size -= 1
+            self._prune(self._high, 1.0)
+        self._rebalance()
+
+    def _rebuild(self) -> None:
+        values = sorted(self._window)
+        n_low = (len(values) + 1) // 2
+        self._low = [-v for v in reversed(values[:n_low])]
+        self._high = values[n_low:]
+        self._low_size, self._high_size = len(self._low), len(self._high)
+        self._removed = {}
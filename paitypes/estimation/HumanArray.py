@@ -0,0 +1,224 @@
+from typing import Iterator, List, Optional, Sequence, Union, overload
+
+import numpy as np
+
+from paitypes.common.DataError import DataError
+from paitypes.estimation.pose import BodyPart, CocoPart, Human
+
+N_PARTS = len(CocoPart)
+
+
+class HumanArrayError(DataError):
+    pass
+
+
+def _peak_id(uidx: str) -> int:
+    # `Human` names its parts '<part index>-<peak index>'
+    return int(uidx.split('-')[-1])
+
+
+def _to_human(keypoints: List[List[float]], present: List[bool],
+              peak_ids: List[int], score: float) -> Human:
+    human = Human([])
+    for part_idx, ((x, y, part_score), is_present, peak_id) in enumerate(
+            zip(keypoints, present, peak_ids)):
+        if is_present:
+            uidx = '%d-%d' % (part_idx, peak_id)
+            human.body_parts[part_idx] = BodyPart(uidx, part_idx,
+                                                  x, y, part_score)
+            human.uidx_list.add(uidx)
+    human.score = score
+    return human
+
+
+class HumanPose:
+    """A `Human` as an 18×3 array of `(x, y, score)` rows, one per
+    `CocoPart`, plus a mask of the parts that are present.
+
+    `peak_ids` holds the peak index of every part, or -1 for absent parts.
+    With the default `dtype` of `np.float64`, the conversion to and from
+    `Human` keeps the body parts and the score exactly; `np.float32`
+    rounds the coordinates and part scores. The `pairs` a `Human` was
+    assembled from are not kept, and neither are the `uidx_list` entries
+    of parts that a later pair overwrote, so `is_connected` and `merge` of
+    the converted `Human` only see the parts that are present.
+    """
+
+    __slots__ = ('keypoints', 'present', 'peak_ids', 'score')
+
+    def __init__(self,
+                 keypoints: np.ndarray,
+                 present: np.ndarray,
+                 peak_ids: Optional[np.ndarray] = None,
+                 score: float = 0.0) -> None:
+        if keypoints.shape != (N_PARTS, 3) or present.shape != (N_PARTS,):
+            raise HumanArrayError(
+                f'expected arrays of shape ({N_PARTS}, 3) and ({N_PARTS},), '
+                f'got {keypoints.shape} and {present.shape}')
+        self.keypoints = keypoints
+        self.present = present.astype(bool, copy=False)
+        if peak_ids is None:
+            peak_ids = np.where(self.present, 0, -1).astype(np.int32)
+        self.peak_ids = peak_ids
+        self.score = score
+
+    @classmethod
+    def from_human(cls, human: Human, dtype: np.dtype = np.float64
+                   ) -> 'HumanPose':
+        keypoints = np.zeros((N_PARTS, 3), dtype=dtype)
+        present = np.zeros(N_PARTS, dtype=bool)
+        peak_ids = np.full(N_PARTS, -1, dtype=np.int32)
+        for part_idx, part in human.body_parts.items():
+            keypoints[part_idx] = (part.x, part.y, part.score)
+            present[part_idx] = True
+            peak_ids[part_idx] = _peak_id(part.uidx)
+        return cls(keypoints, present, peak_ids, human.score)
+
+    def to_human(self) -> Human:
+        return _to_human(self.keypoints.tolist(), self.present.tolist(),
+                         self.peak_ids.tolist(), self.score)
+
+    def part(self, part: CocoPart) -> Optional[BodyPart]:
+        """The `BodyPart` for `part`, or None if it is absent."""
+        idx = part.value
+        if not self.present[idx]:
+            return None
+        x, y, score = self.keypoints[idx].tolist()
+        return BodyPart('%d-%d' % (idx, self.peak_ids[idx]), idx,
+                        x, y, score)
+
+    def part_count(self) -> int:
+        return int(self.present.sum())
+
+    def __str__(self) -> str:
+        return '({}: {} parts)'.format(type(self).__name__,
+                                       self.part_count())
+
+    def __repr__(self) -> str:
+        return '{}({!r}, {!r}, {!r}, {!r})'.format(
+            type(self).__name__, self.keypoints, self.present,
+            self.peak_ids, self.score)
+
+
+class HumanArray:
+    """P humans as a P×18×3 keypoint array, a P×18 presence mask, P×18 peak
+    ids and P scores. The batched counterpart of `HumanPose`, and like it
+    does not keep the `pairs` or overwritten `uidx_list` entries of a
+    `Human`.
+    """
+
+    __slots__ = ('keypoints', 'present', 'peak_ids', 'scores')
+
+    def __init__(self,
+                 keypoints: np.ndarray,
+                 present: np.ndarray,
+                 peak_ids: Optional[np.ndarray] = None,
+                 scores: Optional[np.ndarray] = None) -> None:
+        n = len(keypoints)
+        if keypoints.shape != (n, N_PARTS, 3) or \
+                present.shape != (n, N_PARTS):
+            raise HumanArrayError(
+                f'expected arrays of shape (P, {N_PARTS}, 3) and '
+                f'(P, {N_PARTS}), got {keypoints.shape} and {present.shape}')
+        self.keypoints = keypoints
+        self.present = present.astype(bool, copy=False)
+        if peak_ids is None:
+            peak_ids = np.where(self.present, 0, -1).astype(np.int32)
+        self.peak_ids = peak_ids
+        self.scores = (np.zeros(n, dtype=np.float64) if scores is None
+                       else scores)
+
+    @classmethod
+    def zeros(cls, n: int, dtype: np.dtype = np.float64) -> 'HumanArray':
+        return cls(np.zeros((n, N_PARTS, 3), dtype=dtype),
+                   np.zeros((n, N_PARTS), dtype=bool),
+                   np.full((n, N_PARTS), -1, dtype=np.int32),
+                   np.zeros(n, dtype=np.float64))
+
+    @classmethod
+    def from_poses(cls, poses: Sequence[HumanPose],
+                   dtype: np.dtype = np.float64) -> 'HumanArray':
+        if not poses:
+            return cls.zeros(0, dtype)
+        return cls(np.stack([pose.keypoints for pose in poses]).astype(
+                       dtype, copy=False),
+                   np.stack([pose.present for pose in poses]),
+                   np.stack([pose.peak_ids for pose in poses]),
+                   np.array([pose.score for pose in poses],
+                            dtype=np.float64))
+
+    @classmethod
+    def from_humans(cls, humans: Sequence[Human],
+                    dtype: np.dtype = np.float64) -> 'HumanArray':
+        humans_array = cls.zeros(len(humans), dtype)
+        # One write per array rather than per part
+        human_idxs, part_idxs, values, peak_ids = [], [], [], []
+        for i, human in enumerate(humans):
+            for part_idx, part in human.body_parts.items():
+                human_idxs.append(i)
+                part_idxs.append(part_idx)
+                values.append((part.x, part.y, part.score))
+                peak_ids.append(_peak_id(part.uidx))
+        if values:
+            humans_array.keypoints[human_idxs, part_idxs] = values
+            humans_array.present[human_idxs, part_idxs] = True
+            humans_array.peak_ids[human_idxs, part_idxs] = peak_ids
+        humans_array.scores[:] = [human.score for human in humans]
+        return humans_array
+
+    def to_humans(self) -> List[Human]:
+        # One `tolist` per array rather than per human
+        return [_to_human(*human) for human in
+                zip(self.keypoints.tolist(), self.present.tolist(),
+                    self.peak_ids.tolist(), self.scores.tolist())]
+
+    def to_poses(self) -> List[HumanPose]:
+        return list(self)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.keypoints[:, :, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.keypoints[:, :, 1]
+
+    @property
+    def part_scores(self) -> np.ndarray:
+        return self.keypoints[:, :, 2]
+
+    def part_counts(self) -> np.ndarray:
+        return self.present.sum(axis=1)
+
+    def __len__(self) -> int:
+        return len(self.keypoints)
+
+    def __iter__(self) -> Iterator[HumanPose]:
+        return (self.to_pose(i) for i in range(len(self)))
+
+    @overload
+    def __getitem__(self, index: int) -> HumanPose:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> 'HumanArray':
+        ...
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]
+                    ) -> Union[HumanPose, 'HumanArray']:
+        if isinstance(index, (int, np.integer)):
+            return self.to_pose(int(index))
+        return HumanArray(self.keypoints[index], self.present[index],
+                          self.peak_ids[index], self.scores[index])
+
+    def to_pose(self, index: int) -> HumanPose:
+        return HumanPose(self.keypoints[index], self.present[index],
+                         self.peak_ids[index], float(self.scores[index]))
+
+    def __str__(self) -> str:
+        return '({}: {} humans)'.format(type(self).__name__, len(self))
+
+    def __repr__(self) -> str:
+        return '{}({!r}, {!r}, {!r}, {!r})'.format(
+            type(self).__name__, self.keypoints, self.present,
+            self.peak_ids, self.scores)
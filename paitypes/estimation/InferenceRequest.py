@@ -3,6 +3,7 @@ from typing import List
 from dataclasses import dataclass
 
 from paitypes.image import BGRImage
+from paitypes.image.batch import ImageBatch
 
 
 @dataclass
@@ -10,3 +11,29 @@ class InferenceRequest:
     images: List[BGRImage]
     require_poses: bool = True
     require_detections: bool = True
+
+
+@dataclass
+class BatchedInferenceRequest:
+    """An `InferenceRequest` carrying its images as one `ImageBatch`."""
+    batch: ImageBatch
+    require_poses: bool = True
+    require_detections: bool = True
+
+    @property
+    def images(self) -> List[BGRImage]:
+        return self.batch.images
+
+    @classmethod
+    def from_request(cls, request: InferenceRequest
+                     ) -> 'BatchedInferenceRequest':
+        """Batch the images of `request`, without copying them if they are
+        views of one batch already, see `ImageBatch.from_images`.
+        """
+        return cls(ImageBatch.from_images(request.images),
+                   request.require_poses,
+                   request.require_detections)
+
+    def to_request(self) -> InferenceRequest:
+        return InferenceRequest(self.images, self.require_poses,
+                                self.require_detections)
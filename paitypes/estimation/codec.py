@@ -0,0 +1,257 @@
+import builtins
+import struct
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from paitypes.common.DataError import DataError
+from paitypes.estimation.DetectedObject import DetectedObject, Label
+from paitypes.estimation.HumanArray import N_PARTS, HumanArray
+from paitypes.estimation.InferenceResponse import InferenceResponse
+from paitypes.estimation.InferenceResult import (ObjectDetectionResult,
+                                                 PoseEstimationResult)
+from paitypes.geometry.bounding_box import BoundingBox
+
+MAGIC = b'PAIR'
+VERSION = 1
+
+# magic, version, flags, number of pose images, of humans, of detection
+# images, of detections, of error bytes, and a reserved field
+_HEADER = struct.Struct('<4sHHIIIIII')
+_HAS_POSES = 1
+_HAS_DETECTIONS = 2
+_HAS_ERROR = 4
+_ALIGNMENT = 8
+
+# Explicit offsets keep the layout fixed across NumPy versions
+HUMAN_DTYPE = np.dtype({
+    'names': ['keypoints', 'score', 'peak_ids', 'present'],
+    'formats': [('<f8', (N_PARTS, 3)), '<f8', ('<i4', (N_PARTS,)),
+                ('?', (N_PARTS,))],
+    'offsets': [0, 432, 440, 512],
+    'itemsize': 536})
+DETECTION_DTYPE = np.dtype({
+    'names': ['ID', 'bounding_box', 'confidence', 'label', 'verified'],
+    'formats': ['<i8', ('<f8', (4,)), '<f8', '<i4', '?'],
+    'offsets': [0, 8, 40, 48, 52],
+    'itemsize': 56})
+_COUNT_DTYPE = np.dtype('<u4')
+
+
+class CodecError(DataError):
+    pass
+
+
+class RemoteError(Exception):
+    """An error of a type that is not a builtin exception, decoded from its
+    type name and message.
+    """
+
+    def __init__(self, type_name: str, message: str) -> None:
+        super().__init__(f'{type_name}: {message}')
+        self.type_name = type_name
+        self.message = message
+
+
+def _padding(n_bytes: int) -> bytes:
+    return bytes(-n_bytes % _ALIGNMENT)
+
+
+def _human_records(results: Sequence[Union[PoseEstimationResult,
+                                           HumanArray]]
+                   ) -> Tuple[np.ndarray, np.ndarray]:
+    counts = np.array([len(humans) for humans in results],
+                      dtype=_COUNT_DTYPE)
+    records = np.zeros(int(counts.sum()), dtype=HUMAN_DTYPE)
+    records['peak_ids'] = -1
+    start = 0
+    for humans in results:
+        end = start + len(humans)
+        chunk = records[start:end]
+        if not isinstance(humans, HumanArray):
+            humans = HumanArray.from_humans(humans)
+        chunk['keypoints'] = humans.keypoints
+        chunk['present'] = humans.present
+        chunk['peak_ids'] = np.where(humans.present, humans.peak_ids, -1)
+        chunk['score'] = humans.scores
+        start = end
+    return counts, records
+
+
+def _detection_records(results: Sequence[ObjectDetectionResult]
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    counts = np.array([len(detections) for detections in results],
+                      dtype=_COUNT_DTYPE)
+    detections = [detection for detections in results
+                  for detection in detections]
+    records = np.zeros(len(detections), dtype=DETECTION_DTYPE)
+    if detections:
+        records['ID'] = [detection.ID for detection in detections]
+        records['bounding_box'] = [
+            (bbox.x_min, bbox.x_max, bbox.y_min, bbox.y_max)
+            for bbox in (detection.bounding_box for detection in detections)]
+        records['confidence'] = [detection.confidence
+                                 for detection in detections]
+        records['label'] = [detection.label.value for detection in detections]
+        records['verified'] = [detection.verified for detection in detections]
+    return counts, records
+
+
+def _encode_error(error: Exception) -> bytes:
+    error_type = type(error)
+    type_name = (error_type.__qualname__
+                 if error_type.__module__ == 'builtins' else
+                 f'{error_type.__module__}.{error_type.__qualname__}')
+    # `str` of a `KeyError` quotes its message
+    message = (error.args[0]
+               if len(error.args) == 1 and isinstance(error.args[0], str)
+               else str(error))
+    return f'{type_name}\n{message}'.encode('utf-8')
+
+
+def _decode_error(data: bytes) -> Exception:
+    type_name, _, message = data.decode('utf-8').partition('\n')
+    error_type = getattr(builtins, type_name, None)
+    if isinstance(error_type, type) and issubclass(error_type, Exception):
+        try:
+            return error_type(message)
+        except TypeError:
+            pass
+    return RemoteError(type_name, message)
+
+
+def encode_response(response: InferenceResponse) -> bytes:
+    """Encode `response` into the binary format of `DecodedResponse`.
+
+    The sections are packed structured arrays, each starting at a multiple
+    of 8 bytes, so they decode into array views without copying. The pose
+    results may also hold `HumanArray`s rather than lists of `Human`s. The
+    `pairs` of the humans are not encoded, nor are the traceback and the
+    arguments of the error beyond its message.
+    """
+    flags = 0
+    pose_counts = np.zeros(0, dtype=_COUNT_DTYPE)
+    humans = np.zeros(0, dtype=HUMAN_DTYPE)
+    detection_counts = np.zeros(0, dtype=_COUNT_DTYPE)
+    detections = np.zeros(0, dtype=DETECTION_DTYPE)
+    error = b''
+    if response.pose_estimation_results is not None:
+        flags |= _HAS_POSES
+        pose_counts, humans = _human_records(
+            response.pose_estimation_results)
+    if response.object_detections_results is not None:
+        flags |= _HAS_DETECTIONS
+        detection_counts, detections = _detection_records(
+            response.object_detections_results)
+    if response.error is not None:
+        flags |= _HAS_ERROR
+        error = _encode_error(response.error)
+
+    parts = [_HEADER.pack(MAGIC, VERSION, flags, len(pose_counts),
+                          len(humans), len(detection_counts),
+                          len(detections), len(error), 0)]
+    for section in (pose_counts.tobytes(), humans.tobytes(),
+                    detection_counts.tobytes(), detections.tobytes(), error):
+        parts.append(section)
+        parts.append(_padding(len(section)))
+    return b''.join(parts)
+
+
+class DecodedResponse:
+    """An `InferenceResponse` decoded from the bytes of `encode_response`.
+
+    `humans` and `detections` hold the results of every image as read-only
+    views of the buffer, as `HumanArray`s and `DETECTION_DTYPE` records.
+    The `Human`s and `DetectedObject`s of `pose_estimation_results` and
+    `object_detections_results` are only created when first used.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview]) -> None:
+        if len(buffer) < _HEADER.size:
+            raise CodecError('buffer is too short for a header')
+        (magic, version, flags, n_pose_images, n_humans, n_detection_images,
+         n_detections, n_error_bytes, _) = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise CodecError(f'unexpected magic bytes {magic!r}')
+        if version != VERSION:
+            raise CodecError(f'unsupported version {version}')
+
+        offset = _HEADER.size
+
+        def section(dtype: np.dtype, n: int) -> np.ndarray:
+            nonlocal offset
+            n_bytes = dtype.itemsize * n
+            if offset + n_bytes > len(buffer):
+                raise CodecError('buffer is too short for its sections')
+            array = np.frombuffer(buffer, dtype=dtype, count=n,
+                                  offset=offset)
+            offset += n_bytes + len(_padding(n_bytes))
+            return array
+
+        pose_counts = section(_COUNT_DTYPE, n_pose_images)
+        humans = section(HUMAN_DTYPE, n_humans)
+        detection_counts = section(_COUNT_DTYPE, n_detection_images)
+        detections = section(DETECTION_DTYPE, n_detections)
+        error = section(np.dtype('u1'), n_error_bytes)
+        if int(pose_counts.sum()) != n_humans or \
+                int(detection_counts.sum()) != n_detections:
+            raise CodecError('counts do not match the number of records')
+
+        self.humans: Optional[List[HumanArray]] = None
+        self.detections: Optional[List[np.ndarray]] = None
+        self.error: Optional[Exception] = None
+        if flags & _HAS_POSES:
+            all_humans = HumanArray(humans['keypoints'], humans['present'],
+                                    humans['peak_ids'], humans['score'])
+            ends = np.cumsum(pose_counts).tolist()
+            self.humans = [all_humans[start:end]
+                           for start, end in zip([0] + ends, ends)]
+        if flags & _HAS_DETECTIONS:
+            ends = np.cumsum(detection_counts).tolist()
+            self.detections = [detections[start:end]
+                               for start, end in zip([0] + ends, ends)]
+        if flags & _HAS_ERROR:
+            self.error = _decode_error(error.tobytes())
+        self._pose_estimation_results: Optional[
+            List[PoseEstimationResult]] = None
+        self._object_detections_results: Optional[
+            List[ObjectDetectionResult]] = None
+
+    @property
+    def pose_estimation_results(self) -> Optional[List[PoseEstimationResult]]:
+        if self.humans is not None and self._pose_estimation_results is None:
+            self._pose_estimation_results = [humans.to_humans()
+                                             for humans in self.humans]
+        return self._pose_estimation_results
+
+    @property
+    def object_detections_results(self
+                                  ) -> Optional[List[ObjectDetectionResult]]:
+        if self.detections is not None and \
+                self._object_detections_results is None:
+            self._object_detections_results = [
+                [DetectedObject(ID=ID,
+                                bounding_box=BoundingBox(*bbox),
+                                label=Label(label),
+                                confidence=confidence,
+                                verified=verified)
+                 for ID, bbox, confidence, label, verified in zip(
+                     records['ID'].tolist(),
+                     records['bounding_box'].tolist(),
+                     records['confidence'].tolist(),
+                     records['label'].tolist(),
+                     records['verified'].tolist())]
+                for records in self.detections]
+        return self._object_detections_results
+
+    def to_response(self) -> InferenceResponse:
+        return InferenceResponse(
+            pose_estimation_results=self.pose_estimation_results,
+            object_detections_results=self.object_detections_results,
+            error=self.error)
+
+
+def decode_response(buffer: Union[bytes, bytearray, memoryview]
+                    ) -> InferenceResponse:
+    """Decode the bytes of `encode_response` into an `InferenceResponse`."""
+    return DecodedResponse(buffer).to_response()
@@ -0,0 +1,177 @@
+import math
+from enum import Enum
+from typing import Optional
+
+import numpy as np
+
+from paitypes.estimation.HumanArray import N_PARTS, HumanArray
+
+
+class SmoothingFilter(Enum):
+    EMA = 0
+    ONE_EURO = 1
+
+
+def _smoothing_factor(dt: np.ndarray, cutoff: np.ndarray) -> np.ndarray:
+    r = 2.0 * math.pi * cutoff * dt
+    return r / (r + 1.0)
+
+
+class KeypointSmoother:
+    """Temporal smoothing of the keypoints of tracked humans.
+
+    Every coordinate of every part of every track is filtered on its own,
+    either by an exponential moving average with weight `alpha` for the
+    newest value, or by a One-Euro filter, whose cutoff frequency rises from
+    `min_cutoff` by `beta` times the speed of the keypoint, so that slow
+    keypoints are smoothed strongly and fast ones lag little. The state of
+    all tracks is kept in arrays, and every frame is filtered at once.
+
+    A part missing from a frame keeps its state until it is seen again.
+    Tracks missing for more than `max_misses` frames are dropped, as are the
+    tracks missing the longest once there are more than `max_tracks`.
+    """
+
+    def __init__(self,
+                 smoothing_filter: SmoothingFilter = SmoothingFilter.ONE_EURO,
+                 alpha: float = 0.5,
+                 min_cutoff: float = 1.0,
+                 beta: float = 0.0,
+                 d_cutoff: float = 1.0,
+                 max_misses: int = 30,
+                 max_tracks: int = 100) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError('`alpha` must be in (0, 1]')
+        if min_cutoff <= 0.0 or d_cutoff <= 0.0 or beta < 0.0:
+            raise ValueError('cutoffs must be positive, and `beta` '
+                             'non-negative')
+        if max_misses < 0:
+            raise ValueError('`max_misses` must be non-negative')
+        if max_tracks < 1:
+            raise ValueError('`max_tracks` must be positive')
+        self.smoothing_filter = smoothing_filter
+        self.alpha = alpha
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.max_misses = max_misses
+        self.max_tracks = max_tracks
+
+        self._n_updates = 0
+        self._timestamp: Optional[float] = None
+        # Sorted track IDs, and the state of their keypoints
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._values = np.zeros((0, N_PARTS, 2))
+        self._derivatives = np.zeros((0, N_PARTS, 2))
+        self._times = np.zeros((0, N_PARTS))
+        self._is_seen = np.zeros((0, N_PARTS), dtype=bool)
+        self._misses = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def update(self,
+               track_ids: np.ndarray,
+               humans: HumanArray,
+               timestamp: Optional[float] = None) -> HumanArray:
+        """Smooth the keypoints of `humans`, the humans of tracks
+        `track_ids` in the next frame, and return them.
+
+        Timestamps are in seconds, and must increase from frame to frame.
+        Without a timestamp, frames are counted instead, and the cutoffs are
+        in cycles per frame.
+        """
+        track_ids = np.asarray(track_ids, dtype=np.int64)
+        if track_ids.shape != (len(humans),):
+            raise ValueError(f'expected {len(humans)} track IDs, '
+                             f'got {track_ids.shape}')
+        if len(np.unique(track_ids)) != len(track_ids):
+            raise ValueError('track IDs must be unique')
+        if timestamp is None:
+            timestamp = float(self._n_updates)
+        elif self._timestamp is not None and timestamp <= self._timestamp:
+            raise ValueError('timestamps must increase')
+        self._n_updates += 1
+        self._timestamp = timestamp
+
+        rows = self._rows(track_ids)
+        observed = humans.keypoints[:, :, :2].astype(np.float64)
+        present = humans.present
+        is_new = present & ~self._is_seen[rows]
+        previous = self._values[rows]
+        derivative = self._derivatives[rows]
+
+        if self.smoothing_filter == SmoothingFilter.EMA:
+            smoothed = (self.alpha * observed +
+                        (1.0 - self.alpha) * previous)
+        else:
+            # New parts have no time step, and are not filtered anyway
+            dt = np.where(is_new, 1.0,
+                          timestamp - self._times[rows])[:, :, None]
+            a_d = _smoothing_factor(dt, self.d_cutoff)
+            derivative = (a_d * (observed - previous) / dt +
+                          (1.0 - a_d) * derivative)
+            cutoff = self.min_cutoff + self.beta * np.abs(derivative)
+            a = _smoothing_factor(dt, cutoff)
+            smoothed = a * observed + (1.0 - a) * previous
+
+        # The first value of a part is kept as is
+        smoothed = np.where(is_new[:, :, None], observed, smoothed)
+        derivative = np.where(is_new[:, :, None], 0.0, derivative)
+        is_updated = present[:, :, None]
+        self._values[rows] = np.where(is_updated, smoothed, previous)
+        self._derivatives[rows] = np.where(is_updated, derivative,
+                                           self._derivatives[rows])
+        self._times[rows] = np.where(present, timestamp, self._times[rows])
+        self._is_seen[rows] |= present
+        self._misses += 1
+        self._misses[rows] = 0
+        self._drop_tracks()
+
+        keypoints = humans.keypoints.copy()
+        keypoints[:, :, :2] = np.where(is_updated, smoothed, observed)
+        return HumanArray(keypoints, humans.present.copy(),
+                          humans.peak_ids.copy(), humans.scores.copy())
+
+    def _rows(self, track_ids: np.ndarray) -> np.ndarray:
+        """The rows of `track_ids`, adding rows for new tracks."""
+        positions = np.searchsorted(self._ids, track_ids)
+        is_known = np.zeros(len(track_ids), dtype=bool)
+        in_range = positions < len(self._ids)
+        is_known[in_range] = (self._ids[positions[in_range]] ==
+                              track_ids[in_range])
+        if is_known.all():
+            return positions
+
+        n = int((~is_known).sum())
+        ids = np.concatenate([self._ids, track_ids[~is_known]])
+        order = np.argsort(ids, kind='stable')
+        self._ids = ids[order]
+        self._values = np.concatenate(
+            [self._values, np.zeros((n, N_PARTS, 2))])[order]
+        self._derivatives = np.concatenate(
+            [self._derivatives, np.zeros((n, N_PARTS, 2))])[order]
+        self._times = np.concatenate(
+            [self._times, np.zeros((n, N_PARTS))])[order]
+        self._is_seen = np.concatenate(
+            [self._is_seen, np.zeros((n, N_PARTS), dtype=bool)])[order]
+        self._misses = np.concatenate(
+            [self._misses, np.zeros(n, dtype=np.int64)])[order]
+        return np.searchsorted(self._ids, track_ids)
+
+    def _drop_tracks(self) -> None:
+        keep = self._misses <= self.max_misses
+        if keep.sum() > self.max_tracks:
+            kept = np.flatnonzero(keep)
+            order = np.argsort(self._misses[kept], kind='stable')
+            keep[:] = False
+            keep[kept[order[:self.max_tracks]]] = True
+        if keep.all():
+            return
+
+        self._ids = self._ids[keep]
+        self._values = self._values[keep]
+        self._derivatives = self._derivatives[keep]
+        self._times = self._times[keep]
+        self._is_seen = self._is_seen[keep]
+        self._misses = self._misses[keep]
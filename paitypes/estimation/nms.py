@@ -0,0 +1,165 @@
+from dataclasses import replace
+from enum import Enum
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from paitypes.estimation.DetectedObject import DetectedObject
+from paitypes.estimation.InferenceResult import ObjectDetectionResult
+from paitypes.geometry.bounding_box import BoundingBoxArray
+
+
+class NMSMethod(Enum):
+    HARD = 0
+    LINEAR = 1
+    GAUSSIAN = 2
+
+
+def _iou_one_to_many(x_min: np.ndarray,
+                     x_max: np.ndarray,
+                     y_min: np.ndarray,
+                     y_max: np.ndarray,
+                     area: np.ndarray,
+                     i: int,
+                     others: np.ndarray) -> np.ndarray:
+    # Same arithmetic as `get_iou`, for box `i` against the boxes `others`.
+    width = (np.minimum(x_max[i], x_max[others]) -
+             np.maximum(x_min[i], x_min[others]))
+    height = (np.minimum(y_max[i], y_max[others]) -
+              np.maximum(y_min[i], y_min[others]))
+    intersection_area = np.where((width < 0.0) | (height < 0.0),
+                                 0.0, width * height)
+    union_area = area[i] + area[others] - intersection_area
+    iou = np.zeros_like(intersection_area)
+    np.divide(intersection_area, union_area,
+              out=iou, where=union_area != 0.0)
+    return iou
+
+
+def nms_indices(bboxes: BoundingBoxArray,
+                scores: np.ndarray,
+                iou_threshold: float = 0.5,
+                method: NMSMethod = NMSMethod.HARD,
+                sigma: float = 0.5,
+                score_threshold: float = 0.0,
+                top_k: Optional[int] = None
+                ) -> Tuple[np.ndarray, np.ndarray]:
+    """Non-maximum suppression over `bboxes`, ignoring labels.
+
+    Returns the indices of the kept boxes, ordered by descending score, and
+    their scores. Boxes scoring `score_threshold` or less are never kept.
+    Hard NMS drops every box overlapping a kept box by more than
+    `iou_threshold`. Soft-NMS instead decays the scores of overlapping boxes,
+    linearly by `1 - iou` for overlaps above `iou_threshold` or by
+    `exp(-iou² / sigma)`, and drops them once their score falls to
+    `score_threshold`.
+
+    Each iteration is vectorized over the remaining candidates, so the cost is
+    O(K·N) NumPy work for K kept boxes rather than O(N²) Python calls. Ties in
+    score are broken by the original order.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.shape != (len(bboxes),):
+        raise ValueError('`scores` must have one entry per bbox')
+    if sigma <= 0.0:
+        raise ValueError('`sigma` must be positive')
+    if top_k is not None and top_k < 0:
+        raise ValueError('`top_k` must be non-negative')
+
+    max_kept = len(bboxes) if top_k is None else min(top_k, len(bboxes))
+    x_min, x_max = bboxes.x_min, bboxes.x_max
+    y_min, y_max = bboxes.y_min, bboxes.y_max
+    area = bboxes.area
+
+    kept: List[int] = []
+    kept_scores: List[float] = []
+
+    if method == NMSMethod.HARD:
+        order = np.argsort(-scores, kind='stable')
+        order = order[scores[order] > score_threshold]
+        while order.size > 0 and len(kept) < max_kept:
+            i, order = order[0], order[1:]
+            kept.append(int(i))
+            kept_scores.append(float(scores[i]))
+            iou = _iou_one_to_many(x_min, x_max, y_min, y_max, area, i, order)
+            order = order[iou <= iou_threshold]
+    else:
+        candidates = np.flatnonzero(scores > score_threshold)
+        current = scores[candidates]
+        while candidates.size > 0 and len(kept) < max_kept:
+            best = int(np.argmax(current))
+            i = candidates[best]
+            kept.append(int(i))
+            kept_scores.append(float(current[best]))
+            candidates = np.delete(candidates, best)
+            current = np.delete(current, best)
+
+            iou = _iou_one_to_many(x_min, x_max, y_min, y_max, area, i,
+                                   candidates)
+            if method == NMSMethod.LINEAR:
+                current = np.where(iou > iou_threshold,
+                                   current * (1.0 - iou), current)
+            else:
+                current = current * np.exp(-(iou * iou) / sigma)
+
+            alive = current > score_threshold
+            candidates, current = candidates[alive], current[alive]
+
+    return (np.array(kept, dtype=np.intp),
+            np.array(kept_scores, dtype=np.float64))
+
+
+def non_max_suppression(detections: ObjectDetectionResult,
+                        iou_threshold: float = 0.5,
+                        method: NMSMethod = NMSMethod.HARD,
+                        sigma: float = 0.5,
+                        score_threshold: float = 0.0,
+                        top_k: Optional[int] = None,
+                        class_aware: bool = True
+                        ) -> ObjectDetectionResult:
+    """Suppress overlapping `detections`, separately for every `Label`.
+
+    See `nms_indices` for the meaning of the parameters. `top_k` limits the
+    total number of returned detections. The result is ordered by descending
+    confidence. Kept detections are returned as they are for hard NMS, and as
+    copies with the decayed confidence (and the same `ID`) for soft-NMS.
+    """
+    if not detections:
+        return []
+
+    bboxes = BoundingBoxArray.from_bboxes(
+        [detection.bounding_box for detection in detections])
+    scores = np.array([detection.confidence for detection in detections],
+                      dtype=np.float64)
+
+    if class_aware:
+        labels = np.array([detection.label.value
+                           for detection in detections])
+        groups = [np.flatnonzero(labels == label)
+                  for label in np.unique(labels)]
+    else:
+        groups = [np.arange(len(detections))]
+
+    kept_indices = []
+    kept_scores = []
+    for group in groups:
+        kept, group_scores = nms_indices(bboxes[group], scores[group],
+                                         iou_threshold=iou_threshold,
+                                         method=method,
+                                         sigma=sigma,
+                                         score_threshold=score_threshold,
+                                         top_k=top_k)
+        kept_indices.append(group[kept])
+        kept_scores.append(group_scores)
+
+    indices = np.concatenate(kept_indices)
+    new_scores = np.concatenate(kept_scores)
+    order = np.argsort(-new_scores, kind='stable')[:top_k]
+
+    result: List[DetectedObject] = []
+    for i, score in zip(indices[order].tolist(), new_scores[order].tolist()):
+        detection = detections[i]
+        if method != NMSMethod.HARD and score != detection.confidence:
+            detection = replace(detection, confidence=score)
+        result.append(detection)
+    return result
@@ -14,6 +14,9 @@ class Pair:
     Two `BodyPart`s combined to form an edge in the `Human`'s skeleton.
     """
 
+    __slots__ = ('idx1', 'idx2', 'part_idx1', 'part_idx2', 'coord1', 'coord2',
+                 'score')
+
     def __init__(self, idx1: int, idx2: int, part_idx1: int, part_idx2: int,
                  coord1: Tuple[float, float], coord2: Tuple[float, float],
                  score: float) -> None:
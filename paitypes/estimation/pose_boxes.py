@@ -0,0 +1,187 @@
+import math
+from typing import Tuple
+
+import numpy as np
+
+from paitypes.estimation.HumanArray import HumanArray
+from paitypes.estimation.pose import CocoPart
+from paitypes.geometry.bounding_box import BoundingBoxArray
+
+# `Human.get_upper_body_box` uses these part indices
+_UPPER_BODY_PARTS = [0, 1, 2, 5, 8, 11, 14, 15, 16, 17]
+
+
+def _round(v: np.ndarray) -> np.ndarray:
+    # Like `pose._round`, `np.round` rounds halves to even
+    return np.round(v)
+
+
+def _fit_into_frame(x: np.ndarray, y: np.ndarray,
+                    x2: np.ndarray, y2: np.ndarray,
+                    img_w: float, img_h: float
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                               np.ndarray, np.ndarray]:
+    x = np.maximum(0, x)
+    y = np.maximum(0, y)
+    x2 = np.minimum(img_w - x, x2 - x) + x
+    y2 = np.minimum(img_h - y, y2 - y) + y
+    is_valid = (_round(x2 - x) != 0.0) & (_round(y2 - y) != 0.0)
+    return x, y, x2, y2, is_valid
+
+
+def _to_bboxes(xywh: np.ndarray, centered: bool) -> BoundingBoxArray:
+    x, y, w, h = xywh.astype(np.float64).T
+    if centered:
+        return BoundingBoxArray(np.stack([x - w / 2.0, x + w / 2.0,
+                                          y - h / 2.0, y + h / 2.0], axis=1))
+    return BoundingBoxArray(np.stack([x, x + w, y, y + h], axis=1))
+
+
+def tfpose_face_boxes(humans: HumanArray,
+                      img_w: float,
+                      img_h: float,
+                      mode: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """`Human.get_face_box` of all humans at once.
+
+    Returns the `x`, `y`, `w` and `h` values of the dictionaries as a P×4
+    integer array, and a mask of the humans that have a face box; the rows
+    of the others are zero.
+    """
+    keypoints = humans.keypoints.astype(np.float64)
+    found = humans.present & (keypoints[:, :, 2] > 0.2)
+    px, py = keypoints[:, :, 0], keypoints[:, :, 1]
+
+    def part(p: CocoPart) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return found[:, p.value], px[:, p.value], py[:, p.value]
+
+    is_nose, nose_x, nose_y = part(CocoPart.Nose)
+    is_neck, neck_x, neck_y = part(CocoPart.Neck)
+    is_reye, reye_x, reye_y = part(CocoPart.REye)
+    is_leye, leye_x, leye_y = part(CocoPart.LEye)
+    is_rear, rear_x, _ = part(CocoPart.REar)
+    is_lear, lear_x, _ = part(CocoPart.LEar)
+
+    size = np.zeros(len(humans))
+    size = np.where(is_neck,
+                    np.maximum(size, img_h * (neck_y - nose_y) * 0.8), size)
+    is_eyes = is_reye & is_leye
+    eye_dx, eye_dy = reye_x - leye_x, reye_y - leye_y
+    size = np.where(is_eyes, np.maximum(size, img_w * eye_dx * 2.0), size)
+    # Python's `**` rounds differently from NumPy's square in rare cases
+    eye_distance = np.zeros(len(humans))
+    eye_distance[is_eyes] = [math.sqrt(dx ** 2 + dy ** 2) for dx, dy in
+                             zip(eye_dx[is_eyes].tolist(),
+                                 eye_dy[is_eyes].tolist())]
+    size = np.where(is_eyes,
+                    np.maximum(size, img_w * eye_distance * 2.0), size)
+    is_ears = is_rear & is_lear
+    size = np.where(is_ears,
+                    np.maximum(size, img_w * (rear_x - lear_x) * 1.6), size)
+
+    is_valid = is_nose & (size > 0)
+    if mode == 1:
+        is_valid &= is_reye | is_leye
+
+    x = np.where(~is_reye & is_leye, nose_x * img_w - (size // 3 * 2),
+                 np.where(is_reye & ~is_leye, nose_x * img_w - (size // 3),
+                          nose_x * img_w - size // 2))
+    x2 = x + size
+    if mode == 0:
+        y = nose_y * img_h - size // 3
+    else:
+        y = nose_y * img_h - _round(size / 2 * 1.2)
+    y2 = y + size
+
+    x, y, x2, y2, is_fit = _fit_into_frame(x, y, x2, y2, img_w, img_h)
+    is_valid &= is_fit
+    if mode == 0:
+        xywh = np.stack([_round((x + x2) / 2), _round((y + y2) / 2),
+                         _round(x2 - x), _round(y2 - y)], axis=1)
+    else:
+        xywh = np.stack([_round(x), _round(y),
+                         _round(x2 - x), _round(y2 - y)], axis=1)
+    xywh[~is_valid] = 0
+    return xywh.astype(np.int64), is_valid
+
+
+def face_boxes(humans: HumanArray,
+               img_w: float,
+               img_h: float,
+               mode: int = 0) -> Tuple[BoundingBoxArray, np.ndarray]:
+    """The face boxes of `tfpose_face_boxes`, and which humans have one.
+
+    For `mode=0`, the boxes equal
+    `BoundingBox.from_tfpose_dict(human.get_face_box(img_w, img_h))`. For
+    `mode=1`, whose `x` and `y` are the top left corner rather than the
+    center, they are the boxes that dictionary describes.
+    """
+    xywh, is_valid = tfpose_face_boxes(humans, img_w, img_h, mode)
+    return _to_bboxes(xywh, centered=mode == 0), is_valid
+
+
+def tfpose_upper_body_boxes(humans: HumanArray,
+                            img_w: float,
+                            img_h: float) -> Tuple[np.ndarray, np.ndarray]:
+    """`Human.get_upper_body_box` of all humans at once.
+
+    Returns the `x`, `y`, `w` and `h` values of the dictionaries as a P×4
+    integer array, and a mask of the humans that have an upper body box; the
+    rows of the others are zero.
+    """
+    if not (img_w > 0 and img_h > 0):
+        raise ValueError("img size should be positive")
+
+    keypoints = humans.keypoints.astype(np.float64)
+    found = humans.present & (keypoints[:, :, 2] > 0.3)
+    px, py = keypoints[:, :, 0], keypoints[:, :, 1]
+
+    def part(p: CocoPart) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return found[:, p.value], px[:, p.value], py[:, p.value]
+
+    in_box = found[:, _UPPER_BODY_PARTS]
+    box_x = img_w * px[:, _UPPER_BODY_PARTS]
+    box_y = img_h * py[:, _UPPER_BODY_PARTS]
+    is_valid = in_box.sum(axis=1) >= 5
+    x = np.where(in_box, box_x, np.inf).min(axis=1)
+    y = np.where(in_box, box_y, np.inf).min(axis=1)
+    x2 = np.where(in_box, box_x, -np.inf).max(axis=1)
+    y2 = np.where(in_box, box_y, -np.inf).max(axis=1)
+
+    is_nose, _, _ = part(CocoPart.Nose)
+    is_neck, neck_x, neck_y = part(CocoPart.Neck)
+    is_rshoulder, rshoulder_x, _ = part(CocoPart.RShoulder)
+    is_lshoulder, lshoulder_x, _ = part(CocoPart.LShoulder)
+
+    y = np.where(is_nose & is_neck, y - (neck_y * img_h - y) * 0.8, y)
+
+    is_shoulders = is_rshoulder & is_lshoulder
+    dx = (x2 - x) * 0.15
+    x, x2 = np.where(is_shoulders, x - dx, x), np.where(is_shoulders,
+                                                        x2 + dx, x2)
+    for is_one_shoulder, shoulder_x in (
+            (is_neck & ~is_shoulders & is_lshoulder, lshoulder_x),
+            (is_neck & ~is_shoulders & is_rshoulder, rshoulder_x)):
+        half_w = np.abs(shoulder_x - neck_x) * img_w * 1.15
+        x = np.where(is_one_shoulder,
+                     np.minimum(neck_x * img_w - half_w, x), x)
+        x2 = np.where(is_one_shoulder,
+                      np.maximum(neck_x * img_w + half_w, x2), x2)
+
+    with np.errstate(invalid='ignore'):
+        x, y, x2, y2, is_fit = _fit_into_frame(x, y, x2, y2, img_w, img_h)
+        is_valid &= is_fit
+        xywh = np.stack([_round((x + x2) / 2), _round((y + y2) / 2),
+                         _round(x2 - x), _round(y2 - y)], axis=1)
+    xywh[~is_valid] = 0
+    return xywh.astype(np.int64), is_valid
+
+
+def upper_body_boxes(humans: HumanArray,
+                     img_w: float,
+                     img_h: float) -> Tuple[BoundingBoxArray, np.ndarray]:
+    """The upper body boxes of `tfpose_upper_body_boxes`, equal to
+    `BoundingBox.from_tfpose_dict(human.get_upper_body_box(img_w, img_h))`,
+    and which humans have one.
+    """
+    xywh, is_valid = tfpose_upper_body_boxes(humans, img_w, img_h)
+    return _to_bboxes(xywh, centered=True), is_valid
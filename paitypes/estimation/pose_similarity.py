@@ -0,0 +1,115 @@
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from paitypes.estimation.HumanArray import HumanArray
+from paitypes.estimation.pose import Human
+
+# The COCO keypoint sigmas, in `CocoPart` order. COCO has no neck, which
+# takes the sigma of the shoulders.
+COCO_SIGMAS = np.array([0.026, 0.025, 0.025, 0.035, 0.035, 0.079, 0.079,
+                        0.072, 0.072, 0.062, 0.062, 0.107, 0.107, 0.087,
+                        0.087, 0.089, 0.089, 0.079])
+
+Humans = Union[HumanArray, Sequence[Human]]
+
+
+def _as_human_array(humans: Humans) -> HumanArray:
+    if isinstance(humans, HumanArray):
+        return humans
+    return HumanArray.from_humans(humans, dtype=np.float64)
+
+
+def _pixels(humans: HumanArray, img_w: float, img_h: float) -> np.ndarray:
+    return humans.keypoints[:, :, :2].astype(np.float64) * [img_w, img_h]
+
+
+def _pair_distances(humans1: HumanArray,
+                    humans2: HumanArray,
+                    img_w: float,
+                    img_h: float) -> Tuple[np.ndarray, np.ndarray]:
+    """The P×Q×18 squared distances of the parts of all pairs of humans,
+    and which parts both humans of a pair have.
+    """
+    xy1 = _pixels(humans1, img_w, img_h)
+    xy2 = _pixels(humans2, img_w, img_h)
+    squared_distances = ((xy1[:, None] - xy2[None]) ** 2).sum(axis=3)
+    in_both = humans1.present[:, None] & humans2.present[None]
+    return squared_distances, in_both
+
+
+def keypoint_areas(humans: Humans,
+                   img_w: float = 1.0,
+                   img_h: float = 1.0) -> np.ndarray:
+    """The areas of the boxes around the parts of every human, in pixels."""
+    humans = _as_human_array(humans)
+    xy = _pixels(humans, img_w, img_h)
+    present = humans.present[:, :, None]
+    low = np.where(present, xy, np.inf).min(axis=1)
+    high = np.where(present, xy, -np.inf).max(axis=1)
+    sides = np.where(humans.present.any(axis=1)[:, None], high - low, 0.0)
+    return sides.prod(axis=1)
+
+
+def oks_matrix(humans1: Humans,
+               humans2: Humans,
+               img_w: float = 1.0,
+               img_h: float = 1.0,
+               sigmas: np.ndarray = COCO_SIGMAS,
+               areas: Optional[np.ndarray] = None) -> np.ndarray:
+    """The Object Keypoint Similarity of all pairs of humans, as a P×Q
+    matrix.
+
+    As in the COCO evaluation, the humans of `humans1` are the reference:
+    the similarities of the parts both humans have are averaged over all
+    parts of the reference, such that parts missing from the other human
+    count as 0, and the reference `areas` default to `keypoint_areas`.
+    Pairs without common parts have an OKS of 0. Keypoints are scaled to
+    pixels by `img_w` and `img_h`, as are the areas.
+    """
+    humans1, humans2 = _as_human_array(humans1), _as_human_array(humans2)
+    if areas is None:
+        areas = keypoint_areas(humans1, img_w, img_h)
+    squared_distances, in_both = _pair_distances(humans1, humans2,
+                                                 img_w, img_h)
+    variances = (2.0 * np.asarray(sigmas)) ** 2
+    e = (squared_distances / variances /
+         (np.asarray(areas)[:, None, None] + np.spacing(1)) / 2.0)
+    n_parts = humans1.present.sum(axis=1)[:, None]
+    similarity = np.where(in_both, np.exp(-e), 0.0).sum(axis=2)
+    return similarity / np.maximum(n_parts, 1)
+
+
+def mean_keypoint_distance_matrix(humans1: Humans,
+                                  humans2: Humans,
+                                  img_w: float = 1.0,
+                                  img_h: float = 1.0) -> np.ndarray:
+    """The mean distance between the common parts of all pairs of humans,
+    as a P×Q matrix. Pairs without common parts are infinitely far apart.
+    """
+    humans1, humans2 = _as_human_array(humans1), _as_human_array(humans2)
+    squared_distances, in_both = _pair_distances(humans1, humans2,
+                                                 img_w, img_h)
+    n_parts = in_both.sum(axis=2)
+    total = np.where(in_both, np.sqrt(squared_distances), 0.0).sum(axis=2)
+    return np.where(n_parts > 0, total / np.maximum(n_parts, 1), np.inf)
+
+
+def oks_cost(humans1: Humans, humans2: Humans) -> np.ndarray:
+    """`1 - oks_matrix` of normalized keypoints, for `vectorized`
+    `linear_sum_match`. Pairs without common parts cost infinitely much,
+    so they are left out by any `max_cost`. For other image sizes or
+    sigmas, pass a function computing the cost with those instead.
+    """
+    humans1, humans2 = _as_human_array(humans1), _as_human_array(humans2)
+    shared = (humans1.present[:, None] & humans2.present[None]).any(axis=2)
+    return np.where(shared, 1.0 - oks_matrix(humans1, humans2), np.inf)
+
+
+def mean_keypoint_distance_cost(humans1: Humans,
+                                humans2: Humans) -> np.ndarray:
+    """`mean_keypoint_distance_matrix` of normalized keypoints, for
+    `vectorized` `linear_sum_match`. Pairs without common parts cost
+    infinitely much, so pass a `max_cost` to leave them out.
+    """
+    return mean_keypoint_distance_matrix(humans1, humans2)
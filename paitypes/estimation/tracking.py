@@ -0,0 +1,226 @@
+from enum import Enum
+from typing import List, Optional
+
+import numpy as np
+from dataclasses import dataclass
+from scipy import sparse
+
+from paitypes.common.optimization import (gated_linear_sum_assignment,
+                                          sparse_iou_cost)
+from paitypes.estimation.DetectedObject import DetectedObject, Label
+from paitypes.estimation.InferenceResult import ObjectDetectionResult
+from paitypes.geometry.Vector import Vector
+from paitypes.geometry.bounding_box import (BoundingBox, BoundingBoxArray,
+                                            center_distance_matrix)
+
+
+class AssociationCost(Enum):
+    IOU = 0
+    CENTER_DISTANCE = 1
+
+
+@dataclass
+class Track:
+    ID: int
+    bounding_box: BoundingBox
+    label: Label
+    velocity: Vector
+    age: int
+    hits: int
+    misses: int
+
+
+class Tracker:
+    """Frame-to-frame multi-object tracker assigning persistent `ID`s.
+
+    Every track moves its box with a constant velocity, estimated from its
+    past matches and smoothed by `momentum`. The predicted boxes are matched
+    to the detections of the next frame by `gated_linear_sum_assignment`,
+    never matching pairs costing more than `max_cost`: `1 - IoU` for
+    `AssociationCost.IOU`, 0.7 by default, or the distance between the box
+    centers in pixels for `AssociationCost.CENTER_DISTANCE`, which depends
+    on the image size and has no default. Tracks and detections with
+    different labels are never matched if `class_aware` is set.
+
+    Unmatched detections start new tracks. Tracks missing for more than
+    `max_misses` frames are dropped, as are the tracks missing the longest
+    once there are more than `max_tracks`. The state of all tracks is kept in
+    arrays, so IoU costs take O(N) work per frame for N spread out objects.
+    """
+
+    def __init__(self,
+                 cost: AssociationCost = AssociationCost.IOU,
+                 max_cost: Optional[float] = None,
+                 max_misses: int = 5,
+                 max_tracks: int = 1000,
+                 min_hits: int = 1,
+                 momentum: float = 0.5,
+                 class_aware: bool = True) -> None:
+        if max_cost is None:
+            if cost != AssociationCost.IOU:
+                raise ValueError(
+                    f'`max_cost` is required for {cost}, in pixels')
+            max_cost = 0.7
+        if max_misses < 0:
+            raise ValueError('`max_misses` must be non-negative')
+        if max_tracks < 1:
+            raise ValueError('`max_tracks` must be positive')
+        if not 0.0 <= momentum < 1.0:
+            raise ValueError('`momentum` must be in [0, 1)')
+        self.cost = cost
+        self.max_cost = max_cost
+        self.max_misses = max_misses
+        self.max_tracks = max_tracks
+        self.min_hits = min_hits
+        self.momentum = momentum
+        self.class_aware = class_aware
+
+        self._next_id = 0
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._boxes = BoundingBoxArray.zeros(0)
+        self._velocities = np.zeros((0, 2))
+        self._labels = np.zeros(0, dtype=np.int64)
+        self._ages = np.zeros(0, dtype=np.int64)
+        self._hits = np.zeros(0, dtype=np.int64)
+        self._misses = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def tracks(self) -> List[Track]:
+        return [Track(ID=int(track_id),
+                      bounding_box=bbox,
+                      label=Label(label),
+                      velocity=Vector(vx, vy),
+                      age=age,
+                      hits=hits,
+                      misses=misses)
+                for track_id, bbox, label, (vx, vy), age, hits, misses
+                in zip(self._ids.tolist(),
+                       self._boxes.to_bboxes(),
+                       self._labels.tolist(),
+                       self._velocities.tolist(),
+                       self._ages.tolist(),
+                       self._hits.tolist(),
+                       self._misses.tolist())]
+
+    def predict(self) -> BoundingBoxArray:
+        """The boxes of all tracks, moved one frame ahead."""
+        return BoundingBoxArray(self._boxes.data +
+                                self._velocities[:, [0, 0, 1, 1]])
+
+    def _cost_matrix(self,
+                     predicted: BoundingBoxArray,
+                     detected: BoundingBoxArray,
+                     labels: np.ndarray) -> sparse.coo_matrix:
+        if self.cost == AssociationCost.IOU:
+            cost_matrix = sparse_iou_cost(predicted, detected).tocoo()
+        else:
+            distances = center_distance_matrix(predicted, detected)
+            rows, cols = np.nonzero(distances <= self.max_cost)
+            cost_matrix = sparse.coo_matrix(
+                (distances[rows, cols], (rows, cols)),
+                shape=distances.shape)
+        if self.class_aware:
+            same_label = (self._labels[cost_matrix.row] ==
+                          labels[cost_matrix.col])
+            cost_matrix = sparse.coo_matrix(
+                (cost_matrix.data[same_label],
+                 (cost_matrix.row[same_label], cost_matrix.col[same_label])),
+                shape=cost_matrix.shape)
+        return cost_matrix
+
+    def update(self, detections: ObjectDetectionResult
+               ) -> ObjectDetectionResult:
+        """Match `detections` to the tracks, and return them with the `ID` of
+        their track, in their order and with the same `bounding_box`.
+
+        Detections are left out if their track has fewer than `min_hits`
+        matches, or if they start a new track that is dropped at once since
+        there are more than `max_tracks`. The result is then shorter than
+        `detections`, so do not `zip` the two.
+        """
+        detected = BoundingBoxArray.from_bboxes(
+            [detection.bounding_box for detection in detections])
+        labels = np.array([detection.label.value for detection in detections],
+                          dtype=np.int64)
+
+        predicted = self.predict()
+        track_idxs, detection_idxs = gated_linear_sum_assignment(
+            self._cost_matrix(predicted, detected, labels), self.max_cost)
+
+        # Matched tracks take the detected box and update their velocity
+        # with the observed motion of the box center
+        motion = (detected[detection_idxs].center.xy -
+                  self._boxes[track_idxs].center.xy)
+        self._velocities[track_idxs] = (
+            self.momentum * self._velocities[track_idxs] +
+            (1.0 - self.momentum) * motion)
+        is_matched = np.zeros(len(self), dtype=bool)
+        is_matched[track_idxs] = True
+        boxes = predicted.data
+        boxes[track_idxs] = detected.data[detection_idxs]
+        self._boxes = BoundingBoxArray(boxes)
+        self._ages += 1
+        self._hits[track_idxs] += 1
+        self._misses = np.where(is_matched, 0, self._misses + 1)
+
+        is_new = np.ones(len(detections), dtype=bool)
+        is_new[detection_idxs] = False
+        new_idxs = np.flatnonzero(is_new)
+        track_positions = np.zeros(len(detections), dtype=np.intp)
+        track_positions[detection_idxs] = track_idxs
+        track_positions[new_idxs] = len(self) + np.arange(len(new_idxs))
+        self._add_tracks(detected.data[new_idxs], labels[new_idxs])
+
+        track_ids = self._ids[track_positions].tolist()
+        hits = self._hits[track_positions].tolist()
+        alive = self._drop_tracks()[track_positions].tolist()
+
+        return [DetectedObject(ID=track_id,
+                               bounding_box=detection.bounding_box,
+                               label=detection.label,
+                               confidence=detection.confidence,
+                               verified=detection.verified)
+                for detection, track_id, n_hits, is_alive
+                in zip(detections, track_ids, hits, alive)
+                if is_alive and n_hits >= self.min_hits]
+
+    def _add_tracks(self, boxes: np.ndarray, labels: np.ndarray) -> None:
+        n = len(boxes)
+        self._ids = np.concatenate(
+            [self._ids, np.arange(self._next_id, self._next_id + n)])
+        self._next_id += n
+        self._boxes = BoundingBoxArray(
+            np.concatenate([self._boxes.data, boxes]))
+        self._velocities = np.concatenate([self._velocities,
+                                           np.zeros((n, 2))])
+        self._labels = np.concatenate([self._labels, labels])
+        self._ages = np.concatenate([self._ages,
+                                     np.ones(n, dtype=np.int64)])
+        self._hits = np.concatenate([self._hits, np.ones(n, dtype=np.int64)])
+        self._misses = np.concatenate([self._misses,
+                                       np.zeros(n, dtype=np.int64)])
+
+    def _drop_tracks(self) -> np.ndarray:
+        """Drop the stale tracks, and return which tracks were kept."""
+        keep = self._misses <= self.max_misses
+        if keep.sum() > self.max_tracks:
+            # Keep the tracks missing for the shortest time, and among those
+            # the ones matched most often
+            kept = np.flatnonzero(keep)
+            order = np.lexsort((-self._hits[kept], self._misses[kept]))
+            keep[:] = False
+            keep[kept[order[:self.max_tracks]]] = True
+        if keep.all():
+            return keep
+
+        self._ids = self._ids[keep]
+        self._boxes = self._boxes[keep]
+        self._velocities = self._velocities[keep]
+        self._labels = self._labels[keep]
+        self._ages = self._ages[keep]
+        self._hits = self._hits[keep]
+        self._misses = self._misses[keep]
+        return keep
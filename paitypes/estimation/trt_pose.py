@@ -0,0 +1,72 @@
+from typing import List, Optional
+
+import numpy as np
+
+from paitypes.estimation.HumanArray import N_PARTS, HumanArray
+from paitypes.estimation.InferenceResult import PoseEstimationResult
+
+
+def parse_trt_pose(counts: np.ndarray,
+                   objects: np.ndarray,
+                   peaks: np.ndarray,
+                   peak_scores: Optional[np.ndarray] = None,
+                   dtype: np.dtype = np.float32) -> List[HumanArray]:
+    """The humans of every image of a batch of trt_pose `ParseObjects`
+    outputs.
+
+    `counts` holds the number of humans of each of the B images, `objects`
+    the B×M×18 peak index of every part of every human, or -1 if absent, and
+    `peaks` the B×18×K×2 normalized `(y, x)` of every peak. `peak_scores`
+    are the B×18×K scores of the peaks, 1.0 if not given.
+
+    Returns a `HumanArray` for every image; they are views of one array
+    holding the humans of the whole batch.
+    """
+    counts = np.asarray(counts)
+    objects = np.asarray(objects)
+    peaks = np.asarray(peaks)
+    n_images, max_objects = objects.shape[:2]
+    if objects.shape != (n_images, max_objects, N_PARTS) or \
+            counts.shape != (n_images,) or peaks.ndim != 4 or \
+            peaks.shape[:2] != (n_images, N_PARTS) or peaks.shape[3] != 2:
+        raise ValueError(
+            f'expected arrays of shape (B,), (B, M, {N_PARTS}) and '
+            f'(B, {N_PARTS}, K, 2), got {counts.shape}, {objects.shape} and '
+            f'{peaks.shape}')
+    if peak_scores is not None and \
+            np.shape(peak_scores) != peaks.shape[:3]:
+        raise ValueError(f'expected peak scores of shape {peaks.shape[:3]}, '
+                         f'got {np.shape(peak_scores)}')
+
+    counts = np.clip(counts, 0, max_objects)
+    is_human = np.arange(max_objects) < counts[:, None]
+    image = np.nonzero(is_human)[0][:, None]
+    peak_ids = objects[is_human].astype(np.int32)
+    present = peak_ids >= 0
+    part = np.arange(N_PARTS)
+    peak = np.where(present, peak_ids, 0)
+
+    humans = HumanArray.zeros(len(peak_ids), dtype)
+    coords = peaks[image, part, peak]
+    humans.keypoints[:, :, 0] = coords[:, :, 1]
+    humans.keypoints[:, :, 1] = coords[:, :, 0]
+    humans.keypoints[:, :, 2] = (1.0 if peak_scores is None else
+                                 np.asarray(peak_scores)[image, part, peak])
+    humans.keypoints[~present] = 0.0
+    humans.present[...] = present
+    humans.peak_ids[...] = peak_ids
+    humans.peak_ids[~present] = -1
+
+    ends = np.cumsum(counts).tolist()
+    return [humans[start:end] for start, end in zip([0] + ends, ends)]
+
+
+def parse_trt_pose_humans(counts: np.ndarray,
+                          objects: np.ndarray,
+                          peaks: np.ndarray,
+                          peak_scores: Optional[np.ndarray] = None
+                          ) -> List[PoseEstimationResult]:
+    """The `Human`s of every image of `parse_trt_pose`."""
+    return [humans.to_humans() for humans in
+            parse_trt_pose(counts, objects, peaks, peak_scores,
+                           dtype=np.float64)]
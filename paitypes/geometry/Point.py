@@ -36,4 +36,6 @@ class PointEstimate(Point):
         )
 
     def __iter__(self) -> Iterator[float]:
-        yield from [getattr(self, x) for x in vars(self)]
+        yield self.x
+        yield self.y
+        yield self.confidence
@@ -0,0 +1,147 @@
+from typing import (Generic, Iterator, List, Sequence, Tuple, TypeVar,
+                    Union, overload)
+
+import numpy as np
+
+from paitypes.common.DataError import DataError
+from paitypes.geometry.Point import Point, PointEstimate
+from paitypes.geometry.Shape import Shape
+
+
+PointT = TypeVar('PointT', bound=Point)
+
+
+class PointArrayError(DataError):
+    pass
+
+
+class PointArray(Generic[PointT]):
+    """N points stored as a single N×2 float64 array of `(x, y)` rows.
+
+    The array counterpart of `Point`. Wrapping an existing float64 array does
+    not copy it, and `x`/`y` are views into `data`. `PointT` is the type of
+    the points it is built from, see `PointEstimateArray`.
+    """
+
+    __slots__ = ('data',)
+
+    _columns = 2
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != self._columns:
+            raise PointArrayError(
+                f'expected an array of shape (N, {self._columns}), '
+                f'got {data.shape}')
+        self.data = data
+
+    @classmethod
+    def from_points(cls, points: Sequence[PointT]) -> 'PointArray[PointT]':
+        if not points:
+            return cls(np.zeros((0, cls._columns)))
+        return cls(np.array([(p.x, p.y) for p in points], dtype=np.float64))
+
+    def to_points(self) -> List[Point]:
+        return [Point(x, y) for x, y in self.data.tolist()]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def xy(self) -> np.ndarray:
+        return self.data[:, :2]
+
+    def translate(self, translation: Shape) -> 'PointArray':
+        data = self.data.copy()
+        data[:, 0] += translation.width
+        data[:, 1] += translation.height
+        return type(self)(data)
+
+    def distance_to_point(self, other_point: Point) -> np.ndarray:
+        """Distance of every point to `other_point`."""
+        x_distance = (self.x - other_point.x) ** 2
+        y_distance = (self.y - other_point.y) ** 2
+        return np.sqrt(x_distance + y_distance)
+
+    def distance_matrix(self, other: 'PointArray') -> np.ndarray:
+        """M×N matrix of `self[i].distance_to_point(other[j])`."""
+        x_distance = (self.x[:, None] - other.x[None, :]) ** 2
+        y_distance = (self.y[:, None] - other.y[None, :]) ** 2
+        return np.sqrt(x_distance + y_distance)
+
+    def nearest(self, other: 'PointArray') -> Tuple[np.ndarray, np.ndarray]:
+        """For every point, the index of and distance to its nearest point in
+        `other`. Ties go to the lower index.
+        """
+        if len(other) == 0:
+            raise PointArrayError('no points to search')
+        distances = self.distance_matrix(other)
+        indices = np.argmin(distances, axis=1)
+        return indices, distances[np.arange(len(self)), indices]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.to_points())
+
+    @overload
+    def __getitem__(self, index: int) -> Point:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> 'PointArray':
+        ...
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]
+                    ) -> Union[Point, 'PointArray']:
+        if isinstance(index, (int, np.integer)):
+            return self.to_point(int(index))
+        return type(self)(self.data[index])
+
+    def to_point(self, index: int) -> Point:
+        return Point(*self.data[index].tolist())
+
+    def __str__(self) -> str:
+        return '({}: {} points)'.format(type(self).__name__, len(self))
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__name__, self.data)
+
+
+class PointEstimateArray(PointArray[PointEstimate]):
+    """N point estimates stored as an N×3 array of `(x, y, confidence)`."""
+
+    __slots__ = ()
+
+    _columns = 3
+
+    @classmethod
+    def from_points(cls, points: Sequence[PointEstimate]
+                    ) -> 'PointEstimateArray':
+        if not points:
+            return cls(np.zeros((0, cls._columns)))
+        return cls(np.array([(p.x, p.y, p.confidence) for p in points],
+                            dtype=np.float64))
+
+    def to_points(self) -> List[Point]:
+        return [PointEstimate(x, y, confidence)
+                for x, y, confidence in self.data.tolist()]
+
+    def to_point(self, index: int) -> Point:
+        return PointEstimate(*self.data[index].tolist())
+
+    @property
+    def confidence(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    def filter_by_confidence(self, min_confidence: float
+                             ) -> 'PointEstimateArray':
+        """The points with a confidence of at least `min_confidence`."""
+        return PointEstimateArray(
+            self.data[self.confidence >= min_confidence])
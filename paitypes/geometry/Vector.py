@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 from dataclasses import dataclass
 from paitypes.geometry.Point import Point
@@ -13,17 +15,27 @@ class Vector:
         return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
 
     def __sub__(self, other: 'Vector') -> 'Vector':
-        return self + (-other)
+        return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
 
     def __neg__(self) -> 'Vector':
         return Vector(-self.x, -self.y, -self.z)
 
+    # `cross`, `dot` and `norm` avoid NumPy, which is slower than plain
+    # arithmetic for a single 3-vector. Use `VectorArray` for batches.
     def cross(self, other: 'Vector') -> 'Vector':
-        return Vector.from_np_array(
-            np.cross(self.to_np_array(), other.to_np_array()))
+        return Vector(self.y * other.z - self.z * other.y,
+                      self.z * other.x - self.x * other.z,
+                      self.x * other.y - self.y * other.x)
 
     def dot(self, other: 'Vector') -> float:
-        return float(np.dot(self.to_np_array(), other.to_np_array()))
+        return float(self.x * other.x + self.y * other.y + self.z * other.z)
+
+    def norm(self) -> float:
+        return math.sqrt(self.dot(self))
+
+    def angle(self, other: 'Vector') -> float:
+        """The unsigned angle between both vectors in radians."""
+        return math.atan2(self.cross(other).norm(), self.dot(other))
 
     def to_np_array(self) -> np.ndarray:
         return np.array([self.x, self.y, self.z])
@@ -0,0 +1,129 @@
+from typing import Iterator, List, Union, overload
+
+import numpy as np
+
+from paitypes.common.DataError import DataError
+from paitypes.geometry.PointArray import PointArray
+from paitypes.geometry.Vector import Vector
+
+
+class VectorArrayError(DataError):
+    pass
+
+
+class VectorArray:
+    """N vectors stored as a single N×3 float64 array of `(x, y, z)` rows.
+
+    The array counterpart of `Vector`. Binary operations take another array
+    of the same length or a single `Vector`, which is broadcast.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise VectorArrayError(
+                f'expected an array of shape (N, 3), got {data.shape}')
+        self.data = data
+
+    @classmethod
+    def from_vectors(cls, vectors: List[Vector]) -> 'VectorArray':
+        if not vectors:
+            return cls(np.zeros((0, 3)))
+        return cls(np.array([(v.x, v.y, v.z) for v in vectors],
+                            dtype=np.float64))
+
+    def to_vectors(self) -> List[Vector]:
+        return [Vector(x, y, z) for x, y, z in self.data.tolist()]
+
+    @classmethod
+    def from_points(cls,
+                    p_start: Union[PointArray, np.ndarray],
+                    p_end: Union[PointArray, np.ndarray]) -> 'VectorArray':
+        """Planar vectors from `p_start[i]` to `p_end[i]`.
+
+        The points are `PointArray`s or N×2 arrays of `(x, y)` coordinates.
+        """
+        start = p_start.xy if isinstance(p_start, PointArray) else \
+            np.asarray(p_start, dtype=np.float64)
+        end = p_end.xy if isinstance(p_end, PointArray) else \
+            np.asarray(p_end, dtype=np.float64)
+        data = np.zeros((len(start), 3))
+        data[:, :2] = end - start
+        return cls(data)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    @staticmethod
+    def _operand(other: Union['VectorArray', Vector]) -> np.ndarray:
+        if isinstance(other, Vector):
+            return np.array([other.x, other.y, other.z], dtype=np.float64)
+        return other.data
+
+    def __add__(self, other: Union['VectorArray', Vector]) -> 'VectorArray':
+        return VectorArray(self.data + self._operand(other))
+
+    def __sub__(self, other: Union['VectorArray', Vector]) -> 'VectorArray':
+        return VectorArray(self.data - self._operand(other))
+
+    def __neg__(self) -> 'VectorArray':
+        return VectorArray(-self.data)
+
+    def cross(self, other: Union['VectorArray', Vector]) -> 'VectorArray':
+        a, b = self.data, self._operand(other)
+        if b.ndim == 1:
+            b = b[None, :]
+        return VectorArray(np.stack([
+            a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
+            a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
+            a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]], axis=1))
+
+    def dot(self, other: Union['VectorArray', Vector]) -> np.ndarray:
+        a, b = self.data, self._operand(other)
+        if b.ndim == 1:
+            b = b[None, :]
+        return a[:, 0] * b[:, 0] + a[:, 1] * b[:, 1] + a[:, 2] * b[:, 2]
+
+    def norm(self) -> np.ndarray:
+        return np.sqrt(self.dot(self))
+
+    def angle(self, other: Union['VectorArray', Vector]) -> np.ndarray:
+        """The unsigned angles between the vectors in radians."""
+        return np.arctan2(self.cross(other).norm(), self.dot(other))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Vector]:
+        return iter(self.to_vectors())
+
+    @overload
+    def __getitem__(self, index: int) -> Vector:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> 'VectorArray':
+        ...
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]
+                    ) -> Union[Vector, 'VectorArray']:
+        if isinstance(index, (int, np.integer)):
+            return Vector(*self.data[index].tolist())
+        return VectorArray(self.data[index])
+
+    def __str__(self) -> str:
+        return '(VectorArray: {} vectors)'.format(len(self))
+
+    def __repr__(self) -> str:
+        return 'VectorArray({!r})'.format(self.data)
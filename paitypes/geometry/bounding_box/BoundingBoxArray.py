@@ -0,0 +1,303 @@
+from typing import Dict, Iterator, List, Sequence, Union, overload
+
+import numpy as np
+
+from ..Shape import Shape
+from ..Point import Point
+from ..PointArray import PointArray
+from .BoundingBox import BoundingBox, BoundingBoxError
+
+# Column layout of `BoundingBoxArray.data`, same order as the `BoundingBox`
+# dataclass fields.
+X_MIN, X_MAX, Y_MIN, Y_MAX = range(4)
+
+
+def _parse_dicts(datadicts: Sequence[Dict],
+                 keys: Sequence[str]) -> np.ndarray:
+    """N×len(keys) float64 array of the values of `keys` in `datadicts`."""
+    key_set = set(keys)
+    if any(set(datadict.keys()) != key_set for datadict in datadicts):
+        raise BoundingBoxError('more/not all keys present')
+    try:
+        return np.array([[float(datadict[key]) for key in keys]
+                         for datadict in datadicts],
+                        dtype=np.float64).reshape(-1, len(keys))
+    except ValueError:
+        raise BoundingBoxError('unparsable input dict')
+
+
+class BoundingBoxArray:
+    """A struct-of-arrays collection of bounding boxes.
+
+    Stores N boxes in a single N×4 float64 array with the columns
+    `(x_min, x_max, y_min, y_max)`, and offers vectorized equivalents of the
+    `BoundingBox` properties and methods. Scalar results become arrays of
+    length N, `BoundingBox` results become `BoundingBoxArray`s.
+
+    Wrapping an existing N×4 float64 array does not copy it, and the column
+    properties (`x_min`, ...) are views into `data`.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise BoundingBoxError(
+                f'expected an array of shape (N, 4), got {data.shape}')
+        self.data = data
+
+    @classmethod
+    def zeros(cls, n: int) -> 'BoundingBoxArray':
+        return cls(np.zeros((n, 4), dtype=np.float64))
+
+    @classmethod
+    def from_bboxes(cls, bboxes: Sequence[BoundingBox]
+                    ) -> 'BoundingBoxArray':
+        if not bboxes:
+            return cls.zeros(0)
+        return cls(np.array([(b.x_min, b.x_max, b.y_min, b.y_max)
+                             for b in bboxes], dtype=np.float64))
+
+    def to_bboxes(self) -> List[BoundingBox]:
+        return [BoundingBox(*row) for row in self.data.tolist()]
+
+    @classmethod
+    def from_dicts(cls, datadicts: Sequence[Dict]) -> 'BoundingBoxArray':
+        """Vectorized `BoundingBox.from_dict`."""
+        return cls(_parse_dicts(datadicts, ('x1', 'x2', 'y1', 'y2')))
+
+    def to_dicts(self) -> List[Dict]:
+        return [{'x1': x_min, 'x2': x_max, 'y1': y_min, 'y2': y_max}
+                for x_min, x_max, y_min, y_max in self.data.tolist()]
+
+    @classmethod
+    def from_tfpose_dicts(cls, datadicts: Sequence[Dict[str, int]]
+                          ) -> 'BoundingBoxArray':
+        """Vectorized `BoundingBox.from_tfpose_dict`."""
+        cx, cy, w, h = _parse_dicts(datadicts, ('x', 'y', 'w', 'h')).T
+        invalid = (w < 0) | (h < 0)
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            raise BoundingBoxError(f"Width and height must be positive: "
+                                   f"({w[i]}, {h[i]})")
+        return cls(np.stack([cx - w / 2.0, cx + w / 2.0,
+                             cy - h / 2.0, cy + h / 2.0], axis=1))
+
+    @property
+    def x_min(self) -> np.ndarray:
+        return self.data[:, X_MIN]
+
+    @property
+    def x_max(self) -> np.ndarray:
+        return self.data[:, X_MAX]
+
+    @property
+    def y_min(self) -> np.ndarray:
+        return self.data[:, Y_MIN]
+
+    @property
+    def y_max(self) -> np.ndarray:
+        return self.data[:, Y_MAX]
+
+    @property
+    def delta_x(self) -> np.ndarray:
+        return self.x_max - self.x_min
+
+    @property
+    def delta_y(self) -> np.ndarray:
+        return self.y_max - self.y_min
+
+    @property
+    def area(self) -> np.ndarray:
+        return self.delta_x * self.delta_y
+
+    @property
+    def center(self) -> PointArray:
+        """The box centers; `center.xy` is the N×2 array of them."""
+        return PointArray(np.stack([(self.x_min + self.x_max) / 2.0,
+                                    (self.y_min + self.y_max) / 2.0], axis=1))
+
+    def is_empty(self) -> np.ndarray:
+        return (self.delta_x <= 0.0) | (self.delta_y <= 0.0)
+
+    def is_small(self) -> np.ndarray:
+        return self.area < 25000.0
+
+    @classmethod
+    def distance(cls,
+                 bounds_one: 'BoundingBoxArray',
+                 bounds_two: 'BoundingBoxArray'
+                 ) -> np.ndarray:
+        """Element-wise center distance, see `BoundingBox.distance`."""
+        c1_x = bounds_one.x_min * 0.5 + bounds_one.x_max * 0.5
+        c1_y = bounds_one.y_min * 0.5 + bounds_one.y_max * 0.5
+
+        c2_x = bounds_two.x_min * 0.5 + bounds_two.x_max * 0.5
+        c2_y = bounds_two.y_min * 0.5 + bounds_two.y_max * 0.5
+
+        return np.sqrt((c1_x - c2_x) ** 2 + (c1_y - c2_y) ** 2)
+
+    def mean_bound(self) -> BoundingBox:
+        if len(self) == 0:
+            raise BoundingBoxError('cannot take the mean of no bboxes')
+        x_min, x_max, y_min, y_max = np.mean(self.data, axis=0).tolist()
+        return BoundingBox(x_min, x_max, y_min, y_max)
+
+    def scale(self,
+              shape: Shape,
+              center: Point = Point(0.0, 0.0)) -> 'BoundingBoxArray':
+        moved = self.move(-center.x, -center.y)
+        scaled = BoundingBoxArray(
+            moved.data * [shape.width, shape.width,
+                          shape.height, shape.height])
+        return scaled.move(center.x, center.y)
+
+    def to_shape(self) -> np.ndarray:
+        """N×2 array of `(width, height)`, the fields of `Shape`."""
+        return np.stack([self.delta_x, self.delta_y], axis=1)
+
+    def encloses(self, point: Point, fuzz_factor: float = 0.1) -> np.ndarray:
+        return ((self.x_min - fuzz_factor <= point.x) &
+                (point.x <= self.x_max + fuzz_factor) &
+                (self.y_min - fuzz_factor <= point.y) &
+                (point.y <= self.y_max + fuzz_factor))
+
+    def is_inside(self, container: BoundingBox) -> np.ndarray:
+        xs = self.data[:, X_MIN:X_MAX + 1]
+        ys = self.data[:, Y_MIN:Y_MAX + 1]
+        return (np.all((container.x_min <= xs) & (xs <= container.x_max),
+                       axis=1) &
+                np.all((container.y_min <= ys) & (ys <= container.y_max),
+                       axis=1))
+
+    def move(self, dx: float, dy: float) -> 'BoundingBoxArray':
+        return BoundingBoxArray(self.data + [dx, dx, dy, dy])
+
+    def __add__(self, other: object) -> 'BoundingBoxArray':
+        """Element-wise union with another array or a single `BoundingBox`."""
+        if isinstance(other, BoundingBox):
+            other = BoundingBoxArray.from_bboxes([other])
+        if isinstance(other, BoundingBoxArray):
+            if self.is_empty().any() or other.is_empty().any():
+                raise BoundingBoxError('bbox is empty')
+
+            return BoundingBoxArray(np.stack([
+                np.minimum(self.x_min, other.x_min),
+                np.maximum(self.x_max, other.x_max),
+                np.minimum(self.y_min, other.y_min),
+                np.maximum(self.y_max, other.y_max)], axis=1))
+
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[BoundingBox]:
+        return iter(self.to_bboxes())
+
+    @overload
+    def __getitem__(self, index: int) -> BoundingBox:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]
+                    ) -> 'BoundingBoxArray':
+        ...
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]
+                    ) -> Union[BoundingBox, 'BoundingBoxArray']:
+        if isinstance(index, (int, np.integer)):
+            return BoundingBox(*self.data[index].tolist())
+        return BoundingBoxArray(self.data[index])
+
+    def __str__(self) -> str:
+        return '(BoundingBoxArray: {} bboxes)'.format(len(self))
+
+    def __repr__(self) -> str:
+        return 'BoundingBoxArray({!r})'.format(self.data)
+
+
+BoundingBoxes = Union[BoundingBoxArray, Sequence[BoundingBox]]
+
+
+def as_bbox_array(bboxes: BoundingBoxes) -> BoundingBoxArray:
+    """`bboxes` as a `BoundingBoxArray`, without copying an array."""
+    if isinstance(bboxes, BoundingBoxArray):
+        return bboxes
+    return BoundingBoxArray.from_bboxes(bboxes)
+
+
+def check_not_inverted(bboxes: BoundingBoxArray) -> None:
+    """Raise a `BoundingBoxError` if any box has its maximum below its
+    minimum.
+    """
+    if np.any(bboxes.x_min > bboxes.x_max) or \
+            np.any(bboxes.y_min > bboxes.y_max):
+        raise BoundingBoxError('bbox is inverted')
+
+
+def intersection_area_matrix(bboxes1: BoundingBoxes,
+                             bboxes2: BoundingBoxes) -> np.ndarray:
+    """
+    M×N matrix of `intersection(bboxes1[i], bboxes2[j]).area`.
+    """
+    bboxes1, bboxes2 = as_bbox_array(bboxes1), as_bbox_array(bboxes2)
+    check_not_inverted(bboxes1)
+    check_not_inverted(bboxes2)
+
+    x_left = np.maximum(bboxes1.x_min[:, None], bboxes2.x_min[None, :])
+    y_top = np.maximum(bboxes1.y_min[:, None], bboxes2.y_min[None, :])
+    x_right = np.minimum(bboxes1.x_max[:, None], bboxes2.x_max[None, :])
+    y_bottom = np.minimum(bboxes1.y_max[:, None], bboxes2.y_max[None, :])
+
+    width = x_right - x_left
+    height = y_bottom - y_top
+    # Disjoint pairs intersect in `EMPTY_BBOX`, whose area is 0.0
+    return np.where((width < 0.0) | (height < 0.0), 0.0, width * height)
+
+
+def contains_ratio_matrix(containers: BoundingBoxes,
+                          contained: BoundingBoxes) -> np.ndarray:
+    """
+    M×N matrix of `contains_ratio(containers[i], contained[j])`.
+    """
+    containers, contained = (as_bbox_array(containers),
+                             as_bbox_array(contained))
+    intersection_area = intersection_area_matrix(containers, contained)
+    contained_area = np.broadcast_to(contained.area[None, :],
+                                     intersection_area.shape)
+    ratio = np.zeros_like(intersection_area)
+    np.divide(intersection_area, contained_area,
+              out=ratio, where=contained_area != 0.0)
+    return ratio
+
+
+def center_distance_matrix(bboxes1: BoundingBoxes,
+                           bboxes2: BoundingBoxes) -> np.ndarray:
+    """
+    M×N matrix of `BoundingBox.distance(bboxes1[i], bboxes2[j])`.
+    """
+    bboxes1, bboxes2 = as_bbox_array(bboxes1), as_bbox_array(bboxes2)
+    c1_x = bboxes1.x_min * 0.5 + bboxes1.x_max * 0.5
+    c1_y = bboxes1.y_min * 0.5 + bboxes1.y_max * 0.5
+
+    c2_x = bboxes2.x_min * 0.5 + bboxes2.x_max * 0.5
+    c2_y = bboxes2.y_min * 0.5 + bboxes2.y_max * 0.5
+
+    return np.sqrt((c1_x[:, None] - c2_x[None, :]) ** 2 +
+                   (c1_y[:, None] - c2_y[None, :]) ** 2)
+
+
+def iou_matrix(bboxes1: BoundingBoxes, bboxes2: BoundingBoxes) -> np.ndarray:
+    """
+    M×N matrix of `get_iou(bboxes1[i], bboxes2[j])`.
+    """
+    bboxes1, bboxes2 = as_bbox_array(bboxes1), as_bbox_array(bboxes2)
+    intersection_area = intersection_area_matrix(bboxes1, bboxes2)
+    union_area = (bboxes1.area[:, None] + bboxes2.area[None, :] -
+                  intersection_area)
+    iou = np.zeros_like(intersection_area)
+    np.divide(intersection_area, union_area,
+              out=iou, where=union_area != 0.0)
+    return iou
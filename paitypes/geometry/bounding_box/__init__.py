@@ -1,5 +1,17 @@
 from .BoundingBox import BoundingBox, BoundingBoxError, EMPTY_BBOX
-from .snap import snap_to_shape
+from .BoundingBoxArray import (BoundingBoxArray,
+                               BoundingBoxes,
+                               as_bbox_array,
+                               check_not_inverted,
+                               intersection_area_matrix,
+                               contains_ratio_matrix,
+                               center_distance_matrix,
+                               iou_matrix)
+from .snap import snap_to_shape, snap_to_shape_array
 from .pad import (pad_to_min_size,
                   pad_to_aspect_ratio,
-                  pad_abs_amount)
+                  pad_abs_amount,
+                  pad_to_min_size_array,
+                  pad_to_aspect_ratio_array,
+                  pad_abs_amount_array)
+from .index import BoundingBoxIndex
@@ -0,0 +1,188 @@
+import math
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..Point import Point
+from .BoundingBox import BoundingBox, BoundingBoxError
+from .BoundingBoxArray import BoundingBoxArray
+
+
+def _expand_ranges(starts: np.ndarray,
+                   counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """For every `i`, enumerate `starts[i] + 0 .. starts[i] + counts[i] - 1`.
+
+    Returns the owner `i` and the offset within the range of every element.
+    """
+    owners = np.repeat(np.arange(len(counts)), counts)
+    first = np.cumsum(counts) - counts
+    offsets = np.arange(len(owners)) - np.repeat(first, counts)
+    return owners, offsets + np.repeat(starts, counts)
+
+
+class BoundingBoxIndex:
+    """A static uniform-grid index over a set of bounding boxes.
+
+    Every box is registered in each grid cell its extent touches, and the
+    cell lists are stored in one CSR-style array. Queries only look at the
+    boxes registered in the cells covered by the query region, and run the
+    exact `BoundingBox` predicate on those candidates.
+
+    The default cell size is the median box size, capped such that the grid
+    has at most a few cells per box. For a few dozen boxes, the predicates of
+    `BoundingBoxArray` are faster than per-point queries; see
+    `benchmarking/spatial_index.py`.
+    """
+
+    def __init__(self,
+                 bboxes: Union[BoundingBoxArray, List[BoundingBox]],
+                 cell_size: Optional[float] = None) -> None:
+        if not isinstance(bboxes, BoundingBoxArray):
+            bboxes = BoundingBoxArray.from_bboxes(bboxes)
+        if cell_size is not None and cell_size <= 0.0:
+            raise BoundingBoxError('cell_size must be positive')
+        self.bboxes = bboxes
+
+        # Register inverted boxes over their full extent as well, the exact
+        # predicates take care of them.
+        data = bboxes.data
+        lo_x = np.minimum(data[:, 0], data[:, 1])
+        hi_x = np.maximum(data[:, 0], data[:, 1])
+        lo_y = np.minimum(data[:, 2], data[:, 3])
+        hi_y = np.maximum(data[:, 2], data[:, 3])
+
+        if len(bboxes) > 0:
+            self._origin = (float(lo_x.min()), float(lo_y.min()))
+            extent = (float(hi_x.max()) - self._origin[0],
+                      float(hi_y.max()) - self._origin[1])
+        else:
+            self._origin, extent = (0.0, 0.0), (0.0, 0.0)
+
+        if cell_size is None:
+            sizes = np.maximum(hi_x - lo_x, hi_y - lo_y)
+            median_size = float(np.median(sizes)) if len(sizes) else 0.0
+            min_size = math.sqrt(extent[0] * extent[1] /
+                                 (4.0 * max(len(bboxes), 1)))
+            cell_size = max(median_size, min_size, max(extent) / 1024.0)
+            if cell_size <= 0.0:
+                cell_size = 1.0
+        self.cell_size = cell_size
+
+        self._n_x = int(extent[0] // cell_size) + 1
+        self._n_y = int(extent[1] // cell_size) + 1
+
+        x0, x1 = self._cell_x(lo_x), self._cell_x(hi_x)
+        y0, y1 = self._cell_y(lo_y), self._cell_y(hi_y)
+        width = x1 - x0 + 1
+        owners, offsets = _expand_ranges(
+            np.zeros(len(bboxes), dtype=np.intp),
+            width * (y1 - y0 + 1))
+        cells = ((y0[owners] + offsets // width[owners]) * self._n_x +
+                 x0[owners] + offsets % width[owners])
+
+        order = np.argsort(cells, kind='stable')
+        self._cell_boxes = owners[order]
+        self._cell_starts = np.searchsorted(
+            cells[order], np.arange(self._n_x * self._n_y + 1))
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def _cell_x(self, x: np.ndarray) -> np.ndarray:
+        cell = np.floor((x - self._origin[0]) / self.cell_size)
+        return np.clip(cell, 0, self._n_x - 1).astype(np.intp)
+
+    def _cell_y(self, y: np.ndarray) -> np.ndarray:
+        cell = np.floor((y - self._origin[1]) / self.cell_size)
+        return np.clip(cell, 0, self._n_y - 1).astype(np.intp)
+
+    def _cell_range(self, lo: float, hi: float,
+                    origin: float, n: int) -> Tuple[int, int]:
+        first = math.floor((lo - origin) / self.cell_size)
+        last = math.floor((hi - origin) / self.cell_size)
+        return min(max(first, 0), n - 1), min(max(last, 0), n - 1)
+
+    def _candidates(self,
+                    x_min: float, x_max: float,
+                    y_min: float, y_max: float) -> np.ndarray:
+        """Sorted indices of the boxes registered in the covered cells."""
+        if not (x_min <= x_max and y_min <= y_max):
+            return np.zeros(0, dtype=np.intp)
+        x0, x1 = self._cell_range(x_min, x_max, self._origin[0], self._n_x)
+        y0, y1 = self._cell_range(y_min, y_max, self._origin[1], self._n_y)
+        starts = self._cell_starts
+        if x0 == x1 and y0 == y1:
+            cell = y0 * self._n_x + x0
+            return self._cell_boxes[starts[cell]:starts[cell + 1]]
+        return np.unique(np.concatenate([
+            self._cell_boxes[starts[row + x0]:starts[row + x1 + 1]]
+            for row in range(y0 * self._n_x, (y1 + 1) * self._n_x,
+                             self._n_x)]))
+
+    def enclosing(self, point: Point, fuzz_factor: float = 0.1) -> np.ndarray:
+        """Indices of the boxes that `encloses(point, fuzz_factor)`."""
+        fuzz = abs(fuzz_factor)
+        candidates = self._candidates(point.x - fuzz, point.x + fuzz,
+                                      point.y - fuzz, point.y + fuzz)
+        data = self.bboxes.data[candidates]
+        mask = ((data[:, 0] - fuzz_factor <= point.x) &
+                (point.x <= data[:, 1] + fuzz_factor) &
+                (data[:, 2] - fuzz_factor <= point.y) &
+                (point.y <= data[:, 3] + fuzz_factor))
+        return candidates[mask]
+
+    def enclosing_many(self,
+                       points: np.ndarray,
+                       fuzz_factor: float = 0.1
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+        """Bulk version of `enclosing` for a K×2 array of `(x, y)` points.
+
+        Returns the `(point_indices, box_indices)` of all enclosing pairs,
+        sorted by point and then by box.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        fuzz = abs(fuzz_factor)
+        x0 = self._cell_x(points[:, 0] - fuzz)
+        x1 = self._cell_x(points[:, 0] + fuzz)
+        y0 = self._cell_y(points[:, 1] - fuzz)
+        y1 = self._cell_y(points[:, 1] + fuzz)
+
+        # All (point, cell) pairs, then all (point, candidate box) pairs
+        width = x1 - x0 + 1
+        point_idxs, offsets = _expand_ranges(
+            np.zeros(len(points), dtype=np.intp), width * (y1 - y0 + 1))
+        cells = ((y0[point_idxs] + offsets // width[point_idxs]) * self._n_x +
+                 x0[point_idxs] + offsets % width[point_idxs])
+        starts = self._cell_starts[cells]
+        owners, positions = _expand_ranges(
+            starts, self._cell_starts[cells + 1] - starts)
+        point_idxs = point_idxs[owners]
+        box_idxs = self._cell_boxes[positions]
+
+        data = self.bboxes.data[box_idxs]
+        x, y = points[point_idxs, 0], points[point_idxs, 1]
+        mask = ((data[:, 0] - fuzz_factor <= x) &
+                (x <= data[:, 1] + fuzz_factor) &
+                (data[:, 2] - fuzz_factor <= y) &
+                (y <= data[:, 3] + fuzz_factor))
+
+        # A box spanning several of the visited cells is found once per cell
+        keys = np.unique(point_idxs[mask] * len(self) + box_idxs[mask])
+        return keys // max(len(self), 1), keys % max(len(self), 1)
+
+    def overlapping(self, bbox: BoundingBox) -> np.ndarray:
+        """Indices of the boxes sharing at least one point with `bbox`."""
+        candidates = self._candidates(bbox.x_min, bbox.x_max,
+                                      bbox.y_min, bbox.y_max)
+        others = self.bboxes[candidates]
+        mask = ((np.maximum(others.x_min, bbox.x_min) <=
+                 np.minimum(others.x_max, bbox.x_max)) &
+                (np.maximum(others.y_min, bbox.y_min) <=
+                 np.minimum(others.y_max, bbox.y_max)))
+        return candidates[mask]
+
+    def inside(self, container: BoundingBox) -> np.ndarray:
+        """Indices of the boxes that are `is_inside(container)`."""
+        candidates = self._candidates(container.x_min, container.x_max,
+                                      container.y_min, container.y_max)
+        return candidates[self.bboxes[candidates].is_inside(container)]
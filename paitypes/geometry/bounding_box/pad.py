@@ -1,6 +1,9 @@
-from typing import Tuple
+from typing import Tuple, Union
+
+import numpy as np
 
 from .BoundingBox import BoundingBox, BoundingBoxError
+from .BoundingBoxArray import BoundingBoxArray
 
 
 def pad_to_min_size(bbox: BoundingBox,
@@ -74,3 +77,76 @@ def pad_abs_amount(bbox: BoundingBox,
     delta_x = shape[1] + bbox.delta_x
 
     return pad_to_min_size(bbox, (delta_y, delta_x))
+
+
+def _check_padding_args(bboxes: BoundingBoxArray, shape: np.ndarray) -> None:
+    if bboxes.is_empty().any():
+        raise BoundingBoxError('bbox is empty')
+
+    if np.any(shape < 0):
+        raise BoundingBoxError('shape is invalid')
+
+
+def pad_to_min_size_array(bboxes: BoundingBoxArray,
+                          shape: Union[Tuple[float, float], np.ndarray]
+                          ) -> BoundingBoxArray:
+    """
+    Vectorized `pad_to_min_size`. `shape` is a single `(height, width)` or an
+    N×2 array with one per box.
+    """
+    shape = np.broadcast_to(np.asarray(shape, dtype=np.float64),
+                            (len(bboxes), 2))
+    _check_padding_args(bboxes, shape)
+
+    delta_y = shape[:, 0] - bboxes.delta_y
+    delta_x = shape[:, 1] - bboxes.delta_x
+    half_y = np.where(delta_y > 0.0, delta_y / 2, 0.0)
+    half_x = np.where(delta_x > 0.0, delta_x / 2, 0.0)
+
+    return BoundingBoxArray(np.stack([bboxes.x_min - half_x,
+                                      bboxes.x_max + half_x,
+                                      bboxes.y_min - half_y,
+                                      bboxes.y_max + half_y], axis=1))
+
+
+def pad_to_aspect_ratio_array(bboxes: BoundingBoxArray,
+                              aspect_ratio: float
+                              ) -> BoundingBoxArray:
+    """
+    Vectorized `pad_to_aspect_ratio`.
+    """
+    if bboxes.is_empty().any():
+        raise BoundingBoxError('bbox is empty')
+
+    if aspect_ratio <= 0.0:
+        raise BoundingBoxError('aspect_ratio is invalid')
+
+    height, width = bboxes.delta_y, bboxes.delta_x
+
+    cur_aspect_ratio = width / height
+
+    target_height = np.where(aspect_ratio < cur_aspect_ratio,
+                             height * cur_aspect_ratio / aspect_ratio,
+                             height)
+    target_width = np.where(aspect_ratio > cur_aspect_ratio,
+                            width * aspect_ratio / cur_aspect_ratio,
+                            width)
+
+    return pad_to_min_size_array(
+        bboxes, np.stack([target_height, target_width], axis=1))
+
+
+def pad_abs_amount_array(bboxes: BoundingBoxArray,
+                         shape: Union[Tuple[float, float], np.ndarray]
+                         ) -> BoundingBoxArray:
+    """
+    Vectorized `pad_abs_amount`.
+    """
+    shape = np.broadcast_to(np.asarray(shape, dtype=np.float64),
+                            (len(bboxes), 2))
+    _check_padding_args(bboxes, shape)
+
+    delta_y = shape[:, 0] + bboxes.delta_y
+    delta_x = shape[:, 1] + bboxes.delta_x
+
+    return pad_to_min_size_array(bboxes, np.stack([delta_y, delta_x], axis=1))
@@ -1,6 +1,9 @@
 from typing import Tuple
 
+import numpy as np
+
 from .BoundingBox import BoundingBox, BoundingBoxError
+from .BoundingBoxArray import BoundingBoxArray
 
 
 def snap_to_shape(bbox: BoundingBox,
@@ -38,3 +41,34 @@ def snap_to_shape(bbox: BoundingBox,
     x_min, x_max = max(x_min, 0.0), min(x_max, shape[1])
 
     return BoundingBox(x_min, x_max, y_min, y_max)
+
+
+def snap_to_shape_array(bboxes: BoundingBoxArray,
+                        shape: Tuple[float, float],
+                        ) -> BoundingBoxArray:
+    """
+    Vectorized `snap_to_shape`.
+    """
+    if bboxes.is_empty().any():
+        raise BoundingBoxError('bbox is empty')
+
+    if shape[0] < 0 or shape[1] < 0:
+        raise BoundingBoxError('shape is invalid')
+
+    x_min, x_max = bboxes.x_min, bboxes.x_max
+    y_min, y_max = bboxes.y_min, bboxes.y_max
+
+    y_max = np.where(y_min < 0.0, y_max + -y_min, y_max)
+    y_min = np.where(y_min < 0.0, 0.0, y_min)
+    x_max = np.where(x_min < 0.0, x_max + -x_min, x_max)
+    x_min = np.where(x_min < 0.0, 0.0, x_min)
+
+    y_min = np.where(y_max > shape[0], y_min - (y_max - shape[0]), y_min)
+    y_max = np.where(y_max > shape[0], shape[0], y_max)
+    x_min = np.where(x_max > shape[1], x_min - (x_max - shape[1]), x_min)
+    x_max = np.where(x_max > shape[1], shape[1], x_max)
+
+    y_min, y_max = np.maximum(y_min, 0.0), np.minimum(y_max, shape[0])
+    x_min, x_max = np.maximum(x_min, 0.0), np.minimum(x_max, shape[1])
+
+    return BoundingBoxArray(np.stack([x_min, x_max, y_min, y_max], axis=1))
@@ -0,0 +1,161 @@
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+from dataclasses import dataclass
+
+from paitypes.image import BGRImage
+
+
+class ImageBatchException(ValueError):
+    pass
+
+
+@dataclass
+class Letterbox:
+    """How an image of `original_shape` `(height, width)` was placed into a
+    batch: scaled by `scale`, with its top left corner at `x_offset` and
+    `y_offset`.
+    """
+    original_shape: Tuple[int, int]
+    scale: float = 1.0
+    x_offset: int = 0
+    y_offset: int = 0
+
+    def to_original(self, xy: np.ndarray) -> np.ndarray:
+        """Pixel coordinates in the batch image, in the original image."""
+        return ((np.asarray(xy, dtype=np.float64) -
+                 [self.x_offset, self.y_offset]) / self.scale)
+
+
+def _check_bgr(image: np.ndarray) -> None:
+    if image.dtype != np.uint8 or image.ndim != 3 or image.shape[2:] != (3,):
+        raise ImageBatchException(
+            f'expected a uint8 BGR image of shape (H, W, 3), got '
+            f'{image.dtype} of shape {image.shape}')
+
+
+def _batch_view(images: Sequence[np.ndarray]) -> Optional[np.ndarray]:
+    """The N×H×W×3 array `images` are consecutive views of, if any."""
+    first = images[0]
+    owner = first.base
+    if not isinstance(owner, np.ndarray) or \
+            not owner.flags.c_contiguous or owner.dtype != np.uint8:
+        return None
+    frame_bytes = first.nbytes
+    start = (first.__array_interface__['data'][0] -
+             owner.__array_interface__['data'][0])
+    for i, image in enumerate(images):
+        if image.base is not owner or not image.flags.c_contiguous or \
+                image.shape != first.shape or image.dtype != np.uint8 or \
+                (image.__array_interface__['data'][0] -
+                 owner.__array_interface__['data'][0] !=
+                 start + i * frame_bytes):
+            return None
+    flat = owner.reshape(-1)
+    return flat[start:start + len(images) * frame_bytes].reshape(
+        (len(images),) + first.shape)
+
+
+class ImageBatch:
+    """N BGR images of the same shape in one contiguous N×H×W×3 uint8
+    array, with the `Letterbox` of every image.
+
+    Producers can write frames into `write_slot(i)` directly, or letterbox
+    them into it with `write_letterboxed`, and consumers can use `data` as
+    the batch tensor without stacking the images again.
+    """
+
+    def __init__(self,
+                 data: np.ndarray,
+                 letterboxes: Optional[List[Letterbox]] = None) -> None:
+        if data.ndim != 4 or data.shape[3] != 3:
+            raise ImageBatchException(
+                f'expected an array of shape (N, H, W, 3), got {data.shape}')
+        if data.dtype != np.uint8 or not data.flags.c_contiguous:
+            raise ImageBatchException(
+                'expected a C-contiguous uint8 array')
+        if letterboxes is None:
+            letterboxes = [Letterbox((data.shape[1], data.shape[2]))
+                           for _ in range(len(data))]
+        if len(letterboxes) != len(data):
+            raise ImageBatchException(
+                f'expected {len(data)} letterboxes, got {len(letterboxes)}')
+        self.data = data
+        self.letterboxes = letterboxes
+
+    @classmethod
+    def zeros(cls, n: int, height: int, width: int) -> 'ImageBatch':
+        return cls(np.zeros((n, height, width, 3), dtype=np.uint8))
+
+    @classmethod
+    def from_images(cls, images: Sequence[BGRImage]) -> 'ImageBatch':
+        """A batch of `images`, which must have the same shape.
+
+        If the images are consecutive views of one contiguous array, such as
+        the `images` of another batch, the batch is a view of that array as
+        well; otherwise the images are copied into a new array.
+        """
+        if not images:
+            raise ImageBatchException('expected at least one image')
+        for image in images:
+            _check_bgr(image)
+        if any(image.shape != images[0].shape for image in images):
+            raise ImageBatchException(
+                'images must have the same shape; letterbox them into a '
+                'batch instead')
+        data = _batch_view(images)
+        if data is None:
+            data = np.ascontiguousarray(np.stack(images))
+        return cls(data)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The `(height, width)` of the images."""
+        return self.data.shape[1], self.data.shape[2]
+
+    @property
+    def images(self) -> List[BGRImage]:
+        """Views of the images."""
+        return [BGRImage(image) for image in self.data]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def write_slot(self, index: int) -> np.ndarray:
+        """The image at `index`, to write a frame of the batch shape into."""
+        return self.data[index]
+
+    def write_letterboxed(self,
+                          index: int,
+                          image: BGRImage,
+                          pad_value: int = 0,
+                          interpolation: int = cv2.INTER_LINEAR
+                          ) -> Letterbox:
+        """Scale `image` to fit the batch shape, keeping its aspect ratio,
+        and write it centered into the image at `index`, padded with
+        `pad_value`.
+        """
+        _check_bgr(image)
+        height, width = self.shape
+        image_height, image_width = image.shape[:2]
+        if image_height <= 0 or image_width <= 0:
+            raise ImageBatchException('image shape is invalid')
+        scale = min(width / image_width, height / image_height)
+        scaled_width = min(width, max(1, int(round(image_width * scale))))
+        scaled_height = min(height, max(1, int(round(image_height * scale))))
+        x_offset = (width - scaled_width) // 2
+        y_offset = (height - scaled_height) // 2
+
+        slot = self.write_slot(index)
+        slot[...] = pad_value
+        slot[y_offset:y_offset + scaled_height,
+             x_offset:x_offset + scaled_width] = (
+            image if (scaled_width, scaled_height) == (image_width,
+                                                       image_height)
+            else cv2.resize(image, (scaled_width, scaled_height),
+                            interpolation=interpolation))
+        letterbox = Letterbox((image_height, image_width), scale,
+                              x_offset, y_offset)
+        self.letterboxes[index] = letterbox
+        return letterbox
@@ -0,0 +1,83 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+class FrameBufferException(ValueError):
+    pass
+
+
+class FrameRingBuffer:
+    """The last `capacity` frames of a stream, in one preallocated array.
+
+    Frames are written in place, either with `push`, or by writing into
+    `write_slot()` directly (as the `dst` of an OpenCV call, for example)
+    and calling `commit`. `latest` returns views into the buffer rather than
+    copies, so a view is overwritten once `capacity` more frames were
+    committed; copy the frames that must live longer than that.
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 shape: Tuple[int, ...],
+                 dtype: np.dtype = np.uint8) -> None:
+        if capacity <= 0:
+            raise FrameBufferException('capacity must be positive')
+        self._frames = np.zeros((capacity,) + tuple(shape), dtype=dtype)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._frames)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._frames.shape[1:]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._frames.dtype
+
+    def __len__(self) -> int:
+        return self._count
+
+    def write_slot(self) -> np.ndarray:
+        """The slot of the next frame, holding the oldest frame if full."""
+        return self._frames[self._next]
+
+    def commit(self, timestamp: float) -> None:
+        """Make the frame written into `write_slot()` the latest frame."""
+        self._timestamps[self._next] = timestamp
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def push(self, frame: np.ndarray, timestamp: float) -> None:
+        """Copy `frame` into the buffer as the latest frame."""
+        if frame.shape != self.shape:
+            raise FrameBufferException(
+                f'expected a frame of shape {self.shape}, got {frame.shape}')
+        np.copyto(self.write_slot(), frame, casting='same_kind')
+        self.commit(timestamp)
+
+    def clear(self) -> None:
+        self._next = 0
+        self._count = 0
+
+    def _slots(self, k: int) -> np.ndarray:
+        if k < 0:
+            raise FrameBufferException('k must be non-negative')
+        k = min(k, self._count)
+        return (self._next - k + np.arange(k)) % self.capacity
+
+    def latest(self, k: int = 1) -> List[np.ndarray]:
+        """Views of the last `k` frames, from the oldest to the latest.
+
+        Fewer frames are returned while the buffer holds fewer than `k`.
+        """
+        return [self._frames[slot] for slot in self._slots(k).tolist()]
+
+    def timestamps(self, k: int = 1) -> np.ndarray:
+        """The timestamps of `latest(k)`."""
+        return self._timestamps[self._slots(k)]
@@ -3,9 +3,14 @@ import numpy as np
 
 from typing import Tuple, TypeVar, cast
 
-from paitypes.geometry.bounding_box import (BoundingBox, pad_to_min_size,
+from paitypes.geometry.bounding_box import (BoundingBox, BoundingBoxArray,
+                                            pad_to_min_size,
                                             pad_abs_amount,
-                                            pad_to_aspect_ratio, snap_to_shape)
+                                            pad_to_aspect_ratio, snap_to_shape,
+                                            pad_to_min_size_array,
+                                            pad_abs_amount_array,
+                                            pad_to_aspect_ratio_array,
+                                            snap_to_shape_array)
 from paitypes.geometry.Shape import Shape
 from paitypes.image import Image
 
@@ -87,3 +92,37 @@ def shape_image_to_bbox(image: np.ndarray,
                                interpolation=cv2.INTER_AREA)
 
     return resized_image
+
+
+def plan_crops(bboxes: BoundingBoxArray,
+               thumbnail_size: Tuple[float, float],
+               image_shape: Tuple[int, int]
+               ) -> np.ndarray:
+    """
+    Computes the crops `shape_image_to_bbox` takes for all `bboxes` at once.
+
+    Returns an N×4 integer array of `(x_min, x_max, y_min, y_max)` rows, the
+    exact pixel bounds `crop_image_to_bounding_box` would slice for every
+    box. Empty boxes, which `shape_image_to_bbox` does not crop, get the
+    bounds of the whole image.
+    """
+    height, width = image_shape[0], image_shape[1]
+    crops = np.tile(np.array([0, width, 0, height], dtype=np.intp),
+                    (len(bboxes), 1))
+
+    valid = ~bboxes.is_empty()
+    if not valid.any():
+        return crops
+
+    padded_bboxes = pad_to_min_size_array(bboxes[valid], thumbnail_size)
+    padded_bboxes = pad_abs_amount_array(padded_bboxes, (20.0, 20.0))
+
+    aspect_ratio = (float(thumbnail_size[0]) /
+                    float(thumbnail_size[1]))
+    padded_bboxes = pad_to_aspect_ratio_array(padded_bboxes, aspect_ratio)
+
+    cropped_bboxes = snap_to_shape_array(padded_bboxes, (height, width))
+
+    # Same truncation as `crop_image_to_bounding_box`
+    crops[valid] = cropped_bboxes.data.astype(np.intp)
+    return crops
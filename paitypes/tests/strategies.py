@@ -1,9 +1,30 @@
-from typing import Any
+from typing import Any, Callable
 
-from hypothesis._strategies import composite, floats
+from hypothesis._strategies import (SearchStrategy, builds, composite, floats,
+                                    integers, lists, tuples)
 
+from paitypes.estimation.pose import CocoPart, Human, Pair
 from paitypes.geometry.bounding_box import BoundingBox
 
+Draw = Callable[[SearchStrategy[Any]], Any]
+
+coordinates = floats(min_value=0.0, max_value=1.0)
+part_indices = integers(min_value=0, max_value=len(CocoPart) - 1)
+
+
+def pairs_with_peak_ids(max_peak_id: int) -> SearchStrategy[Pair]:
+    """`Pair`s between peaks `0` to `max_peak_id`; fewer peaks connect more
+    pairs into the same human.
+    """
+    peak_ids = integers(0, max_peak_id)
+    return builds(Pair, peak_ids, peak_ids, part_indices, part_indices,
+                  tuples(coordinates, coordinates),
+                  tuples(coordinates, coordinates),
+                  floats(min_value=0.0, max_value=10.0))
+
+
+pairs = pairs_with_peak_ids(20)
+
 
 @composite
 def bounding_boxes(draw: Any, container: BoundingBox = None) -> BoundingBox:
@@ -22,3 +43,10 @@ def bounding_boxes(draw: Any, container: BoundingBox = None) -> BoundingBox:
     w = draw(floats(min_value=0.0, max_value=w_max))
     h = draw(floats(min_value=0.0, max_value=h_max))
     return BoundingBox(x, x + w, y, y + h)
+
+
+@composite
+def humans(draw: Draw, max_pairs: int = 10) -> Human:
+    human = Human(draw(lists(pairs, max_size=max_pairs)))
+    human.score = draw(floats(min_value=0.0, max_value=10.0))
+    return human
@@ -1,12 +1,14 @@
 from random import shuffle, random, randint, uniform
 from typing import List, Set, Dict
 
+import numpy as np
 import pytest
 from hypothesis import given
 from hypothesis._strategies import integers, floats, lists
 from hypothesis.strategies import sets
 
-from paitypes.common.sequence import cluster, moving_average
+from paitypes.common.sequence import (cluster, cluster_indices,
+                                      moving_average)
 from paitypes.geometry.bounding_box import BoundingBox
 from paitypes.tests.strategies import bounding_boxes
 
@@ -23,6 +25,12 @@ def add_noise(l: Set[float]) -> Set[float]:
     return r
 
 
+def vectorized_euclidean(xs: List[float], ys: List[float]) -> np.ndarray:
+    diff = np.subtract.outer(np.array(xs, dtype=np.float64),
+                             np.array(ys, dtype=np.float64))
+    return diff * diff
+
+
 class TestCluster:
 
     @given(sets(floats(min_value=1e-5, max_value=100.0)))
@@ -93,3 +101,56 @@ class TestCluster:
                                list(second_set))
 
         assert len(pair_mapping) == len(set_of_floats)
+
+    @given(sets(floats(min_value=1e-5, max_value=100.0)),
+           lists(floats(min_value=1e-5, max_value=100.0)),
+           floats(min_value=0.0, max_value=10.0))
+    def test_vectorized_matches_scalar(self,
+                                       clusters: Set[float],
+                                       values: List[float],
+                                       max_distance: float) -> None:
+        assert (cluster(None, clusters, values, max_distance,
+                        distance_matrix_function=vectorized_euclidean) ==
+                cluster(euclidean, clusters, values, max_distance))
+
+    def test_vectorized_unhashable_values(self) -> None:
+        def distance(values: List[List[float]],
+                     clusters: List[float]) -> np.ndarray:
+            return vectorized_euclidean([v[0] for v in values], clusters)
+
+        assert (cluster(None, {0.0, 10.0}, [[0.5], [9.5], [5.0]],
+                        distance_matrix_function=distance) ==
+                {0.0: [[0.5]], 10.0: [[9.5]]})
+
+    def test_needs_exactly_one_distance_function(self) -> None:
+        with pytest.raises(ValueError):
+            cluster(None, {0.0}, [0.5])
+        with pytest.raises(ValueError):
+            cluster(euclidean, {0.0}, [0.5],
+                    distance_matrix_function=vectorized_euclidean)
+
+
+class TestClusterIndices:
+
+    def test_earliest_cluster_wins_ties(self) -> None:
+        distance_matrix = [[0.5, 0.5, 0.7],
+                           [0.9, 0.2, 0.2],
+                           [1.0, 2.0, 3.0]]
+        assert cluster_indices(distance_matrix).tolist() == [0, 1, -1]
+
+    def test_max_distance(self) -> None:
+        distance_matrix = [[0.5, 0.4], [0.5, 0.6]]
+        assert cluster_indices(distance_matrix, 0.5).tolist() == [1, -1]
+        assert cluster_indices(distance_matrix, 0.4).tolist() == [-1, -1]
+
+    def test_nan_never_matches(self) -> None:
+        distance_matrix = [[np.nan, 0.5], [np.nan, np.nan]]
+        assert cluster_indices(distance_matrix).tolist() == [1, -1]
+
+    def test_empty(self) -> None:
+        assert cluster_indices(np.zeros((3, 0))).tolist() == [-1, -1, -1]
+        assert cluster_indices(np.zeros((0, 3))).tolist() == []
+
+    def test_invalid_shape_raises(self) -> None:
+        with pytest.raises(ValueError):
+            cluster_indices(np.zeros(3))
@@ -1,10 +1,25 @@
 from random import random, randint
-from typing import List, Set
+from typing import List, Set, Tuple
 
+import numpy as np
+import pytest
 from hypothesis import given
-from hypothesis._strategies import floats, lists
-
-from paitypes.common.optimization import linear_sum_match
+from hypothesis._strategies import floats, integers, lists, tuples
+from hypothesis.extra.numpy import arrays
+from numpy.testing import assert_allclose, assert_array_equal
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment
+
+from paitypes.common.optimization import (gated_linear_sum_assignment,
+                                          linear_sum_match,
+                                          center_distance_cost,
+                                          iou_cost,
+                                          sparse_iou_cost,
+                                          keypoint_distance_cost)
+from paitypes.geometry.Point import Point
+from paitypes.geometry.bounding_box import BoundingBox, BoundingBoxArray
+from paitypes.geometry.bounding_box.BoundingBox import get_iou
+from paitypes.tests.strategies import bounding_boxes
 
 
 def euclidean(x: float, y: float) -> float:
@@ -52,3 +67,151 @@ def test_empty_to_list(fs: List[float]) -> None:
     assert matches == []
     assert unmatched_1 == []
     assert unmatched_2 == list(range(len(fs)))
+
+
+def vectorized_euclidean(xs: List[float], ys: List[float]) -> np.ndarray:
+    diff = np.subtract.outer(np.array(xs, dtype=np.float64),
+                             np.array(ys, dtype=np.float64))
+    return diff * diff
+
+
+def assert_same_match(result: Tuple, expected: Tuple) -> None:
+    assert result[:3] == expected[:3]
+    assert_allclose(result[3], expected[3], rtol=1e-12)
+
+
+@given(lists(floats(min_value=1e-5, max_value=100.0)),
+       lists(floats(min_value=1e-5, max_value=100.0)))
+def test_vectorized_matches_scalar(fs1: List[float], fs2: List[float]) -> None:
+    assert_same_match(
+        linear_sum_match(fs1, fs2, vectorized_euclidean, vectorized=True),
+        linear_sum_match(fs1, fs2, euclidean))
+
+
+@given(lists(bounding_boxes(), max_size=20),
+       lists(bounding_boxes(), max_size=20))
+def test_iou_cost_matches_scalar(bboxes1: List[BoundingBox],
+                                 bboxes2: List[BoundingBox]) -> None:
+    assert_same_match(
+        linear_sum_match(bboxes1, bboxes2, iou_cost, vectorized=True),
+        linear_sum_match(bboxes1, bboxes2,
+                         lambda a, b: 1.0 - get_iou(a, b)))
+
+
+@given(lists(bounding_boxes(), max_size=20),
+       lists(bounding_boxes(), max_size=20))
+def test_center_distance_cost_matches_scalar(bboxes1: List[BoundingBox],
+                                             bboxes2: List[BoundingBox]
+                                             ) -> None:
+    result = linear_sum_match(BoundingBoxArray.from_bboxes(bboxes1),
+                              BoundingBoxArray.from_bboxes(bboxes2),
+                              center_distance_cost, vectorized=True)
+    expected = linear_sum_match(bboxes1, bboxes2, BoundingBox.distance)
+    assert result[:3] == expected[:3]
+    assert_array_equal(result[3], expected[3])
+
+
+def test_keypoint_distance_cost() -> None:
+    points1 = [Point(0.0, 0.0), Point(10.0, 10.0)]
+    points2 = [Point(9.0, 9.0), Point(1.0, 0.0), Point(50.0, 50.0)]
+    matches, unmatched_1, unmatched_2, cost_matrix = linear_sum_match(
+        points1, points2, keypoint_distance_cost, vectorized=True)
+
+    assert matches == [(1, 0), (0, 1)]
+    assert unmatched_1 == []
+    assert unmatched_2 == [2]
+    assert cost_matrix.shape == (3, 2)
+
+
+def reference_assignment(cost_matrix: np.ndarray,
+                         max_cost: float) -> Tuple[int, float]:
+    """Number and total cost of the pairs of a single big-M solve."""
+    feasible = cost_matrix <= max_cost
+    if not feasible.any():
+        return 0, 0.0
+    costs = cost_matrix[feasible]
+    shifted = np.where(feasible, cost_matrix - costs.min(), 0.0)
+    big_m = (shifted.max() + 1.0) * (min(cost_matrix.shape) + 1)
+    rows, cols = linear_sum_assignment(np.where(feasible, shifted, big_m))
+    keep = feasible[rows, cols]
+    return int(keep.sum()), float(cost_matrix[rows, cols][keep].sum())
+
+
+@given(arrays(np.float64, tuples(integers(0, 7), integers(0, 7)),
+              elements=floats(min_value=0.0, max_value=10.0)),
+       floats(min_value=0.0, max_value=10.0))
+def test_gated_assignment_matches_reference(cost_matrix: np.ndarray,
+                                            max_cost: float) -> None:
+    rows, cols = gated_linear_sum_assignment(cost_matrix, max_cost)
+    assert len(set(rows.tolist())) == len(rows)
+    assert len(set(cols.tolist())) == len(cols)
+    assert (cost_matrix[rows, cols] <= max_cost).all()
+
+    n_matched, total_cost = reference_assignment(cost_matrix, max_cost)
+    assert len(rows) == n_matched
+    assert cost_matrix[rows, cols].sum() == pytest.approx(total_cost,
+                                                          abs=1e-9)
+
+
+@given(arrays(np.float64, tuples(integers(1, 7), integers(1, 7)),
+              elements=floats(min_value=0.0, max_value=10.0)))
+def test_gated_assignment_without_gate(cost_matrix: np.ndarray) -> None:
+    rows, cols = gated_linear_sum_assignment(cost_matrix)
+    expected_rows, expected_cols = linear_sum_assignment(cost_matrix)
+    assert len(rows) == len(expected_rows)
+    assert cost_matrix[rows, cols].sum() == pytest.approx(
+        cost_matrix[expected_rows, expected_cols].sum(), abs=1e-9)
+
+
+def test_gated_assignment_sparse() -> None:
+    cost_matrix = sparse.coo_matrix(([0.0, 2.0, 1.0, 5.0],
+                                     ([0, 0, 1, 3], [0, 1, 0, 2])),
+                                    shape=(4, 3))
+    rows, cols = gated_linear_sum_assignment(cost_matrix)
+    assert rows.tolist() == [0, 1, 3]
+    assert cols.tolist() == [1, 0, 2]
+
+    rows, cols = gated_linear_sum_assignment(cost_matrix, max_cost=1.5)
+    assert rows.tolist() == [0]
+    assert cols.tolist() == [0]
+
+
+def test_linear_sum_match_max_cost() -> None:
+    points1 = [Point(0.0, 0.0), Point(10.0, 10.0), Point(100.0, 0.0)]
+    points2 = [Point(9.0, 9.0), Point(1.0, 0.0), Point(50.0, 50.0)]
+    matches, unmatched_1, unmatched_2, _ = linear_sum_match(
+        points1, points2, keypoint_distance_cost, vectorized=True,
+        max_cost=5.0)
+
+    assert matches == [(1, 0), (0, 1)]
+    assert unmatched_1 == [2]
+    assert unmatched_2 == [2]
+
+
+def test_linear_sum_match_sparse_cost() -> None:
+    def sparse_cost(xs: List[float], ys: List[float]) -> sparse.spmatrix:
+        return sparse.csr_matrix(
+            np.where(vectorized_euclidean(xs, ys) < 1.0, 1.0, 0.0))
+
+    matches, unmatched_1, unmatched_2, _ = linear_sum_match(
+        [0.0, 5.0, 10.0], [10.2, 20.0], sparse_cost, vectorized=True)
+    assert matches == [(2, 0)]
+    assert unmatched_1 == [0, 1]
+    assert unmatched_2 == [1]
+
+
+@given(lists(bounding_boxes(), max_size=20),
+       lists(bounding_boxes(), max_size=20))
+def test_sparse_iou_cost_matches_dense(bboxes1: List[BoundingBox],
+                                       bboxes2: List[BoundingBox]) -> None:
+    cost_matrix = sparse_iou_cost(bboxes1, bboxes2)
+    dense_cost_matrix = iou_cost(bboxes1, bboxes2)
+    assert cost_matrix.shape == (len(bboxes1), len(bboxes2))
+
+    stored = np.zeros(cost_matrix.shape, dtype=bool)
+    entries = cost_matrix.tocoo()
+    stored[entries.row, entries.col] = True
+    assert (stored == (dense_cost_matrix < 1.0)).all()
+    assert_allclose(entries.data,
+                    dense_cost_matrix[entries.row, entries.col],
+                    rtol=1e-12, atol=1e-12)
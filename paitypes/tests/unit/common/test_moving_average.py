@@ -1,12 +1,14 @@
 from typing import Any, List
 
+import numpy as np
 import pytest
 from hypothesis import given, assume
 from hypothesis.strategies import integers
 from hypothesis.strategies import floats
 from hypothesis.strategies import lists
 
-from paitypes.common.sequence import moving_average
+from paitypes.common.sequence import (moving_average, moving_window,
+                                      sliding_windows)
 
 
 def test_simple_case() -> None:
@@ -55,3 +57,62 @@ def test_length_when_window_size_lte_list(l: List[float],
 def test_length_when_window_size_gt_list(l: List[float],
                                          window_size: int) -> None:
     assert len(moving_average(l, window_size)) == 1
+
+
+@given(lists(floats(min_value=-1e6, max_value=1e6), max_size=50),
+       integers(min_value=1, max_value=60))
+def test_array_matches_list(l: List[float], window_size: int) -> None:
+    ma = moving_average(np.array(l), window_size)
+    assert isinstance(ma, np.ndarray)
+    np.testing.assert_allclose(ma, moving_average(l, window_size),
+                               rtol=1e-9, atol=1e-6)
+
+
+@given(lists(floats(allow_nan=False, allow_infinity=False)))
+def test_array_window_size_one_is_identity(l: List[float]) -> None:
+    assert moving_average(np.array(l), 1).tolist() == l
+
+
+def test_array_non_finite_values_stay_in_their_windows() -> None:
+    l = [1.0, float('nan'), 3.0, 4.0, float('inf'), 6.0]
+    ma = moving_average(np.array(l), 2)
+    np.testing.assert_array_equal(ma, moving_average(l, 2))
+    np.testing.assert_array_equal(ma, [np.nan, np.nan, 3.5, np.inf,
+                                       np.inf])
+
+
+def test_array_non_positive_window_size_raises() -> None:
+    with pytest.raises(ValueError):
+        moving_average(np.arange(3.0), 0)
+
+
+def test_array_long_signal() -> None:
+    signal = np.random.RandomState(0).normal(1e4, 10.0, 100000)
+    expected = np.convolve(signal, np.ones(1000) / 1000, mode='valid')
+    np.testing.assert_allclose(moving_average(signal, 1000), expected,
+                               rtol=1e-12)
+
+
+@pytest.mark.parametrize('f', [np.mean, np.sum, np.min, np.max, np.median,
+                               np.std, np.var, np.ptp])
+@given(lists(floats(min_value=-1e6, max_value=1e6), max_size=30),
+       integers(min_value=1, max_value=40))
+def test_moving_window_fast_path(f: Any, l: List[float],
+                                 window_size: int) -> None:
+    expected = moving_window(lambda w: f(w), np.array(l), window_size)
+    result = moving_window(f, np.array(l), window_size)
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-6)
+
+
+def test_moving_window_multidimensional() -> None:
+    a = np.arange(12.0).reshape(6, 2)
+    assert moving_window(np.max, a, 3).tolist() == [5.0, 7.0, 9.0, 11.0]
+
+
+def test_sliding_windows() -> None:
+    windows = sliding_windows(np.arange(5), 3)
+    assert windows.tolist() == [[0, 1, 2], [1, 2, 3], [2, 3, 4]]
+    assert not windows.flags.writeable
+    with pytest.raises(ValueError):
+        sliding_windows(np.arange(5), 6)
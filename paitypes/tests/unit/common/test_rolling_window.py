@@ -0,0 +1,108 @@
+from typing import Any, List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers, lists
+
+from paitypes.common.sequence import (RollingMax, RollingMean, RollingMedian,
+                                      RollingMin, RollingSum,
+                                      RollingVariance, RollingWindow,
+                                      moving_average)
+
+OPERATORS = [(RollingSum, np.sum),
+             (RollingMean, np.mean),
+             (RollingVariance, np.var),
+             (RollingMin, np.min),
+             (RollingMax, np.max),
+             (RollingMedian, np.median)]
+
+
+def expected_values(f: Any, values: List[float],
+                    window_size: int) -> List[float]:
+    return [f(values[max(i - window_size + 1, 0):i + 1])
+            for i in range(len(values))]
+
+
+@pytest.mark.parametrize('operator, f', OPERATORS)
+@given(lists(floats(min_value=-1e6, max_value=1e6)),
+       integers(min_value=1, max_value=20))
+def test_matches_numpy(operator: Any, f: Any, values: List[float],
+                       window_size: int) -> None:
+    np.testing.assert_allclose(list(operator(window_size)(values)),
+                               expected_values(f, values, window_size),
+                               rtol=1e-6, atol=1e-3)
+
+
+@pytest.mark.parametrize('operator, f', OPERATORS)
+@given(lists(integers(min_value=0, max_value=3)),
+       integers(min_value=1, max_value=6))
+def test_matches_numpy_with_ties(operator: Any, f: Any, values: List[int],
+                                 window_size: int) -> None:
+    floats = [float(v) for v in values]
+    np.testing.assert_allclose(list(operator(window_size)(floats)),
+                               expected_values(f, floats, window_size),
+                               atol=1e-9)
+
+
+@given(lists(floats(min_value=-1e6, max_value=1e6), min_size=1),
+       integers(min_value=1, max_value=20))
+def test_mean_matches_moving_average(values: List[float],
+                                     window_size: int) -> None:
+    means = list(RollingMean(window_size)(values))
+    window_size = min(window_size, len(values))
+    np.testing.assert_allclose(means[window_size - 1:],
+                               moving_average(values, window_size),
+                               rtol=1e-9, atol=1e-6)
+
+
+def test_long_stream_does_not_drift() -> None:
+    values = np.random.RandomState(0).normal(1e6, 1.0, 20000)
+    rolling_mean, rolling_variance = RollingMean(10), RollingVariance(10)
+    for value in values.tolist():
+        rolling_mean.push(value)
+        rolling_variance.push(value)
+    assert rolling_mean.value == pytest.approx(values[-10:].mean(),
+                                               rel=1e-15)
+    assert rolling_variance.value == pytest.approx(values[-10:].var(),
+                                                   rel=1e-6)
+
+
+def test_median_memory_is_bounded() -> None:
+    rolling_median = RollingMedian(5)
+    for value in range(10000):
+        assert rolling_median.push(float(value)) == max(value - 2.0, value / 2)
+    assert len(rolling_median) == 5
+    assert (len(rolling_median._low) + len(rolling_median._high) <=
+            2 * rolling_median.window_size)
+
+
+def test_variance_ddof() -> None:
+    rolling_variance = RollingVariance(3, ddof=1)
+    assert np.isnan(rolling_variance.push(1.0))
+    assert rolling_variance.push(3.0) == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize('operator', [RollingSum, RollingMean,
+                                      RollingVariance, RollingMin,
+                                      RollingMax, RollingMedian])
+def test_window_size(operator: Any) -> None:
+    rolling: RollingWindow = operator(3)
+    assert len(rolling) == 0
+    for _ in range(5):
+        rolling.push(1.0)
+    assert len(rolling) == 3
+    with pytest.raises(ValueError):
+        operator(0)
+
+
+def test_min_max_keep_equal_values() -> None:
+    values = [2.0, 1.0, 1.0, 3.0, 3.0, 2.0, 0.0]
+    assert list(RollingMin(2)(values)) == [2.0, 1.0, 1.0, 1.0, 3.0, 2.0, 0.0]
+    assert list(RollingMax(2)(values)) == [2.0, 2.0, 1.0, 3.0, 3.0, 3.0, 2.0]
+
+
+def test_window_is_abstract() -> None:
+    window_type: Any = RollingWindow
+    with pytest.raises(TypeError):
+        window_type(3)
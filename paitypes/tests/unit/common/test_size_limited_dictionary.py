@@ -1,8 +1,16 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+import numpy as np
 import pytest
-from typing import Any
 from hypothesis import given, strategies
 
-from paitypes.common.containers import SizeLimitedDictionary
+from paitypes.common.containers import (CacheStatistics,
+                                        ConcurrentSizeLimitedDictionary,
+                                        InstrumentedSizeLimitedDictionary,
+                                        SizeLimitedDictionary)
 
 _DEFAULT = 'default'
 
@@ -59,3 +67,252 @@ def test_old_keys_set_to_default() -> None:
         d[i] = i
 
     assert d[0] == _DEFAULT
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_replacing_a_key_does_not_evict() -> None:
+    d = SizeLimitedDictionary(max_size=2)
+    d['a'] = 1
+    d['b'] = 2
+    d['a'] = 3
+    assert list(d.items()) == [('a', 3), ('b', 2)]
+
+
+def test_lru_refreshes_on_read() -> None:
+    d = SizeLimitedDictionary(max_size=2, lru=True)
+    d['a'] = 1
+    d['b'] = 2
+    assert d['a'] == 1
+    d['c'] = 3
+    assert list(d.keys()) == ['a', 'c']
+    assert d.get('a') == 1
+    d['d'] = 4
+    assert list(d.keys()) == ['a', 'd']
+    assert d.get('x') is None
+
+
+def test_without_lru_reads_do_not_refresh() -> None:
+    d = SizeLimitedDictionary(max_size=2)
+    d['a'] = 1
+    d['b'] = 2
+    assert d['a'] == 1
+    d['c'] = 3
+    assert list(d.keys()) == ['b', 'c']
+
+
+def test_ttl() -> None:
+    timer = FakeTimer()
+    d = SizeLimitedDictionary(max_size=10, ttl=1.0, timer=timer)
+    d['a'] = 1
+    timer.now = 0.5
+    d['b'] = 2
+    assert 'a' in d
+    timer.now = 1.0
+    assert 'a' not in d
+    assert d['b'] == 2
+    d['b'] = 3
+    timer.now = 2.0
+    assert list(d.items()) == [('b', 3)]
+    timer.now = 2.5
+    assert d.get('b') is None
+    assert len(d) == 0
+
+
+def test_ttl_with_default_factory() -> None:
+    timer = FakeTimer()
+    d = SizeLimitedDictionary(default_factory=lambda: _DEFAULT, ttl=1.0,
+                              timer=timer)
+    d['a'] = 1
+    timer.now = 5.0
+    assert d['a'] == _DEFAULT
+
+
+def test_byte_budget() -> None:
+    d = SizeLimitedDictionary(max_size=100, max_bytes=3000)
+    d['a'] = np.zeros(1000, dtype=np.uint8)
+    d['b'] = np.zeros(1000, dtype=np.uint8)
+    d['c'] = np.zeros(1000, dtype=np.uint8)
+    assert d.n_bytes == 3000
+    d['d'] = np.zeros(1500, dtype=np.uint8)
+    assert list(d.keys()) == ['c', 'd']
+    assert d.n_bytes == 2500
+
+    d['c'] = np.zeros(10, dtype=np.uint8)
+    assert d.n_bytes == 1510
+    del d['c']
+    assert d.pop('d').nbytes == 1500
+    assert d.n_bytes == 0
+
+
+def test_byte_budget_rejects_oversized_item() -> None:
+    d = SizeLimitedDictionary(max_size=100, max_bytes=100)
+    d['a'] = np.zeros(10, dtype=np.uint8)
+    d['b'] = np.zeros(1000, dtype=np.uint8)
+    assert list(d.keys()) == ['a']
+    assert d.n_bytes == 10
+
+
+def test_byte_budget_on_replacing_oldest_key() -> None:
+    d = SizeLimitedDictionary(max_size=100, max_bytes=100)
+    d['a'] = np.zeros(40, dtype=np.uint8)
+    d['b'] = np.zeros(30, dtype=np.uint8)
+    d['c'] = np.zeros(30, dtype=np.uint8)
+    d['a'] = np.zeros(70, dtype=np.uint8)
+    assert list(d.keys()) == ['a', 'c']
+    assert d.n_bytes == 100
+
+    d['a'] = np.zeros(130, dtype=np.uint8)
+    assert list(d.keys()) == ['a', 'c']
+    assert d['a'].nbytes == 70
+    assert d.n_bytes == 100
+
+
+def test_lru_default_factory_over_byte_budget() -> None:
+    d = SizeLimitedDictionary(3, lambda: np.zeros(100), lru=True,
+                              max_bytes=10)
+    d['a'] = np.zeros(1, dtype=np.uint8)
+    assert d['x'].shape == (100,)
+    assert list(d.keys()) == ['a']
+
+
+def test_max_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        SizeLimitedDictionary(max_size=0)
+
+
+def test_evict_hook() -> None:
+    evicted = []
+
+    class Recording(SizeLimitedDictionary):
+        def _evict(self, key: Any, value: Any) -> None:
+            evicted.append((key, value))
+
+    d = Recording(max_size=2)
+    for i in range(4):
+        d[i] = str(i)
+    d.popitem()
+    assert evicted == [(0, '0'), (1, '1')]
+
+
+def test_statistics() -> None:
+    timer = FakeTimer()
+    d = InstrumentedSizeLimitedDictionary(3, lambda: _DEFAULT, ttl=10.0,
+                                          timer=timer)
+    for key in [0, 1, 0, 2, 3, 0]:
+        _ = d[key]
+    assert d.get(1) is None
+    assert d.get(2) == _DEFAULT
+    assert 5 not in d
+
+    statistics = d.statistics
+    assert (statistics.hits, statistics.misses) == (2, 6)
+    assert statistics.factory_calls == 5
+    assert statistics.factory_time >= 0.0
+    assert statistics.evictions == 2
+    assert statistics.peak_size == 3
+    assert statistics.hit_rate == pytest.approx(2 / 8)
+
+    timer.now = 20.0
+    d[4] = 'value'
+    assert d.statistics.evictions == 5
+    assert statistics.evictions == 2
+
+
+def test_reset_statistics() -> None:
+    d = InstrumentedSizeLimitedDictionary(10, lambda: _DEFAULT)
+    _ = d['a'], d['a'], d['b']
+    assert d.reset_statistics().hits == 1
+    assert d.statistics == CacheStatistics(peak_size=2)
+    assert d.statistics.hit_rate == 0.0
+
+
+def run_in_threads(f: Callable[[int], Any], n_threads: int) -> List[Any]:
+    with ThreadPoolExecutor(n_threads) as executor:
+        return list(executor.map(f, range(n_threads)))
+
+
+def test_concurrent_single_flight_factory() -> None:
+    calls = []
+
+    def factory() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        return _DEFAULT
+
+    d = ConcurrentSizeLimitedDictionary(10, factory)
+    barrier = threading.Barrier(8)
+
+    def read(_: int) -> str:
+        barrier.wait()
+        return d['a']
+
+    assert run_in_threads(read, 8) == [_DEFAULT] * 8
+    assert len(calls) == 1
+    assert d['a'] == _DEFAULT
+    assert len(calls) == 1
+
+
+def test_concurrent_factory_exception() -> None:
+    calls = []
+    barrier = threading.Barrier(4)
+
+    def factory() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        if len(calls) == 1:
+            raise RuntimeError('failed')
+        return _DEFAULT
+
+    d = ConcurrentSizeLimitedDictionary(10, factory)
+
+    def read(_: int) -> Any:
+        barrier.wait()
+        try:
+            return d['a']
+        except RuntimeError as e:
+            return e
+
+    results = run_in_threads(read, 4)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert d['a'] == _DEFAULT
+    assert len(calls) == 2
+
+
+def test_concurrent_eviction() -> None:
+    d = ConcurrentSizeLimitedDictionary(max_size=10)
+
+    def write(thread: int) -> None:
+        for i in range(1000):
+            d[(thread, i)] = i
+            assert len(d) <= 10
+
+    run_in_threads(write, 4)
+    assert len(d) == 10
+    assert len(d.items()) == 10
+
+
+def test_concurrent_dictionary() -> None:
+    timer = FakeTimer()
+    d = ConcurrentSizeLimitedDictionary(max_size=2, lru=True, ttl=1.0,
+                                        timer=timer)
+    d['a'] = 1
+    d['b'] = 2
+    assert d['a'] == 1
+    d['c'] = 3
+    assert d.keys() == ['a', 'c']
+    assert 'b' not in d
+    assert d.get('b', 0) == 0
+    with pytest.raises(KeyError):
+        _ = d['b']
+    timer.now = 1.0
+    assert len(d.items()) == 0
+    d['a'] = 1
+    assert d.pop('a') == 1
+    assert len(d) == 0
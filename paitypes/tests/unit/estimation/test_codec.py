@@ -0,0 +1,89 @@
+import struct
+
+import numpy as np
+import pytest
+
+from paitypes.common.DataError import DataError
+from paitypes.estimation.DetectedObject import DetectedObject, Label
+from paitypes.estimation.HumanArray import HumanArray
+from paitypes.estimation.InferenceResponse import InferenceResponse
+from paitypes.estimation.codec import (CodecError, DecodedResponse,
+                                       RemoteError, decode_response,
+                                       encode_response)
+from paitypes.estimation.pose import CocoPart, Human, Pair
+from paitypes.geometry.bounding_box import BoundingBox
+
+
+def as_tuples(human: Human) -> tuple:
+    return ({part_idx: (part.uidx, part.x, part.y, part.score)
+             for part_idx, part in human.body_parts.items()}, human.score)
+
+
+def response() -> InferenceResponse:
+    human = Human([Pair(3, 7, CocoPart.Nose.value, CocoPart.Neck.value,
+                        (0.1, 0.2), (0.3, 0.4), 0.9)])
+    human.score = 1.5
+    detection = DetectedObject(ID=4,
+                               bounding_box=BoundingBox(1.0, 2.0, 3.0, 4.5),
+                               label=Label.SEATBELT,
+                               confidence=0.25,
+                               verified=False)
+    return InferenceResponse(pose_estimation_results=[[human, Human([])], [],
+                                                      [human]],
+                             object_detections_results=[[], [detection]])
+
+
+def test_round_trip() -> None:
+    expected = response()
+    decoded = decode_response(encode_response(expected))
+
+    assert [[as_tuples(human) for human in humans]
+            for humans in decoded.pose_estimation_results] == \
+        [[as_tuples(human) for human in humans]
+         for humans in expected.pose_estimation_results]
+    assert decoded.object_detections_results == \
+        expected.object_detections_results
+    assert decoded.error is None
+
+
+def test_none_results_and_errors() -> None:
+    decoded = decode_response(encode_response(
+        InferenceResponse(error=KeyError('missing'))))
+    assert decoded.pose_estimation_results is None
+    assert decoded.object_detections_results is None
+    assert isinstance(decoded.error, KeyError)
+    assert decoded.error.args == ('missing',)
+
+    decoded = decode_response(encode_response(
+        InferenceResponse(error=DataError('bad data'))))
+    assert isinstance(decoded.error, RemoteError)
+    assert decoded.error.type_name == 'paitypes.common.DataError.DataError'
+    assert decoded.error.message == 'bad data'
+
+
+def test_decoded_arrays_are_views() -> None:
+    humans = HumanArray.zeros(3, dtype=np.float64)
+    humans.keypoints[...] = np.random.RandomState(0).uniform(size=(3, 18, 3))
+    humans.present[:, :5] = True
+    humans.peak_ids[:, :5] = 2
+    buffer = encode_response(InferenceResponse(
+        pose_estimation_results=[humans[:1], humans[1:]]))
+    decoded = DecodedResponse(buffer)
+
+    assert [len(h) for h in decoded.humans] == [1, 2]
+    assert np.shares_memory(decoded.humans[1].keypoints,
+                            np.frombuffer(buffer, dtype=np.uint8))
+    assert (decoded.humans[1].keypoints == humans.keypoints[1:]).all()
+    assert (decoded.humans[1].peak_ids == humans.peak_ids[1:]).all()
+
+
+def test_invalid_buffers_raise() -> None:
+    buffer = encode_response(response())
+    with pytest.raises(CodecError):
+        DecodedResponse(b'NOPE' + buffer[4:])
+    with pytest.raises(CodecError):
+        DecodedResponse(buffer[:4] + struct.pack('<H', 99) + buffer[6:])
+    with pytest.raises(CodecError):
+        DecodedResponse(buffer[:-8])
+    with pytest.raises(CodecError):
+        DecodedResponse(buffer[:10])
@@ -0,0 +1,95 @@
+from typing import List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import lists
+
+from paitypes.estimation.HumanArray import (HumanArray, HumanArrayError,
+                                            HumanPose)
+from paitypes.estimation.pose import CocoPart, Human, Pair
+from paitypes.tests.strategies import humans
+
+
+def assert_same_human(result: Human, expected: Human) -> None:
+    assert result.score == expected.score
+    assert result.body_parts.keys() == expected.body_parts.keys()
+    for idx, part in expected.body_parts.items():
+        other = result.body_parts[idx]
+        assert (other.uidx, other.part_idx, other.x, other.y, other.score) \
+            == (part.uidx, part.part_idx, part.x, part.y, part.score)
+    # The uidxs of parts that a later pair overwrote are dropped
+    stale = expected.uidx_list - {part.uidx
+                                  for part in expected.body_parts.values()}
+    assert result.uidx_list == expected.uidx_list - stale
+
+
+@given(humans())
+def test_pose_round_trip_keeps_parts(human: Human) -> None:
+    assert_same_human(HumanPose.from_human(human).to_human(), human)
+
+
+@given(humans())
+def test_pose_float32(human: Human) -> None:
+    pose = HumanPose.from_human(human, dtype=np.float32)
+    assert pose.keypoints.dtype == np.float32
+    result = pose.to_human()
+    assert result.body_parts.keys() == human.body_parts.keys()
+    for idx, part in human.body_parts.items():
+        assert result.body_parts[idx].x == pytest.approx(part.x, rel=1e-6)
+        assert result.body_parts[idx].uidx == part.uidx
+
+
+@given(lists(humans(), max_size=5))
+def test_array_round_trip_keeps_parts(hs: List[Human]) -> None:
+    humans_array = HumanArray.from_humans(hs)
+    assert humans_array.keypoints.dtype == np.float64
+    assert len(humans_array) == len(hs)
+    assert humans_array.part_counts().tolist() == [h.part_count()
+                                                   for h in hs]
+    for result, expected in zip(humans_array.to_humans(), hs):
+        assert_same_human(result, expected)
+
+
+def test_round_trip_drops_overwritten_uidxs() -> None:
+    human = Human([Pair(3, 7, CocoPart.Nose.value, CocoPart.Neck.value,
+                        (0.5, 0.2), (0.5, 0.4), 0.9),
+                   Pair(4, 7, CocoPart.Nose.value, CocoPart.Neck.value,
+                        (0.6, 0.2), (0.5, 0.4), 0.8)])
+    assert human.uidx_list == {'0-3', '0-4', '17-7'}
+    other = Human([Pair(3, 5, CocoPart.Nose.value, CocoPart.REye.value,
+                        (0.5, 0.2), (0.5, 0.1), 0.9)])
+    assert human.is_connected(other)
+
+    result = HumanPose.from_human(human).to_human()
+    assert result.uidx_list == {'0-4', '17-7'}
+    assert result.pairs == []
+    assert not result.is_connected(other)
+
+
+def test_part_access() -> None:
+    human = Human([Pair(3, 7, CocoPart.Nose.value, CocoPart.Neck.value,
+                        (0.5, 0.2), (0.5, 0.4), 0.9)])
+    pose = HumanPose.from_human(human, dtype=np.float64)
+    nose = pose.part(CocoPart.Nose)
+    assert nose is not None
+    assert (nose.uidx, nose.x, nose.y, nose.score) == ('0-3', 0.5, 0.2, 0.9)
+    assert pose.part(CocoPart.LEye) is None
+    assert pose.peak_ids[CocoPart.Neck.value] == 7
+    assert pose.part_count() == 2
+
+
+def test_getitem() -> None:
+    humans_array = HumanArray.zeros(3)
+    humans_array.present[1, 0] = True
+    assert isinstance(humans_array[1], HumanPose)
+    assert humans_array[1].part_count() == 1
+    assert len(humans_array[1:]) == 2
+    assert len(HumanArray.from_humans([])) == 0
+
+
+def test_invalid_shape_raises() -> None:
+    with pytest.raises(HumanArrayError):
+        HumanPose(np.zeros((17, 3)), np.zeros(17, dtype=bool))
+    with pytest.raises(HumanArrayError):
+        HumanArray(np.zeros((2, 18, 2)), np.zeros((2, 18), dtype=bool))
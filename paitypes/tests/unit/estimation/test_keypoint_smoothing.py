@@ -0,0 +1,105 @@
+import math
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from paitypes.estimation.HumanArray import HumanArray
+from paitypes.estimation.keypoint_smoothing import (KeypointSmoother,
+                                                    SmoothingFilter)
+
+
+class OneEuroFilter:
+    """A One-Euro filter of a single value."""
+
+    def __init__(self, min_cutoff: float, beta: float,
+                 d_cutoff: float) -> None:
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x: Optional[float] = None
+        self.dx = 0.0
+        self.t = 0.0
+
+    @staticmethod
+    def alpha(dt: float, cutoff: float) -> float:
+        r = 2.0 * math.pi * cutoff * dt
+        return r / (r + 1.0)
+
+    def __call__(self, t: float, x: float) -> float:
+        if self.x is None:
+            self.x, self.t = x, t
+            return x
+        dt = t - self.t
+        a_d = self.alpha(dt, self.d_cutoff)
+        self.dx = a_d * (x - self.x) / dt + (1.0 - a_d) * self.dx
+        a = self.alpha(dt, self.min_cutoff + self.beta * abs(self.dx))
+        self.x = a * x + (1.0 - a) * self.x
+        self.t = t
+        return self.x
+
+
+def humans_at(xy: np.ndarray, present: np.ndarray) -> HumanArray:
+    humans = HumanArray.zeros(len(xy), dtype=np.float64)
+    humans.keypoints[:, :, :2] = xy
+    humans.keypoints[:, :, 2] = 1.0
+    humans.present[...] = present
+    return humans
+
+
+def test_one_euro_matches_scalar_filter() -> None:
+    rng = np.random.RandomState(0)
+    smoother = KeypointSmoother(min_cutoff=0.5, beta=2.0, d_cutoff=1.0)
+    filters = [[[OneEuroFilter(0.5, 2.0, 1.0) for _ in range(2)]
+                for _ in range(18)] for _ in range(3)]
+    t = 0.0
+    for _ in range(30):
+        t += rng.uniform(0.01, 0.1)
+        xy = rng.uniform(size=(3, 18, 2))
+        present = rng.uniform(size=(3, 18)) < 0.8
+        result = smoother.update([7, 3, 5], humans_at(xy, present), t)
+        for i in range(3):
+            for part in np.flatnonzero(present[i]).tolist():
+                expected = [f(t, v) for f, v in
+                            zip(filters[i][part], xy[i, part].tolist())]
+                assert result.keypoints[i, part, :2] == \
+                    pytest.approx(expected, rel=1e-12)
+            assert (result.keypoints[i, ~present[i], :2] ==
+                    xy[i, ~present[i]]).all()
+
+
+def test_ema() -> None:
+    smoother = KeypointSmoother(SmoothingFilter.EMA, alpha=0.25)
+    present = np.ones((1, 18), dtype=bool)
+    smoother.update([0], humans_at(np.zeros((1, 18, 2)), present))
+    result = smoother.update([0], humans_at(np.ones((1, 18, 2)), present))
+    assert (result.keypoints[:, :, :2] == 0.25).all()
+    # A missing part keeps its state
+    present[0, 3] = False
+    smoother.update([0], humans_at(np.ones((1, 18, 2)), present))
+    result = smoother.update([0], humans_at(np.ones((1, 18, 2)),
+                                            np.ones((1, 18), dtype=bool)))
+    assert result.keypoints[0, 3, 0] == pytest.approx(0.4375)
+    assert result.keypoints[0, 4, 0] == pytest.approx(1 - 0.75 ** 3)
+
+
+def test_tracks_are_dropped() -> None:
+    smoother = KeypointSmoother(max_misses=1, max_tracks=2)
+    present = np.ones((3, 18), dtype=bool)
+    smoother.update([1, 2, 3], humans_at(np.zeros((3, 18, 2)), present))
+    assert len(smoother) == 2
+    smoother.update([1], humans_at(np.zeros((1, 18, 2)), present[:1]))
+    smoother.update([1], humans_at(np.zeros((1, 18, 2)), present[:1]))
+    assert len(smoother) == 1
+
+
+def test_invalid_updates_raise() -> None:
+    smoother = KeypointSmoother()
+    humans = humans_at(np.zeros((2, 18, 2)), np.ones((2, 18), dtype=bool))
+    with pytest.raises(ValueError):
+        smoother.update([1, 1], humans, 0.0)
+    with pytest.raises(ValueError):
+        smoother.update([1], humans, 0.0)
+    smoother.update([1, 2], humans, 1.0)
+    with pytest.raises(ValueError):
+        smoother.update([1, 2], humans, 1.0)
@@ -0,0 +1,116 @@
+from typing import List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import floats, lists, tuples
+
+from paitypes.estimation.DetectedObject import DetectedObject, Label
+from paitypes.estimation.nms import (NMSMethod, nms_indices,
+                                     non_max_suppression)
+from paitypes.geometry.bounding_box import BoundingBox, BoundingBoxArray
+from paitypes.geometry.bounding_box.BoundingBox import get_iou
+from paitypes.tests.strategies import bounding_boxes
+
+
+def naive_nms(detections: List[DetectedObject],
+              iou_threshold: float) -> List[DetectedObject]:
+    remaining = sorted(detections, key=lambda d: -d.confidence)
+    kept: List[DetectedObject] = []
+    for detection in remaining:
+        if detection.confidence <= 0.0:
+            continue
+        if all(k.label != detection.label or
+               get_iou(k.bounding_box, detection.bounding_box) <=
+               iou_threshold for k in kept):
+            kept.append(detection)
+    return kept
+
+
+def make_detections(boxes_and_scores: List, label: Label = Label.HUMAN
+                    ) -> List[DetectedObject]:
+    return [DetectedObject(ID=i, bounding_box=bbox, label=label,
+                           confidence=score)
+            for i, (bbox, score) in enumerate(boxes_and_scores)]
+
+
+@given(lists(tuples(bounding_boxes(), floats(min_value=0.0, max_value=1.0)),
+             max_size=30),
+       floats(min_value=0.0, max_value=1.0))
+def test_hard_nms_matches_naive(boxes_and_scores: List,
+                                iou_threshold: float) -> None:
+    detections = make_detections(boxes_and_scores)
+    assert (non_max_suppression(detections, iou_threshold) ==
+            naive_nms(detections, iou_threshold))
+
+
+def test_empty_detections() -> None:
+    assert non_max_suppression([]) == []
+
+
+def test_nms_is_class_aware() -> None:
+    bbox = BoundingBox(0.0, 10.0, 0.0, 10.0)
+    detections = [
+        DetectedObject(1, bbox, Label.HUMAN, 0.9),
+        DetectedObject(2, bbox, Label.SEATBELT, 0.8),
+        DetectedObject(3, bbox, Label.HUMAN, 0.7),
+    ]
+    assert [d.ID for d in non_max_suppression(detections)] == [1, 2]
+    assert [d.ID for d in non_max_suppression(detections,
+                                              class_aware=False)] == [1]
+
+
+def test_top_k_limits_result() -> None:
+    detections = make_detections([
+        (BoundingBox(10.0 * i, 10.0 * i + 5.0, 0.0, 5.0), 0.1 * i)
+        for i in range(1, 8)])
+    result = non_max_suppression(detections, top_k=3)
+    assert [d.ID for d in result] == [6, 5, 4]
+
+
+@pytest.mark.parametrize('method', [NMSMethod.LINEAR, NMSMethod.GAUSSIAN])
+def test_soft_nms_decays_overlapping_scores(method: NMSMethod) -> None:
+    detections = make_detections([
+        (BoundingBox(0.0, 10.0, 0.0, 10.0), 0.9),
+        (BoundingBox(0.0, 10.0, 0.0, 8.0), 0.8),
+        (BoundingBox(50.0, 60.0, 0.0, 10.0), 0.7),
+    ])
+    result = non_max_suppression(detections, iou_threshold=0.3,
+                                 method=method, score_threshold=0.01)
+
+    assert [d.ID for d in result] == [0, 2, 1]
+    assert result[0] is detections[0]
+    assert result[1] is detections[2]
+    assert result[2].confidence < 0.8
+    assert result[2].bounding_box == detections[1].bounding_box
+
+
+def test_soft_nms_linear_decay() -> None:
+    bboxes = BoundingBoxArray.from_bboxes([
+        BoundingBox(0.0, 10.0, 0.0, 10.0),
+        BoundingBox(0.0, 10.0, 0.0, 5.0),
+    ])
+    kept, scores = nms_indices(bboxes, np.array([1.0, 1.0]),
+                               iou_threshold=0.3, method=NMSMethod.LINEAR)
+    assert kept.tolist() == [0, 1]
+    assert scores.tolist() == [1.0, 0.5]
+
+
+def test_soft_nms_without_overlap_equals_hard_nms() -> None:
+    bboxes = BoundingBoxArray.from_bboxes([
+        BoundingBox(20.0 * i, 20.0 * i + 10.0, 0.0, 10.0) for i in range(5)])
+    scores = np.array([0.3, 0.9, 0.1, 0.5, 0.7])
+    for method in NMSMethod:
+        kept, kept_scores = nms_indices(bboxes, scores, method=method)
+        assert kept.tolist() == [1, 4, 3, 0, 2]
+        assert kept_scores.tolist() == [0.9, 0.7, 0.5, 0.3, 0.1]
+
+
+def test_invalid_parameters_raise() -> None:
+    bboxes = BoundingBoxArray.zeros(2)
+    with pytest.raises(ValueError):
+        nms_indices(bboxes, np.zeros(3))
+    with pytest.raises(ValueError):
+        nms_indices(bboxes, np.zeros(2), sigma=0.0)
+    with pytest.raises(ValueError):
+        nms_indices(bboxes, np.zeros(2), top_k=-1)
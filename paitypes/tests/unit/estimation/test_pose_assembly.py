@@ -0,0 +1,67 @@
+import itertools
+from typing import List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import lists
+
+from paitypes.estimation.pose import CocoPart, Human, Pair
+from paitypes.estimation.pose_assembly import (assemble_humans,
+                                               assemble_humans_from_pairs)
+from paitypes.tests.strategies import pairs_with_peak_ids
+
+# Few peaks, such that many pairs merge
+pairs = pairs_with_peak_ids(3)
+
+
+def merge_humans(ps: List[Pair]) -> List[Human]:
+    """The merge loop of tf-pose."""
+    humans = [Human([pair]) for pair in ps]
+    while True:
+        merge_items = None
+        for k1, k2 in itertools.combinations(humans, 2):
+            if k1.is_connected(k2):
+                merge_items = (k1, k2)
+                break
+        if merge_items is None:
+            return humans
+        merge_items[0].merge(merge_items[1])
+        humans.remove(merge_items[1])
+
+
+def as_tuples(human: Human) -> dict:
+    return {part_idx: (part.uidx, part.x, part.y, part.score)
+            for part_idx, part in human.body_parts.items()}
+
+
+@given(lists(pairs, max_size=40))
+def test_assemble_humans_matches_merge(ps: List[Pair]) -> None:
+    expected = merge_humans(ps)
+    humans = assemble_humans_from_pairs(ps, dtype=np.float64).to_humans()
+    assert [as_tuples(human) for human in humans] == \
+        [as_tuples(human) for human in expected]
+
+
+def test_last_pair_wins() -> None:
+    nose, neck, rshoulder = (CocoPart.Nose.value, CocoPart.Neck.value,
+                             CocoPart.RShoulder.value)
+    ps = [Pair(0, 0, nose, neck, (0.5, 0.1), (0.5, 0.3), 0.9),
+          Pair(1, 1, nose, neck, (0.1, 0.1), (0.1, 0.3), 0.8),
+          Pair(0, 0, neck, rshoulder, (0.5, 0.3), (0.4, 0.3), 0.7)]
+    humans = assemble_humans_from_pairs(ps, dtype=np.float64)
+
+    assert len(humans) == 2
+    assert humans.part_counts().tolist() == [3, 2]
+    assert humans[0].part(CocoPart.Neck).score == 0.7
+    assert humans[0].part(CocoPart.Nose).score == 0.9
+    assert humans.peak_ids[1, nose] == 1
+
+
+def test_empty_and_invalid() -> None:
+    empty = np.zeros((0, 2), dtype=np.int64)
+    assert len(assemble_humans(empty, empty, np.zeros((0, 2, 2)),
+                               np.zeros(0))) == 0
+    with pytest.raises(ValueError):
+        assemble_humans(np.zeros((3, 2)), np.zeros((3, 2)),
+                        np.zeros((3, 2)), np.zeros(3))
@@ -0,0 +1,72 @@
+from typing import List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import integers, lists, sampled_from
+
+from paitypes.estimation.HumanArray import HumanArray
+from paitypes.estimation.pose import CocoPart, Human, Pair
+from paitypes.estimation.pose_boxes import (face_boxes, tfpose_face_boxes,
+                                            tfpose_upper_body_boxes,
+                                            upper_body_boxes)
+from paitypes.geometry.bounding_box import BoundingBox
+from paitypes.tests.strategies import humans
+
+image_sizes = integers(min_value=1, max_value=2000)
+
+
+def as_xywh(box: dict) -> List[int]:
+    return [box['x'], box['y'], box['w'], box['h']]
+
+
+@given(lists(humans(max_pairs=20), max_size=5), image_sizes, image_sizes,
+       sampled_from([0, 1]))
+def test_face_boxes_match_human(hs: List[Human], img_w: int, img_h: int,
+                                mode: int) -> None:
+    humans_array = HumanArray.from_humans(hs, dtype=np.float64)
+    xywh, is_valid = tfpose_face_boxes(humans_array, img_w, img_h, mode)
+    bboxes, is_valid_bbox = face_boxes(humans_array, img_w, img_h, mode)
+    assert is_valid.tolist() == is_valid_bbox.tolist()
+    for human, box, valid, bbox in zip(hs, xywh.tolist(), is_valid.tolist(),
+                                       bboxes):
+        expected = human.get_face_box(img_w, img_h, mode)
+        assert valid == (expected is not None)
+        if expected is None:
+            continue
+        assert box == as_xywh(expected)
+        if mode == 0:
+            assert bbox == BoundingBox.from_tfpose_dict(expected)
+
+
+@given(lists(humans(max_pairs=20), max_size=5), image_sizes, image_sizes)
+def test_upper_body_boxes_match_human(hs: List[Human], img_w: int,
+                                      img_h: int) -> None:
+    humans_array = HumanArray.from_humans(hs, dtype=np.float64)
+    xywh, is_valid = tfpose_upper_body_boxes(humans_array, img_w, img_h)
+    bboxes, _ = upper_body_boxes(humans_array, img_w, img_h)
+    for human, box, valid, bbox in zip(hs, xywh.tolist(), is_valid.tolist(),
+                                       bboxes):
+        expected = human.get_upper_body_box(img_w, img_h)
+        assert valid == (expected is not None)
+        if expected is not None:
+            assert box == as_xywh(expected)
+            assert bbox == BoundingBox.from_tfpose_dict(expected)
+
+
+def test_face_box_mode_1_is_top_left() -> None:
+    human = Human([Pair(0, 0, CocoPart.Nose.value, CocoPart.Neck.value,
+                        (0.5, 0.2), (0.5, 0.4), 0.9),
+                   Pair(0, 0, CocoPart.REye.value, CocoPart.LEye.value,
+                        (0.45, 0.18), (0.55, 0.18), 0.9)])
+    humans_array = HumanArray.from_humans([human], dtype=np.float64)
+    bboxes, is_valid = face_boxes(humans_array, 100, 100, mode=1)
+    box = human.get_face_box(100, 100, mode=1)
+    assert is_valid.tolist() == [True]
+    assert bboxes[0] == BoundingBox(box['x'], box['x'] + box['w'],
+                                    box['y'], box['y'] + box['h'])
+
+
+def test_upper_body_invalid_image_size_raises() -> None:
+    with pytest.raises(ValueError):
+        tfpose_upper_body_boxes(HumanArray.zeros(1), 0, 100)
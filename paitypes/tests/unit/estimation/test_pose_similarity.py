@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pytest
+
+from paitypes.common.optimization import linear_sum_match
+from paitypes.estimation.HumanArray import HumanArray
+from paitypes.estimation.pose import Human
+from paitypes.estimation.pose_similarity import (COCO_SIGMAS,
+                                                 keypoint_areas,
+                                                 mean_keypoint_distance_cost,
+                                                 mean_keypoint_distance_matrix,
+                                                 oks_cost, oks_matrix)
+
+
+def random_humans(rng: np.random.RandomState, n: int) -> HumanArray:
+    humans = HumanArray.zeros(n, dtype=np.float64)
+    humans.keypoints[...] = rng.uniform(size=(n, 18, 3))
+    humans.present[...] = rng.uniform(size=(n, 18)) < 0.7
+    return humans
+
+
+def pair_oks(human1: Human, human2: Human, img_w: float, img_h: float,
+             area: float) -> float:
+    similarities = []
+    for part_idx, part1 in human1.body_parts.items():
+        part2 = human2.body_parts.get(part_idx)
+        if part2 is None:
+            continue
+        d2 = (((part1.x - part2.x) * img_w) ** 2 +
+              ((part1.y - part2.y) * img_h) ** 2)
+        variance = (2 * COCO_SIGMAS[part_idx]) ** 2
+        similarities.append(
+            math.exp(-d2 / variance / (area + np.spacing(1)) / 2))
+    return sum(similarities) / max(len(human1.body_parts), 1)
+
+
+def test_oks_matches_pairwise() -> None:
+    rng = np.random.RandomState(0)
+    humans1, humans2 = random_humans(rng, 4), random_humans(rng, 5)
+    oks = oks_matrix(humans1.to_humans(), humans2, 640, 480)
+    areas = keypoint_areas(humans1, 640, 480)
+
+    assert oks.shape == (4, 5)
+    for i, human1 in enumerate(humans1.to_humans()):
+        for j, human2 in enumerate(humans2.to_humans()):
+            assert oks[i, j] == pytest.approx(
+                pair_oks(human1, human2, 640, 480, areas[i]))
+    assert np.allclose(oks_matrix(humans1, humans1, 640, 480).diagonal(),
+                       humans1.present.any(axis=1))
+
+
+def test_mean_keypoint_distance() -> None:
+    humans = HumanArray.zeros(2, dtype=np.float64)
+    humans.present[0, :2] = True
+    humans.present[1, 2] = True
+    moved = HumanArray(humans.keypoints + [0.3, 0.4, 0.0],
+                       humans.present.copy())
+    distances = mean_keypoint_distance_matrix(humans, moved)
+    assert distances[0, 0] == pytest.approx(0.5)
+    assert distances[1, 1] == pytest.approx(0.5)
+    assert np.isinf(distances[0, 1])
+
+
+def test_oks_averages_over_reference_parts() -> None:
+    humans = HumanArray.zeros(2, dtype=np.float64)
+    humans.present[0, :4] = True
+    humans.present[1, 0] = True
+    oks = oks_matrix(humans, humans, areas=np.ones(2))
+    assert oks[0, 1] == pytest.approx(0.25)
+    assert oks[1, 0] == pytest.approx(1.0)
+
+
+def test_oks_cost_leaves_out_pairs_without_common_parts() -> None:
+    humans = HumanArray.zeros(2, dtype=np.float64)
+    humans.present[0, 0] = True
+    humans.present[1, 1] = True
+    cost = oks_cost(humans, humans)
+    assert np.isinf(cost[0, 1]) and np.isinf(cost[1, 0])
+    matched_idxs, _, _, _ = linear_sum_match(
+        humans.to_humans()[:1], humans.to_humans()[1:], oks_cost,
+        vectorized=True, max_cost=1.0)
+    assert matched_idxs == []
+
+
+def test_costs_plug_into_linear_sum_match() -> None:
+    rng = np.random.RandomState(1)
+    humans = random_humans(rng, 6)
+    humans.present[:, 0] = True
+    shuffled = [humans.to_humans()[i] for i in [3, 0, 5, 1, 4, 2]]
+
+    for cost in (oks_cost, mean_keypoint_distance_cost):
+        matched_idxs, _, _, _ = linear_sum_match(
+            humans.to_humans(), shuffled, cost, vectorized=True,
+            max_cost=1.0)
+        assert sorted(matched_idxs) == [(0, 1), (1, 3), (2, 5), (3, 0),
+                                        (4, 4), (5, 2)]
@@ -0,0 +1,108 @@
+from typing import List
+
+import pytest
+
+from paitypes.estimation.DetectedObject import DetectedObject, Label
+from paitypes.estimation.tracking import AssociationCost, Tracker
+from paitypes.geometry.bounding_box import BoundingBox
+
+
+def detect(*x_mins: float, label: Label = Label.HUMAN
+           ) -> List[DetectedObject]:
+    return [DetectedObject(ID=-1,
+                           bounding_box=BoundingBox(x, x + 10.0, 0.0, 20.0),
+                           label=label,
+                           confidence=0.9)
+            for x in x_mins]
+
+
+def ids(detections: List[DetectedObject]) -> List[int]:
+    return [detection.ID for detection in detections]
+
+
+def test_ids_persist() -> None:
+    tracker = Tracker()
+    assert ids(tracker.update(detect(0.0, 100.0))) == [0, 1]
+    assert ids(tracker.update(detect(102.0, 2.0))) == [1, 0]
+    assert ids(tracker.update(detect(4.0, 104.0, 200.0))) == [0, 1, 2]
+    assert len(tracker) == 3
+
+
+def test_empty_frames() -> None:
+    tracker = Tracker()
+    assert tracker.update([]) == []
+    assert ids(tracker.update(detect(0.0))) == [0]
+    assert tracker.update([]) == []
+    assert tracker.tracks[0].misses == 1
+
+
+def test_constant_velocity_prediction() -> None:
+    # Moving 6 px per frame, a 10 px wide box overlaps its previous position
+    # too little to be matched without the velocity
+    tracker = Tracker(max_cost=0.5, momentum=0.0)
+    for frame in range(5):
+        assert ids(tracker.update(detect(frame * 3.0))) == [0]
+    for frame in range(5):
+        assert ids(tracker.update(detect(18.0 + frame * 6.0))) == [0]
+
+    track = tracker.tracks[0]
+    assert track.velocity.x == pytest.approx(6.0)
+    assert track.velocity.y == pytest.approx(0.0)
+    assert (track.age, track.hits, track.misses) == (10, 10, 0)
+
+
+def test_missing_tracks_are_dropped() -> None:
+    tracker = Tracker(max_misses=2)
+    tracker.update(detect(0.0))
+    tracker.update([])
+    tracker.update([])
+    assert len(tracker) == 1
+    assert ids(tracker.update(detect(0.0))) == [0]
+
+    for _ in range(3):
+        tracker.update([])
+    assert len(tracker) == 0
+    assert ids(tracker.update(detect(0.0))) == [1]
+
+
+def test_class_aware() -> None:
+    tracker = Tracker()
+    tracker.update(detect(0.0))
+    assert ids(tracker.update(detect(0.0, label=Label.SEATBELT))) == [1]
+
+    tracker = Tracker(class_aware=False)
+    tracker.update(detect(0.0))
+    assert ids(tracker.update(detect(0.0, label=Label.SEATBELT))) == [0]
+
+
+def test_center_distance_cost() -> None:
+    tracker = Tracker(cost=AssociationCost.CENTER_DISTANCE, max_cost=15.0)
+    tracker.update(detect(0.0, 100.0))
+    assert ids(tracker.update(detect(112.0, 20.0))) == [1, 2]
+
+
+def test_min_hits() -> None:
+    tracker = Tracker(min_hits=2)
+    assert tracker.update(detect(0.0)) == []
+    assert ids(tracker.update(detect(1.0, 50.0))) == [0]
+
+
+def test_max_tracks() -> None:
+    tracker = Tracker(max_tracks=2)
+    tracker.update(detect(0.0, 100.0))
+    assert ids(tracker.update(detect(0.0, 100.0, 200.0))) == [0, 1]
+    assert [track.ID for track in tracker.tracks] == [0, 1]
+    # The new track of the detection at 300 is dropped at once
+    detections = detect(300.0, 0.0, 100.0)
+    tracked = tracker.update(detections)
+    assert ids(tracked) == [0, 1]
+    assert tracked[0].bounding_box is detections[1].bounding_box
+
+
+def test_invalid_parameters_raise() -> None:
+    with pytest.raises(ValueError):
+        Tracker(max_tracks=0)
+    with pytest.raises(ValueError):
+        Tracker(momentum=1.0)
+    with pytest.raises(ValueError):
+        Tracker(cost=AssociationCost.CENTER_DISTANCE)
@@ -0,0 +1,77 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from paitypes.estimation.pose import BodyPart, Human
+from paitypes.estimation.trt_pose import parse_trt_pose, parse_trt_pose_humans
+
+
+def random_outputs(rng: np.random.RandomState, n_images: int = 4,
+                   max_objects: int = 5, max_peaks: int = 6) -> tuple:
+    counts = rng.randint(0, max_objects + 1, n_images)
+    objects = rng.randint(-1, max_peaks, (n_images, max_objects, 18))
+    peaks = rng.uniform(size=(n_images, 18, max_peaks, 2))
+    peak_scores = rng.uniform(size=(n_images, 18, max_peaks))
+    return counts, objects, peaks, peak_scores
+
+
+def object_humans(counts: np.ndarray, objects: np.ndarray, peaks: np.ndarray,
+                  peak_scores: np.ndarray) -> List[List[Human]]:
+    """One object at a time, the way trt_pose outputs were parsed."""
+    results = []
+    for image, count in enumerate(counts):
+        humans = []
+        for obj in objects[image, :count]:
+            human = Human([])
+            for part_idx, peak in enumerate(obj):
+                if peak < 0:
+                    continue
+                y, x = peaks[image, part_idx, peak]
+                uidx = '%d-%d' % (part_idx, peak)
+                human.body_parts[part_idx] = BodyPart(
+                    uidx, part_idx, float(x), float(y),
+                    float(peak_scores[image, part_idx, peak]))
+                human.uidx_list.add(uidx)
+            humans.append(human)
+        results.append(humans)
+    return results
+
+
+def as_tuples(human: Human) -> dict:
+    return {part_idx: (part.uidx, part.x, part.y, part.score)
+            for part_idx, part in human.body_parts.items()}
+
+
+def test_parse_matches_object_loop() -> None:
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        outputs = random_outputs(rng)
+        expected = object_humans(*outputs)
+        results = parse_trt_pose_humans(*outputs)
+        assert [[as_tuples(h) for h in humans] for humans in results] == \
+            [[as_tuples(h) for h in humans] for humans in expected]
+
+
+def test_parse_arrays() -> None:
+    rng = np.random.RandomState(1)
+    counts, objects, peaks, _ = random_outputs(rng)
+    results = parse_trt_pose(counts, objects, peaks)
+
+    assert [len(humans) for humans in results] == counts.tolist()
+    for humans in results:
+        assert humans.keypoints.dtype == np.float32
+        assert (humans.part_scores[humans.present] == 1.0).all()
+        assert (humans.keypoints[~humans.present] == 0.0).all()
+        assert (humans.peak_ids[~humans.present] == -1).all()
+
+
+def test_invalid_shapes_raise() -> None:
+    rng = np.random.RandomState(2)
+    counts, objects, peaks, peak_scores = random_outputs(rng)
+    with pytest.raises(ValueError):
+        parse_trt_pose(counts, objects[:, :, :17], peaks)
+    with pytest.raises(ValueError):
+        parse_trt_pose(counts[:2], objects, peaks)
+    with pytest.raises(ValueError):
+        parse_trt_pose(counts, objects, peaks, peak_scores[:, :, :2])
@@ -0,0 +1,268 @@
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import composite, floats, integers, lists
+from numpy.testing import (assert_allclose, assert_array_equal,
+                           assert_array_max_ulp)
+
+from paitypes.geometry.Point import Point
+from paitypes.geometry.Shape import Shape
+from paitypes.geometry.bounding_box import (BoundingBox,
+                                            BoundingBoxArray,
+                                            BoundingBoxError,
+                                            intersection_area_matrix,
+                                            contains_ratio_matrix,
+                                            center_distance_matrix,
+                                            iou_matrix)
+from paitypes.geometry.bounding_box.BoundingBox import (contains_ratio,
+                                                        get_iou,
+                                                        intersection)
+from paitypes.tests.fixtures.fixture_bounding_box import (
+    empty_bbox, full_bbox, partial_bbox, partial_float_bbox)
+from paitypes.tests.strategies import bounding_boxes
+
+
+@given(lists(bounding_boxes()))
+def test_to_bboxes_from_bboxes(bboxes: List[BoundingBox]) -> None:
+    assert BoundingBoxArray.from_bboxes(bboxes).to_bboxes() == bboxes
+
+
+@given(lists(bounding_boxes()))
+def test_dicts_match_scalar(bboxes: List[BoundingBox]) -> None:
+    dicts = [bbox.to_dict() for bbox in bboxes]
+    bbox_array = BoundingBoxArray.from_dicts(dicts)
+    assert bbox_array.to_bboxes() == [BoundingBox.from_dict(datadict)
+                                      for datadict in dicts]
+    assert bbox_array.to_dicts() == dicts
+
+
+@given(lists(bounding_boxes()))
+def test_tfpose_dicts_match_scalar(bboxes: List[BoundingBox]) -> None:
+    dicts = [{'x': bbox.center.x, 'y': bbox.center.y,
+              'w': bbox.delta_x, 'h': bbox.delta_y} for bbox in bboxes]
+    assert BoundingBoxArray.from_tfpose_dicts(dicts).to_bboxes() == \
+        [BoundingBox.from_tfpose_dict(datadict) for datadict in dicts]
+
+
+def test_from_dicts_parses_strings() -> None:
+    bbox_array = BoundingBoxArray.from_dicts(
+        [{'x1': '1.0', 'x2': 2, 'y1': '3', 'y2': 4.0}])
+    assert bbox_array.to_bboxes() == [BoundingBox(1.0, 2.0, 3.0, 4.0)]
+    assert len(BoundingBoxArray.from_tfpose_dicts([])) == 0
+
+
+@pytest.mark.parametrize('datadict', [
+    {'x1': 'a', 'x2': '2.0', 'y1': '3', 'y2': '4'},
+    {'x2': '2.0', 'y1': '3.0', 'y2': '4.0'},
+    {'x1': '1.0', 'x2': '2.0', 'y1': '3.0', 'y2': '4.0', 'y3': '5.0'}
+])
+def test_from_dicts_invalid_input(datadict: Dict) -> None:
+    valid = {'x1': 1.0, 'x2': 2.0, 'y1': 3.0, 'y2': 4.0}
+    with pytest.raises(BoundingBoxError):
+        BoundingBoxArray.from_dicts([valid, datadict])
+
+
+@pytest.mark.parametrize('datadict', [
+    {'x': 'a', 'y': 1, 'w': 2, 'h': 2},
+    {'x': 1, 'y': 1, 'w': 2},
+    {'x': 1, 'y': 1, 'w': -2, 'h': 2},
+    {'x': 1, 'y': 1, 'w': 2, 'h': -2},
+])
+def test_from_tfpose_dicts_invalid_input(datadict: Dict) -> None:
+    valid = {'x': 1, 'y': 1, 'w': 2, 'h': 2}
+    with pytest.raises(BoundingBoxError):
+        BoundingBoxArray.from_tfpose_dicts([valid, datadict])
+
+
+def test_wraps_array_without_copy() -> None:
+    data = np.arange(8, dtype=np.float64).reshape(2, 4)
+    bbox_array = BoundingBoxArray(data)
+    assert bbox_array.data is data
+    assert np.shares_memory(bbox_array.x_max, data)
+
+
+@pytest.mark.parametrize('shape', [(4,), (2, 3), (2, 4, 1)])
+def test_invalid_shape_raises(shape: tuple) -> None:
+    with pytest.raises(BoundingBoxError):
+        BoundingBoxArray(np.zeros(shape))
+
+
+@given(lists(bounding_boxes()))
+def test_properties_match_scalar(bboxes: List[BoundingBox]) -> None:
+    bbox_array = BoundingBoxArray.from_bboxes(bboxes)
+    assert bbox_array.delta_x.tolist() == [b.delta_x for b in bboxes]
+    assert bbox_array.delta_y.tolist() == [b.delta_y for b in bboxes]
+    assert bbox_array.area.tolist() == [b.area for b in bboxes]
+    assert bbox_array.is_empty().tolist() == [b.is_empty() for b in bboxes]
+    assert bbox_array.is_small().tolist() == [b.is_small() for b in bboxes]
+    assert bbox_array.center.to_points() == [b.center for b in bboxes]
+    assert (bbox_array.to_shape().tolist() ==
+            [[b.to_shape().width, b.to_shape().height] for b in bboxes])
+
+
+@given(lists(bounding_boxes()),
+       floats(min_value=-100.0, max_value=100.0),
+       floats(min_value=-100.0, max_value=100.0))
+def test_move_matches_scalar(bboxes: List[BoundingBox],
+                             dx: float,
+                             dy: float) -> None:
+    moved = BoundingBoxArray.from_bboxes(bboxes).move(dx, dy)
+    assert moved.to_bboxes() == [b.move(dx, dy) for b in bboxes]
+
+
+@given(lists(bounding_boxes()),
+       floats(min_value=-10.0, max_value=10.0),
+       floats(min_value=-10.0, max_value=10.0))
+def test_scale_matches_scalar(bboxes: List[BoundingBox],
+                              sx: float,
+                              sy: float) -> None:
+    center = Point(3.0, -7.0)
+    scaled = BoundingBoxArray.from_bboxes(bboxes).scale(Shape(sx, sy), center)
+    assert scaled.to_bboxes() == [b.scale(Shape(sx, sy), center)
+                                  for b in bboxes]
+
+
+@given(lists(bounding_boxes()), bounding_boxes())
+def test_is_inside_matches_scalar(bboxes: List[BoundingBox],
+                                  container: BoundingBox) -> None:
+    bbox_array = BoundingBoxArray.from_bboxes(bboxes)
+    assert (bbox_array.is_inside(container).tolist() ==
+            [b.is_inside(container) for b in bboxes])
+
+
+@given(lists(bounding_boxes()),
+       floats(min_value=-10000.0, max_value=10000.0),
+       floats(min_value=-10000.0, max_value=10000.0),
+       floats(min_value=0.0, max_value=10.0))
+def test_encloses_matches_scalar(bboxes: List[BoundingBox],
+                                 x: float,
+                                 y: float,
+                                 fuzz_factor: float) -> None:
+    bbox_array = BoundingBoxArray.from_bboxes(bboxes)
+    point = Point(x, y)
+    assert (bbox_array.encloses(point, fuzz_factor).tolist() ==
+            [b.encloses(point, fuzz_factor) for b in bboxes])
+
+
+@composite
+def integer_bounding_boxes(draw: Any) -> BoundingBox:
+    x, y = draw(integers(-10000, 10000)), draw(integers(-10000, 10000))
+    w, h = draw(integers(0, 10000)), draw(integers(0, 10000))
+    return BoundingBox(float(x), float(x + w), float(y), float(y + h))
+
+
+@given(lists(integer_bounding_boxes(), min_size=1),
+       lists(integer_bounding_boxes(), min_size=1))
+def test_distance_matches_scalar(bboxes1: List[BoundingBox],
+                                 bboxes2: List[BoundingBox]) -> None:
+    # The squares of half-integer differences are exact, so both formulas
+    # round only in the square root
+    n = min(len(bboxes1), len(bboxes2))
+    distances = BoundingBoxArray.distance(
+        BoundingBoxArray.from_bboxes(bboxes1[:n]),
+        BoundingBoxArray.from_bboxes(bboxes2[:n]))
+    assert distances.tolist() == [BoundingBox.distance(a, b)
+                                  for a, b in zip(bboxes1, bboxes2)]
+
+
+@given(lists(bounding_boxes(), min_size=1),
+       lists(bounding_boxes(), min_size=1))
+def test_distance_matches_scalar_up_to_rounding(
+        bboxes1: List[BoundingBox], bboxes2: List[BoundingBox]) -> None:
+    # `BoundingBox.distance` squares with `math.pow`, which some libms do
+    # not round correctly, while NumPy squares by multiplication
+    n = min(len(bboxes1), len(bboxes2))
+    distances = BoundingBoxArray.distance(
+        BoundingBoxArray.from_bboxes(bboxes1[:n]),
+        BoundingBoxArray.from_bboxes(bboxes2[:n]))
+    assert_array_max_ulp(distances, np.array(
+        [BoundingBox.distance(a, b) for a, b in zip(bboxes1, bboxes2)]),
+        maxulp=2)
+
+
+def test_add_returns_union(full_bbox: BoundingBox,
+                           partial_bbox: BoundingBox) -> None:
+    other = BoundingBox(-100.0, 0.0, -100.0, 0.0)
+    bbox_array = BoundingBoxArray.from_bboxes([full_bbox, partial_bbox])
+    assert ((bbox_array + other).to_bboxes() ==
+            [full_bbox + other, partial_bbox + other])
+
+
+def test_add_empty_bbox_raises(full_bbox: BoundingBox,
+                               empty_bbox: BoundingBox) -> None:
+    bbox_array = BoundingBoxArray.from_bboxes([full_bbox, empty_bbox])
+    with pytest.raises(BoundingBoxError):
+        bbox_array + full_bbox
+
+
+def test_mean_bound(full_bbox: BoundingBox,
+                    partial_bbox: BoundingBox,
+                    partial_float_bbox: BoundingBox) -> None:
+    bboxes = [full_bbox, partial_bbox, partial_float_bbox]
+    assert (BoundingBoxArray.from_bboxes(bboxes).mean_bound() ==
+            BoundingBox.mean_bound(bboxes))
+
+
+def test_getitem(full_bbox: BoundingBox,
+                 partial_bbox: BoundingBox) -> None:
+    bbox_array = BoundingBoxArray.from_bboxes([full_bbox, partial_bbox])
+    assert bbox_array[1] == partial_bbox
+    assert bbox_array[1:].to_bboxes() == [partial_bbox]
+    assert_array_equal(bbox_array[np.array([True, False])].data,
+                       BoundingBoxArray.from_bboxes([full_bbox]).data)
+    assert list(bbox_array) == [full_bbox, partial_bbox]
+
+
+@given(lists(bounding_boxes()), lists(bounding_boxes()))
+def test_intersection_area_matrix_matches_scalar(
+        bboxes1: List[BoundingBox],
+        bboxes2: List[BoundingBox]) -> None:
+    matrix = intersection_area_matrix(bboxes1, bboxes2)
+    assert matrix.shape == (len(bboxes1), len(bboxes2))
+    assert matrix.tolist() == [[intersection(a, b).area for b in bboxes2]
+                               for a in bboxes1]
+
+
+@given(lists(bounding_boxes()), lists(bounding_boxes()))
+def test_contains_ratio_matrix_matches_scalar(
+        bboxes1: List[BoundingBox],
+        bboxes2: List[BoundingBox]) -> None:
+    matrix = contains_ratio_matrix(bboxes1, bboxes2)
+    assert matrix.shape == (len(bboxes1), len(bboxes2))
+    assert matrix.tolist() == [[contains_ratio(a, b) for b in bboxes2]
+                               for a in bboxes1]
+
+
+@given(lists(bounding_boxes()), lists(bounding_boxes()))
+def test_iou_matrix_matches_scalar(bboxes1: List[BoundingBox],
+                                   bboxes2: List[BoundingBox]) -> None:
+    matrix = iou_matrix(BoundingBoxArray.from_bboxes(bboxes1),
+                        BoundingBoxArray.from_bboxes(bboxes2))
+    assert matrix.shape == (len(bboxes1), len(bboxes2))
+    assert matrix.tolist() == [[get_iou(a, b) for b in bboxes2]
+                               for a in bboxes1]
+
+
+def test_iou_matrix_of_empty_bboxes(empty_bbox: BoundingBox,
+                                    full_bbox: BoundingBox) -> None:
+    assert iou_matrix([empty_bbox], [empty_bbox, full_bbox]).tolist() == \
+        [[0.0, 0.0]]
+
+
+def test_inverted_bbox_raises(full_bbox: BoundingBox) -> None:
+    inverted = BoundingBox(10.0, 0.0, 0.0, 10.0)
+    with pytest.raises(BoundingBoxError):
+        iou_matrix([full_bbox], [inverted])
+
+
+@given(lists(bounding_boxes()), lists(bounding_boxes()))
+def test_center_distance_matrix_matches_scalar(
+        bboxes1: List[BoundingBox],
+        bboxes2: List[BoundingBox]) -> None:
+    matrix = center_distance_matrix(bboxes1, bboxes2)
+    assert matrix.shape == (len(bboxes1), len(bboxes2))
+    expected = [[BoundingBox.distance(a, b) for b in bboxes2]
+                for a in bboxes1]
+    assert_allclose(matrix, np.reshape(expected, matrix.shape), rtol=1e-12)
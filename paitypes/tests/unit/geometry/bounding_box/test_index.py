@@ -0,0 +1,74 @@
+from typing import List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import floats, lists, tuples
+
+from paitypes.geometry.Point import Point
+from paitypes.geometry.bounding_box import (BoundingBox,
+                                            BoundingBoxError,
+                                            BoundingBoxIndex)
+from paitypes.tests.strategies import bounding_boxes
+
+coordinates = floats(min_value=-10000.0, max_value=10000.0)
+
+
+@given(lists(bounding_boxes()), coordinates, coordinates,
+       floats(min_value=-10.0, max_value=100.0))
+def test_enclosing_matches_brute_force(bboxes: List[BoundingBox],
+                                       x: float,
+                                       y: float,
+                                       fuzz_factor: float) -> None:
+    index = BoundingBoxIndex(bboxes)
+    point = Point(x, y)
+    assert (index.enclosing(point, fuzz_factor).tolist() ==
+            [i for i, b in enumerate(bboxes)
+             if b.encloses(point, fuzz_factor)])
+
+
+@given(lists(bounding_boxes()),
+       lists(tuples(coordinates, coordinates)),
+       floats(min_value=0.0, max_value=100.0))
+def test_enclosing_many_matches_brute_force(bboxes: List[BoundingBox],
+                                            points: List,
+                                            fuzz_factor: float) -> None:
+    index = BoundingBoxIndex(bboxes)
+    point_idxs, box_idxs = index.enclosing_many(np.array(points),
+                                                fuzz_factor)
+    assert (list(zip(point_idxs.tolist(), box_idxs.tolist())) ==
+            [(i, j) for i, (x, y) in enumerate(points)
+             for j, b in enumerate(bboxes)
+             if b.encloses(Point(x, y), fuzz_factor)])
+
+
+@given(lists(bounding_boxes()), bounding_boxes())
+def test_overlapping_matches_brute_force(bboxes: List[BoundingBox],
+                                         query: BoundingBox) -> None:
+    index = BoundingBoxIndex(bboxes)
+    assert (index.overlapping(query).tolist() ==
+            [i for i, b in enumerate(bboxes)
+             if max(b.x_min, query.x_min) <= min(b.x_max, query.x_max) and
+             max(b.y_min, query.y_min) <= min(b.y_max, query.y_max)])
+
+
+@given(lists(bounding_boxes()), bounding_boxes())
+def test_inside_matches_brute_force(bboxes: List[BoundingBox],
+                                    container: BoundingBox) -> None:
+    index = BoundingBoxIndex(bboxes, cell_size=250.0)
+    assert (index.inside(container).tolist() ==
+            [i for i, b in enumerate(bboxes) if b.is_inside(container)])
+
+
+def test_empty_index() -> None:
+    index = BoundingBoxIndex([])
+    assert len(index) == 0
+    assert index.enclosing(Point(0.0, 0.0)).tolist() == []
+    assert index.inside(BoundingBox(0.0, 1.0, 0.0, 1.0)).tolist() == []
+    point_idxs, box_idxs = index.enclosing_many(np.zeros((3, 2)))
+    assert point_idxs.tolist() == box_idxs.tolist() == []
+
+
+def test_invalid_cell_size_raises() -> None:
+    with pytest.raises(BoundingBoxError):
+        BoundingBoxIndex([BoundingBox(0.0, 1.0, 0.0, 1.0)], cell_size=0.0)
@@ -3,15 +3,23 @@ import numpy as np
 
 from typing import List, Tuple
 
+from hypothesis import given
+from hypothesis._strategies import floats, lists
+
 from paitypes.geometry.bounding_box import (
     BoundingBox,
+    BoundingBoxArray,
     BoundingBoxError,
     pad_to_min_size,
     pad_to_aspect_ratio,
-    pad_abs_amount)
+    pad_abs_amount,
+    pad_to_min_size_array,
+    pad_to_aspect_ratio_array,
+    pad_abs_amount_array)
 
 from paitypes.tests.fixtures.fixture_bounding_box import (
     empty_bbox, full_bbox, partial_bbox, partial_float_bbox)
+from paitypes.tests.strategies import bounding_boxes
 
 
 class TestResizePadBoundingBoxToMinSize(object):
@@ -163,3 +171,59 @@ class TestResizePadBoundingBoxAbsAmount(object):
                                       ) -> None:
         with pytest.raises(BoundingBoxError):
             pad_abs_amount(partial_bbox, shape)
+
+
+class TestPadBoundingBoxArray(object):
+    @given(lists(bounding_boxes()),
+           floats(min_value=0.0, max_value=1000.0),
+           floats(min_value=0.0, max_value=1000.0))
+    def test_pad_to_min_size_matches_scalar(self,
+                                            bboxes: List[BoundingBox],
+                                            height: float,
+                                            width: float) -> None:
+        bboxes = [bbox for bbox in bboxes if not bbox.is_empty()]
+        padded = pad_to_min_size_array(BoundingBoxArray.from_bboxes(bboxes),
+                                       (height, width))
+        assert padded.to_bboxes() == [
+            pad_to_min_size(bbox, (height, width)) for bbox in bboxes]
+
+    @given(lists(bounding_boxes()),
+           floats(min_value=0.0, max_value=1000.0),
+           floats(min_value=0.0, max_value=1000.0))
+    def test_pad_abs_amount_matches_scalar(self,
+                                           bboxes: List[BoundingBox],
+                                           height: float,
+                                           width: float) -> None:
+        bboxes = [bbox for bbox in bboxes if not bbox.is_empty()]
+        padded = pad_abs_amount_array(BoundingBoxArray.from_bboxes(bboxes),
+                                      (height, width))
+        assert padded.to_bboxes() == [
+            pad_abs_amount(bbox, (height, width)) for bbox in bboxes]
+
+    @given(lists(bounding_boxes()), floats(min_value=0.01, max_value=100.0))
+    def test_pad_to_aspect_ratio_matches_scalar(self,
+                                                bboxes: List[BoundingBox],
+                                                aspect_ratio: float) -> None:
+        bboxes = [bbox for bbox in bboxes if not bbox.is_empty()]
+        padded = pad_to_aspect_ratio_array(
+            BoundingBoxArray.from_bboxes(bboxes), aspect_ratio)
+        assert padded.to_bboxes() == [
+            pad_to_aspect_ratio(bbox, aspect_ratio) for bbox in bboxes]
+
+    def test_pad_empty_bbox_raises(self,
+                                   empty_bbox: BoundingBox,
+                                   full_bbox: BoundingBox) -> None:
+        bboxes = BoundingBoxArray.from_bboxes([full_bbox, empty_bbox])
+        with pytest.raises(BoundingBoxError):
+            pad_to_min_size_array(bboxes, (20.0, 20.0))
+        with pytest.raises(BoundingBoxError):
+            pad_abs_amount_array(bboxes, (20.0, 20.0))
+        with pytest.raises(BoundingBoxError):
+            pad_to_aspect_ratio_array(bboxes, 1.0)
+
+    def test_pad_invalid_shape_raises(self, full_bbox: BoundingBox) -> None:
+        bboxes = BoundingBoxArray.from_bboxes([full_bbox])
+        with pytest.raises(BoundingBoxError):
+            pad_to_min_size_array(bboxes, (20.0, -1.0))
+        with pytest.raises(BoundingBoxError):
+            pad_to_aspect_ratio_array(bboxes, 0.0)
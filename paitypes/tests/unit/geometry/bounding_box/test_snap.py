@@ -5,10 +5,16 @@ from typing import List, Tuple
 
 from dataclasses import replace
 
-from paitypes.geometry.bounding_box import BoundingBox, snap_to_shape
+from hypothesis import given
+from hypothesis._strategies import floats, lists
+
+from paitypes.geometry.bounding_box import (BoundingBox, BoundingBoxArray,
+                                            BoundingBoxError, snap_to_shape,
+                                            snap_to_shape_array)
 
 from paitypes.tests.fixtures.fixture_bounding_box import (
     empty_bbox, full_bbox, partial_bbox, partial_float_bbox)
+from paitypes.tests.strategies import bounding_boxes
 
 
 class TestResizeSnapBoundingBoxToShape(object):
@@ -79,3 +85,25 @@ class TestResizeSnapBoundingBoxToShape(object):
         assert (snapped_bbox.y_max == 70.0)
         assert (snapped_bbox.x_min == 50.0)
         assert (snapped_bbox.x_max == 100.0)
+
+
+class TestSnapBoundingBoxArrayToShape(object):
+    @given(lists(bounding_boxes()),
+           floats(min_value=0.0, max_value=10000.0),
+           floats(min_value=0.0, max_value=10000.0))
+    def test_snap_matches_scalar(self,
+                                 bboxes: List[BoundingBox],
+                                 height: float,
+                                 width: float) -> None:
+        bboxes = [bbox for bbox in bboxes if not bbox.is_empty()]
+        snapped = snap_to_shape_array(BoundingBoxArray.from_bboxes(bboxes),
+                                      (height, width))
+        assert snapped.to_bboxes() == [snap_to_shape(bbox, (height, width))
+                                       for bbox in bboxes]
+
+    def test_snap_empty_bbox_raises(self,
+                                    empty_bbox: BoundingBox,
+                                    full_bbox: BoundingBox) -> None:
+        bboxes = BoundingBoxArray.from_bboxes([full_bbox, empty_bbox])
+        with pytest.raises(BoundingBoxError):
+            snap_to_shape_array(bboxes, (100.0, 100.0))
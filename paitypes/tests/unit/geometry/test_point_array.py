@@ -0,0 +1,100 @@
+from typing import List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import builds, floats, lists
+from numpy.testing import assert_allclose
+
+from paitypes.geometry.Point import Point, PointEstimate
+from paitypes.geometry.PointArray import (PointArray, PointArrayError,
+                                          PointEstimateArray)
+from paitypes.geometry.Shape import Shape
+
+coordinates = floats(min_value=-1e4, max_value=1e4)
+points = builds(Point, coordinates, coordinates)
+point_estimates = builds(PointEstimate, coordinates, coordinates,
+                         floats(min_value=0.0, max_value=1.0))
+
+
+@given(lists(points))
+def test_to_points_from_points(ps: List[Point]) -> None:
+    assert PointArray.from_points(ps).to_points() == ps
+
+
+@given(lists(point_estimates))
+def test_estimates_to_points_from_points(ps: List[PointEstimate]) -> None:
+    assert PointEstimateArray.from_points(ps).to_points() == ps
+
+
+def test_invalid_shape_raises() -> None:
+    with pytest.raises(PointArrayError):
+        PointArray(np.zeros((3, 3)))
+    with pytest.raises(PointArrayError):
+        PointEstimateArray(np.zeros((3, 2)))
+
+
+@given(lists(point_estimates), coordinates, coordinates)
+def test_translate_matches_scalar(ps: List[PointEstimate],
+                                  dx: float,
+                                  dy: float) -> None:
+    translated = PointEstimateArray.from_points(ps).translate(Shape(dx, dy))
+    assert isinstance(translated, PointEstimateArray)
+    assert translated.data[:, :2].tolist() == [
+        [p.translate(Shape(dx, dy)).x, p.translate(Shape(dx, dy)).y]
+        for p in ps]
+    assert translated.confidence.tolist() == [p.confidence for p in ps]
+
+
+@given(lists(points), lists(points))
+def test_distance_matrix_matches_scalar(ps1: List[Point],
+                                        ps2: List[Point]) -> None:
+    matrix = PointArray.from_points(ps1).distance_matrix(
+        PointArray.from_points(ps2))
+    assert matrix.shape == (len(ps1), len(ps2))
+    expected = [[p1.distance_to_point(p2) for p2 in ps2] for p1 in ps1]
+    assert_allclose(matrix, np.reshape(expected, matrix.shape), rtol=1e-12)
+
+
+@given(lists(points), points)
+def test_distance_to_point_matches_scalar(ps: List[Point],
+                                          other: Point) -> None:
+    assert_allclose(PointArray.from_points(ps).distance_to_point(other),
+                    [p.distance_to_point(other) for p in ps], rtol=1e-12)
+
+
+@given(lists(points), lists(points, min_size=1))
+def test_nearest_matches_scalar(ps1: List[Point], ps2: List[Point]) -> None:
+    indices, distances = PointArray.from_points(ps1).nearest(
+        PointArray.from_points(ps2))
+    for p, index, distance in zip(ps1, indices.tolist(), distances.tolist()):
+        all_distances = [p.distance_to_point(other) for other in ps2]
+        assert distance == pytest.approx(min(all_distances), rel=1e-12)
+        assert distance == pytest.approx(all_distances[index], rel=1e-12)
+
+
+def test_nearest_in_empty_raises() -> None:
+    with pytest.raises(PointArrayError):
+        PointArray.from_points([Point(0.0, 0.0)]).nearest(
+            PointArray.from_points([]))
+
+
+def test_filter_by_confidence() -> None:
+    ps = PointEstimateArray.from_points([PointEstimate(0.0, 0.0, 0.1),
+                                         PointEstimate(1.0, 1.0, 0.5),
+                                         PointEstimate(2.0, 2.0, 0.9)])
+    assert (ps.filter_by_confidence(0.5).to_points() ==
+            [PointEstimate(1.0, 1.0, 0.5), PointEstimate(2.0, 2.0, 0.9)])
+
+
+def test_getitem() -> None:
+    ps = PointEstimateArray.from_points([PointEstimate(0.0, 1.0, 0.1),
+                                         PointEstimate(2.0, 3.0, 0.5)])
+    assert ps[1] == PointEstimate(2.0, 3.0, 0.5)
+    assert isinstance(ps[:1], PointEstimateArray)
+    assert list(ps) == [PointEstimate(0.0, 1.0, 0.1),
+                        PointEstimate(2.0, 3.0, 0.5)]
+
+
+def test_point_estimate_iter() -> None:
+    assert list(PointEstimate(1.0, 2.0, 0.5)) == [1.0, 2.0, 0.5]
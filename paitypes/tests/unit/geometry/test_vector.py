@@ -1,3 +1,5 @@
+import math
+
 from hypothesis import given
 from hypothesis.strategies import register_type_strategy
 from hypothesis.strategies import from_type
@@ -6,6 +8,7 @@ from hypothesis.extra import numpy as np
 from paitypes.geometry.Point import Point
 from paitypes.geometry.Vector import Vector
 from numpy.testing import assert_equal
+from pytest import approx
 import numpy
 
 register_type_strategy(float, floats(allow_nan=False,
@@ -101,3 +104,20 @@ def test_dot() -> None:
 
 def test_from_points() -> None:
     assert Vector.from_points(Point(1, 2), Point(-1, -2)) == Vector(-2, -4)
+
+
+def test_norm() -> None:
+    assert Vector(3, 4, 12).norm() == 13.0
+
+
+def test_angle() -> None:
+    assert Vector(1, 0, 0).angle(Vector(0, 2, 0)) == approx(math.pi / 2)
+    assert Vector(1, 1, 0).angle(Vector(2, 2, 0)) == 0.0
+    assert Vector(1, 0, 0).angle(Vector(-1, 0, 0)) == approx(math.pi)
+
+
+@given(from_type(Vector), from_type(Vector))
+def test_cross_matches_numpy(v1: Vector, v2: Vector) -> None:
+    assert (Vector.cross(v1, v2) ==
+            Vector.from_np_array(numpy.cross(v1.to_np_array(),
+                                             v2.to_np_array())))
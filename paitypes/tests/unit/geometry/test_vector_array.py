@@ -0,0 +1,61 @@
+from typing import List
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis._strategies import builds, floats, lists
+from numpy.testing import assert_allclose
+
+from paitypes.geometry.Point import Point
+from paitypes.geometry.PointArray import PointArray
+from paitypes.geometry.Vector import Vector
+from paitypes.geometry.VectorArray import VectorArray, VectorArrayError
+
+coordinates = floats(min_value=-1e4, max_value=1e4)
+vectors = builds(Vector, coordinates, coordinates, coordinates)
+
+
+@given(lists(vectors))
+def test_to_vectors_from_vectors(vs: List[Vector]) -> None:
+    assert VectorArray.from_vectors(vs).to_vectors() == vs
+
+
+def test_invalid_shape_raises() -> None:
+    with pytest.raises(VectorArrayError):
+        VectorArray(np.zeros((3, 2)))
+
+
+@given(lists(vectors, min_size=1), vectors)
+def test_operations_match_scalar(vs: List[Vector], other: Vector) -> None:
+    array = VectorArray.from_vectors(vs)
+    others = VectorArray.from_vectors([other] * len(vs))
+
+    assert (array + other).to_vectors() == [v + other for v in vs]
+    assert (array - others).to_vectors() == [v - other for v in vs]
+    assert (-array).to_vectors() == [-v for v in vs]
+    assert array.cross(other).to_vectors() == [v.cross(other) for v in vs]
+    assert array.cross(others).to_vectors() == [v.cross(other) for v in vs]
+    assert array.dot(others).tolist() == [v.dot(other) for v in vs]
+    assert array.norm().tolist() == [v.norm() for v in vs]
+    assert_allclose(array.angle(other), [v.angle(other) for v in vs],
+                    rtol=1e-12)
+
+
+@given(lists(builds(Point, coordinates, coordinates), min_size=1))
+def test_from_points_matches_scalar(ps: List[Point]) -> None:
+    starts, ends = ps, ps[::-1]
+    expected = [Vector.from_points(a, b) for a, b in zip(starts, ends)]
+
+    assert VectorArray.from_points(PointArray.from_points(starts),
+                                   PointArray.from_points(ends)
+                                   ).to_vectors() == expected
+    assert VectorArray.from_points(
+        np.array([(p.x, p.y) for p in starts]),
+        np.array([(p.x, p.y) for p in ends])).to_vectors() == expected
+
+
+def test_getitem() -> None:
+    array = VectorArray.from_vectors([Vector(1, 2, 3), Vector(4, 5, 6)])
+    assert array[1] == Vector(4, 5, 6)
+    assert array[:1].to_vectors() == [Vector(1, 2, 3)]
+    assert list(array) == [Vector(1, 2, 3), Vector(4, 5, 6)]
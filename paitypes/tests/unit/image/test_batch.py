@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from paitypes.estimation.InferenceRequest import (BatchedInferenceRequest,
+                                                  InferenceRequest)
+from paitypes.image.batch import ImageBatch, ImageBatchException, Letterbox
+
+
+def test_images_are_views() -> None:
+    batch = ImageBatch.zeros(3, 4, 6)
+    batch.write_slot(1)[...] = 7
+    images = batch.images
+    assert len(images) == 3
+    assert images[1][0, 0, 0] == 7
+    assert np.shares_memory(images[2], batch.data)
+
+
+def test_from_images_reuses_batch_buffer() -> None:
+    owner = np.zeros((5, 4, 6, 3), dtype=np.uint8)
+    batch = ImageBatch.from_images(list(owner[1:4]))
+    assert np.shares_memory(batch.data, owner)
+    assert batch.data.shape == (3, 4, 6, 3)
+    owner[2] = 9
+    assert (batch.data[1] == 9).all()
+
+    # Views that are not consecutive are copied
+    batch = ImageBatch.from_images([owner[3], owner[1]])
+    assert not np.shares_memory(batch.data, owner)
+    assert (batch.data[1] == owner[1]).all()
+
+
+def test_write_letterboxed() -> None:
+    batch = ImageBatch.zeros(1, 40, 40)
+    image = np.full((10, 20, 3), 200, dtype=np.uint8)
+    letterbox = batch.write_letterboxed(0, image, pad_value=114)
+
+    assert letterbox == Letterbox((10, 20), 2.0, 0, 10)
+    assert (batch.data[0, 10:30] == 200).all()
+    assert (batch.data[0, :10] == 114).all()
+    assert (batch.data[0, 30:] == 114).all()
+    assert letterbox.to_original([[40.0, 30.0]]).tolist() == [[20.0, 10.0]]
+
+
+def test_invalid_batches_raise() -> None:
+    with pytest.raises(ImageBatchException):
+        ImageBatch(np.zeros((2, 4, 6), dtype=np.uint8))
+    with pytest.raises(ImageBatchException):
+        ImageBatch(np.zeros((2, 4, 6, 3), dtype=np.float32))
+    with pytest.raises(ImageBatchException):
+        ImageBatch.from_images([np.zeros((4, 6, 3), dtype=np.uint8),
+                                np.zeros((6, 4, 3), dtype=np.uint8)])
+
+
+def test_from_images_rejects_non_bgr_images() -> None:
+    with pytest.raises(ImageBatchException):
+        ImageBatch.from_images([np.full((4, 6, 3), 300.7)])
+    with pytest.raises(ImageBatchException):
+        ImageBatch.from_images([np.zeros((4, 6), dtype=np.uint8)])
+
+
+def test_write_letterboxed_rejects_non_bgr_images() -> None:
+    batch = ImageBatch.zeros(1, 40, 40)
+    with pytest.raises(ImageBatchException):
+        batch.write_letterboxed(0, np.zeros((10, 20), dtype=np.uint8))
+    with pytest.raises(ImageBatchException):
+        batch.write_letterboxed(0, np.zeros((10, 20, 4), dtype=np.uint8))
+    with pytest.raises(ImageBatchException):
+        batch.write_letterboxed(0, np.zeros((10, 20, 3), dtype=np.float32))
+
+
+def test_batched_request_round_trip() -> None:
+    batch = ImageBatch.zeros(2, 4, 6)
+    request = BatchedInferenceRequest(batch, require_detections=False)
+    batched = BatchedInferenceRequest.from_request(request.to_request())
+    assert batched.batch.data is not batch.data
+    assert np.shares_memory(batched.batch.data, batch.data)
+    assert not batched.require_detections
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from paitypes.image.frame_buffer import FrameBufferException, FrameRingBuffer
+
+
+def frame(value: int) -> np.ndarray:
+    return np.full((4, 6, 3), value, dtype=np.uint8)
+
+
+def values(frames: list) -> list:
+    return [int(f[0, 0, 0]) for f in frames]
+
+
+def test_latest_is_chronological() -> None:
+    buffer = FrameRingBuffer(3, (4, 6, 3))
+    assert buffer.latest(2) == []
+    for i in range(5):
+        buffer.push(frame(i), timestamp=i / 10)
+
+    assert len(buffer) == 3
+    assert values(buffer.latest(3)) == [2, 3, 4]
+    assert values(buffer.latest(10)) == [2, 3, 4]
+    assert values(buffer.latest()) == [4]
+    assert buffer.timestamps(2).tolist() == [0.3, 0.4]
+
+
+def test_latest_are_views() -> None:
+    buffer = FrameRingBuffer(2, (4, 6, 3))
+    buffer.push(frame(1), 0.0)
+    view = buffer.latest()[0]
+    assert not view.flags.owndata
+    buffer.push(frame(2), 1.0)
+    buffer.push(frame(3), 2.0)
+    assert view[0, 0, 0] == 3
+
+
+def test_write_slot_in_place() -> None:
+    buffer = FrameRingBuffer(2, (4, 6, 3))
+    for i in range(3):
+        slot = buffer.write_slot()
+        slot[...] = i
+        buffer.commit(float(i))
+    assert values(buffer.latest(2)) == [1, 2]
+    assert buffer.timestamps(2).tolist() == [1.0, 2.0]
+
+
+def test_invalid_use_raises() -> None:
+    with pytest.raises(FrameBufferException):
+        FrameRingBuffer(0, (4, 6, 3))
+    buffer = FrameRingBuffer(2, (4, 6, 3))
+    with pytest.raises(FrameBufferException):
+        buffer.push(np.zeros((6, 4, 3), dtype=np.uint8), 0.0)
+    with pytest.raises(FrameBufferException):
+        buffer.latest(-1)
+
+
+def test_clear() -> None:
+    buffer = FrameRingBuffer(2, (4, 6, 3))
+    buffer.push(frame(1), 0.0)
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.latest(2) == []
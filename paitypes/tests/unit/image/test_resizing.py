@@ -3,14 +3,21 @@ import numpy as np
 
 from typing import List, Tuple
 
-from paitypes.geometry.bounding_box import BoundingBox
+from hypothesis import given
+from hypothesis._strategies import integers, lists
+
+from paitypes.geometry.bounding_box import (BoundingBox, BoundingBoxArray,
+                                            pad_to_min_size, pad_abs_amount,
+                                            pad_to_aspect_ratio,
+                                            snap_to_shape)
 from paitypes.geometry.Shape import Shape
 
 from paitypes.image import Image, BGRImage, GrayscaleImage
 from paitypes.image.resizing import (
     ImageResizingException,
     resize_image_to_size,
-    crop_image_to_bounding_box)
+    crop_image_to_bounding_box,
+    plan_crops)
 
 from paitypes.tests.fixtures.fixture_image import (
     random_grayscale_image,
@@ -29,6 +36,7 @@ from paitypes.tests.fixtures.fixture_image import (
     empty_images)
 from paitypes.tests.fixtures.fixture_bounding_box import (
     empty_bbox, full_bbox, partial_bbox, partial_float_bbox)
+from paitypes.tests.strategies import bounding_boxes
 
 
 class TestResizeImageToSize():
@@ -124,3 +132,45 @@ class TestResizeCropImageToBoundingBox():
         for image in all_valid_images:
             with pytest.raises(ImageResizingException):
                 crop_image_to_bounding_box(image, bbox)
+
+
+def scalar_crop(bbox: BoundingBox,
+                thumbnail_size: Tuple[int, int],
+                image_shape: Tuple[int, int]) -> List[int]:
+    padded_bbox = pad_to_min_size(bbox, thumbnail_size)
+    padded_bbox = pad_abs_amount(padded_bbox, (20.0, 20.0))
+    padded_bbox = pad_to_aspect_ratio(
+        padded_bbox, float(thumbnail_size[0]) / float(thumbnail_size[1]))
+    cropped_bbox = snap_to_shape(padded_bbox, image_shape)
+    return [int(cropped_bbox.x_min), int(cropped_bbox.x_max),
+            int(cropped_bbox.y_min), int(cropped_bbox.y_max)]
+
+
+class TestPlanCrops():
+    @given(lists(bounding_boxes(BoundingBox(0.0, 640.0, 0.0, 480.0))),
+           integers(min_value=1, max_value=800),
+           integers(min_value=1, max_value=800))
+    def test_plan_crops_matches_scalar(self,
+                                       bboxes: List[BoundingBox],
+                                       thumbnail_height: int,
+                                       thumbnail_width: int) -> None:
+        thumbnail_size = (thumbnail_height, thumbnail_width)
+        image_shape = (480, 640)
+        crops = plan_crops(BoundingBoxArray.from_bboxes(bboxes),
+                           thumbnail_size, image_shape)
+        assert crops.tolist() == [
+            [0, 640, 0, 480] if bbox.is_empty()
+            else scalar_crop(bbox, thumbnail_size, image_shape)
+            for bbox in bboxes]
+
+    def test_plan_crops_slices_valid_crops(self,
+                                           random_bgr_image: BGRImage,
+                                           partial_bbox: BoundingBox,
+                                           empty_bbox: BoundingBox) -> None:
+        crops = plan_crops(
+            BoundingBoxArray.from_bboxes([partial_bbox, empty_bbox]),
+            (32, 32), random_bgr_image.shape[:2])
+        for x_min, x_max, y_min, y_max in crops.tolist():
+            crop = random_bgr_image[y_min:y_max, x_min:x_max]
+            assert crop.shape[0] > 0 and crop.shape[1] > 0
+        assert crops[1].tolist() == [0, 100, 0, 100]